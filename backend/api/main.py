@@ -1,15 +1,26 @@
+import time
+
+_import_started = time.perf_counter()
+
 from fastapi import FastAPI
+from fastapi.responses import JSONResponse, PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.websockets import WebSocket, WebSocketDisconnect
 from contextlib import asynccontextmanager
-import uvicorn
+import asyncio
 import logging
 
 from core.config import settings
-from core.scheduler import scheduler, init_scheduler
+from core.correlation import init_correlation_engine
+from core.shared_cache import close_shared_cache
+from core.scheduler import init_scheduler, scheduler_role, start_scheduler, stop_scheduler
 from core.orchestrator import orchestrator
-from api.routes import dashboard, positions, trading, analytics, market_data
+from api.routes import dashboard, positions, trading, analytics, market_data, admin
 from core.database import init_db
+from core.broadcast import broadcaster
+from core.metrics import WEBSOCKET_CLIENTS, registry
+from core.startup import startup_timer
+from api.middleware import MetricsMiddleware, ProfileMiddleware
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -17,19 +28,26 @@ logger = logging.getLogger(__name__)
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    # Startup
+    # Startup; the title is set here so importing the app never reads config.yaml
+    app.title = settings.app_name
     logger.info(f"Starting {settings.app_name}...")
-    await init_db()
-    await orchestrator.initialize_all()
-    init_scheduler()
-    scheduler.start()
+    with startup_timer.phase("init_db"):
+        await init_db()
+    with startup_timer.phase("plugins"):
+        await orchestrator.initialize_all()
+    with startup_timer.phase("scheduler"):
+        init_correlation_engine()
+        init_scheduler()
+        await start_scheduler()
+    logger.info(f"Startup complete: {startup_timer.summary()}")
     yield
     # Shutdown
-    scheduler.shutdown()
     logger.info("Shutting down...")
+    await stop_scheduler()
+    close_shared_cache()
+    await orchestrator.shutdown_all()
 
 app = FastAPI(
-    title=settings.app_name,
     version="1.0.0",
     lifespan=lifespan
 )
@@ -43,12 +61,16 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+app.add_middleware(ProfileMiddleware, is_admin=admin.is_admin)
+app.add_middleware(MetricsMiddleware)
+
 # Include routers
 app.include_router(dashboard.router, prefix="/api/dashboard", tags=["dashboard"])
 app.include_router(positions.router, prefix="/api/positions", tags=["positions"])
 app.include_router(trading.router, prefix="/api/trading", tags=["trading"])
 app.include_router(analytics.router, prefix="/api/analytics", tags=["analytics"])
 app.include_router(market_data.router, prefix="/api/market", tags=["market"])
+app.include_router(admin.router, prefix="/api/admin", tags=["admin"])
 
 @app.get("/")
 async def root():
@@ -62,22 +84,64 @@ async def root():
 async def health_check():
     return {"status": "healthy", "environment": settings.app_env}
 
+@app.get("/ready")
+async def readiness_check():
+    """Ready once every required plugin has initialized; optional failures only degrade"""
+    report = orchestrator.readiness()
+    report["scheduler_role"] = scheduler_role()
+    report["startup"] = startup_timer.report()
+    return JSONResponse(report, status_code=200 if report["ready"] else 503)
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """Prometheus scrape endpoint"""
+    return PlainTextResponse(registry.render(), media_type="text/plain; version=0.0.4")
+
 # WebSocket endpoint for real-time data
 @app.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket):
     await websocket.accept()
+    WEBSOCKET_CLIENTS.inc()
+    updates = broadcaster.subscribe()
+    # Replies and pushed updates share the socket; never send both at once
+    send_lock = asyncio.Lock()
+
+    async def send(message):
+        async with send_lock:
+            await websocket.send_json(message)
+
+    async def push_updates():
+        # Server-initiated messages such as order updates
+        while True:
+            await send(await updates.get())
+
+    pusher = asyncio.create_task(push_updates())
     try:
         while True:
             data = await websocket.receive_text()
             # Handle incoming messages and send updates
-            await websocket.send_json({
+            await send({
                 "type": "market_update",
                 "data": {"message": f"Received: {data}"}
             })
     except WebSocketDisconnect:
         logger.info("WebSocket disconnected")
+    finally:
+        pusher.cancel()
+        try:
+            await pusher
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            logger.info(f"WebSocket push stopped: {e!r}")
+        broadcaster.unsubscribe(updates)
+        WEBSOCKET_CLIENTS.dec()
+
+startup_timer.record("import", time.perf_counter() - _import_started)
 
 if __name__ == "__main__":
+    import uvicorn
+
     uvicorn.run(
         "main:app",
         host="0.0.0.0",
@@ -0,0 +1,89 @@
+import asyncio
+import time
+
+from core.metrics import REQUEST_LATENCY
+from core.profiling import SamplingProfiler, profile_store, task_filter
+
+
+def route_template(scope, default: str = "unmatched") -> str:
+    """Full path template of the matched route, including the router prefix."""
+    # Routers included with a prefix keep only the relative path on the route;
+    # newer FastAPI records the effective (prefixed) route in its own scope key
+    effective = (scope.get("fastapi") or {}).get("effective_route_context")
+    path = getattr(effective, "path", None) or getattr(scope.get("route"), "path", None)
+    return path or default
+
+
+class MetricsMiddleware:
+    """Pure ASGI middleware recording request latency per route template and status.
+
+    The route template (``/api/market/quote/{symbol}``) is used instead of the
+    raw path so label cardinality stays bounded.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status = 500
+
+        async def send_wrapper(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            REQUEST_LATENCY.observe(time.perf_counter() - start, scope["method"], route_template(scope), str(status))
+
+
+class ProfileMiddleware:
+    """Profiles a single request when it carries ``X-Profile`` and a valid admin token.
+
+    The request runs in its own task and the sampler only keeps samples taken
+    while that task is executing, so concurrent requests do not pollute the
+    profile.  The response gets an ``X-Profile-Id`` header; the collapsed
+    stacks are fetched from ``/api/admin/profiles/{id}``.
+    """
+
+    def __init__(self, app, is_admin, interval: float = 0.001):
+        self.app = app
+        self.is_admin = is_admin
+        self.interval = interval
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        headers = dict(scope.get("headers") or [])
+        if b"x-profile" not in headers or not self.is_admin(headers.get(b"x-admin-token", b"").decode() or None):
+            await self.app(scope, receive, send)
+            return
+
+        profile_id = profile_store.new_id()
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers", [])) + [(b"x-profile-id", profile_id.encode())]
+            await send(message)
+
+        loop = asyncio.get_running_loop()
+        task = loop.create_task(self.app(scope, receive, send_wrapper))
+        profiler = SamplingProfiler(interval=self.interval, sample_filter=task_filter(loop, task)).start()
+        try:
+            await task
+        finally:
+            profiler.stop()
+            profile_store.put(profile_id, {
+                "route": route_template(scope, scope["path"]),
+                "samples": sum(profiler.stacks.values()),
+                "duration": profiler.duration,
+                "collapsed": profiler.collapsed(),
+            })
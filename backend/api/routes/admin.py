@@ -0,0 +1,83 @@
+import asyncio
+import hmac
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from fastapi.responses import PlainTextResponse
+
+from core.config import settings
+from core.market_cache import get_market_cache
+from core.profiling import profile_cpu, profile_lock, profile_store, trace_allocations
+from core.scheduler import job_status, scheduler_role
+from core.startup import measure_imports, startup_timer
+
+router = APIRouter()
+
+
+def is_admin(token: Optional[str]) -> bool:
+    """Admin endpoints are disabled unless ``admin_token`` is configured"""
+    return bool(settings.admin_token) and token is not None and hmac.compare_digest(token, settings.admin_token)
+
+
+async def require_admin(x_admin_token: Optional[str] = Header(default=None)):
+    if not is_admin(x_admin_token):
+        raise HTTPException(status_code=403, detail="Admin token required")
+
+
+@router.post("/profile/cpu", response_class=PlainTextResponse, dependencies=[Depends(require_admin)])
+async def run_cpu_profile(
+    seconds: float = Query(10.0, gt=0, le=120),
+    interval_ms: float = Query(5.0, ge=1, le=100),
+):
+    """Sample all threads for N seconds and return flamegraph collapsed stacks"""
+    if profile_lock.locked():
+        raise HTTPException(status_code=409, detail="A profiling session is already running")
+    async with profile_lock:
+        profiler = await profile_cpu(seconds, interval_ms / 1000)
+    return PlainTextResponse(
+        profiler.collapsed(),
+        headers={"X-Profile-Samples": str(profiler.samples), "X-Profile-Duration": f"{profiler.duration:.3f}"},
+    )
+
+
+@router.post("/profile/memory", dependencies=[Depends(require_admin)])
+async def run_memory_profile(
+    seconds: float = Query(10.0, gt=0, le=120),
+    top: int = Query(25, ge=1, le=200),
+):
+    """Trace allocations for N seconds and return the top allocation sites"""
+    if profile_lock.locked():
+        raise HTTPException(status_code=409, detail="A profiling session is already running")
+    async with profile_lock:
+        return await trace_allocations(seconds, top)
+
+
+@router.get("/profiles/{profile_id}", response_class=PlainTextResponse, dependencies=[Depends(require_admin)])
+async def get_request_profile(profile_id: str):
+    """Collapsed stacks recorded for a request sent with the X-Profile header"""
+    profile = profile_store.get(profile_id)
+    if profile is None:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    return PlainTextResponse(
+        profile["collapsed"],
+        headers={"X-Profile-Samples": str(profile["samples"]), "X-Profile-Route": profile["route"]},
+    )
+
+
+@router.get("/startup", dependencies=[Depends(require_admin)])
+async def get_startup_report(
+    imports: bool = Query(False, description="also time a fresh import of api.main"),
+    top: int = Query(25, ge=1, le=500),
+):
+    """Cold-start phase timings, optionally with per-module import times"""
+    report = startup_timer.report()
+    if imports:
+        measured = await asyncio.to_thread(measure_imports, "api.main")
+        report["imports"] = dict(measured, modules=measured["modules"][:top])
+    return report
+
+
+@router.get("/jobs", dependencies=[Depends(require_admin)])
+async def get_jobs():
+    """Scheduled jobs with their next run, last run duration and skipped runs"""
+    return {"role": scheduler_role(), "market_cache_entries": len(get_market_cache()), "jobs": job_status()}
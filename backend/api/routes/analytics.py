@@ -2,6 +2,9 @@ from fastapi import APIRouter
 from typing import Dict, Any, List
 from datetime import datetime, timedelta
 
+from core.config import settings
+from core.correlation import get_correlation_engine
+
 router = APIRouter()
 
 @router.get("/statistics")
@@ -29,18 +32,29 @@ async def get_statistics():
 @router.get("/risk-metrics")
 async def get_risk_metrics():
     """Get current risk metrics"""
+    portfolio_metrics = {
+        "total_delta": -0.68,
+        "total_theta": 45.50,
+        "total_vega": -125.30,
+        "total_gamma": -0.015
+    }
+    engine = get_correlation_engine()
+    exposure = engine.beta_weighted_delta({settings.symbol: portfolio_metrics["total_delta"]})
     return {
-        "portfolio_metrics": {
-            "total_delta": -0.68,
-            "total_theta": 45.50,
-            "total_vega": -125.30,
-            "total_gamma": -0.015
-        },
+        "portfolio_metrics": portfolio_metrics,
         "var_95": 2500.00,
         "expected_shortfall": 3200.00,
-        "correlation_spy": 0.85
+        "correlation_benchmark": engine.pair(settings.symbol, engine.benchmark),
+        "beta": engine.beta(settings.symbol),
+        "beta_weighted_delta": exposure["beta_weighted_delta"],
+        "benchmark": engine.benchmark,
     }
 
+@router.get("/correlation")
+async def get_correlation():
+    """Rolling betas to the benchmark and the correlation matrix of the tracked universe"""
+    return get_correlation_engine().snapshot()
+
 @router.get("/backtest/{strategy_id}")
 async def get_backtest_results(strategy_id: str):
     """Get backtest results for a strategy"""
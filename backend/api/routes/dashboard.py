@@ -1,10 +1,13 @@
-from fastapi import APIRouter, Depends, HTTPException
-from typing import Dict, Any
-from datetime import datetime, timedelta
-import random
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from typing import Dict, Any, Optional
+from datetime import datetime
+import asyncio
 from sqlalchemy.orm import Session
 from pydantic import BaseModel
 
+from core.config import settings, tracked_symbols
+from core.equity import get_equity_curve
+from core.signals import refresh_signals, signal_snapshots
 from models.database import get_db, PerformanceMetric
 
 router = APIRouter()
@@ -42,40 +45,39 @@ async def get_metrics(db: Session = Depends(get_db)) -> MetricResponse:
     )
 
 @router.get("/signals")
-async def get_market_signals() -> Dict[str, Any]:
-    """Get current market signals"""
-    # TODO: Implement real signal calculation
-    return {
-        "market_bias": "BULLISH",
-        "confidence": 0.75,
-        "signals": {
-            "rsi": {"value": 72.3, "signal": "OVERBOUGHT"},
-            "ema_cross": {"value": 1, "signal": "BULLISH"},
-            "macd": {"value": 0.5, "signal": "BULLISH"},
-            "iv_percentile": {"value": 45.2, "signal": "NORMAL"}
-        },
-        "recommendation": {
-            "action": "PUT_CREDIT_SPREAD",
-            "reason": "Bullish signals with normal volatility"
-        }
-    }
+async def get_market_signals(request: Request, symbol: Optional[str] = None) -> Response:
+    """Serve the latest precomputed composite signal snapshot.
+
+    Supports ``If-None-Match`` so unchanged polls return 304 with no body.
+    Only tracked symbols are served: the refresh job keeps just those current.
+    """
+    symbol = symbol or settings.symbol
+    if symbol not in tracked_symbols():
+        raise HTTPException(status_code=404, detail=f"{symbol} is not a tracked signal symbol")
+    snapshot = signal_snapshots.get(symbol)
+    if snapshot is None:
+        # Cold start before the scheduler has produced a snapshot
+        snapshot = await refresh_signals(symbol)
+    if snapshot is None:
+        raise HTTPException(status_code=503, detail="Signals not available yet")
+
+    headers = {"ETag": snapshot.etag, "Cache-Control": "no-cache"}
+    if request.headers.get("if-none-match") == snapshot.etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=snapshot.body, media_type="application/json", headers=headers)
 
 @router.get("/performance")
-async def get_performance_history(days: int = 30) -> Dict[str, Any]:
-    """Get performance history"""
-    # TODO: Implement real performance data
-    end_date = datetime.utcnow()
-    start_date = end_date - timedelta(days=days)
-    
-    return {
-        "start_date": start_date.isoformat(),
-        "end_date": end_date.isoformat(),
-        "data": [
-            {
-                "date": (start_date + timedelta(days=i)).isoformat(),
-                "pnl": random.uniform(-500, 1000),
-                "cumulative_pnl": random.uniform(0, 15000)
-            }
-            for i in range(days)
-        ]
-    }
+async def get_performance_history(
+    days: int = Query(30, ge=1),
+    max_points: Optional[int] = Query(None, ge=4),
+    method: str = "lttb",
+) -> Dict[str, Any]:
+    """Cumulative P&L over the last ``days``, downsampled to at most ``max_points`` points.
+
+    ``method`` is ``lttb`` (smooth, shape-preserving) or ``minmax`` (keeps every extreme).
+    """
+    max_points = min(max_points or settings.equity_max_points, settings.equity_max_points_limit)
+    try:
+        return await asyncio.to_thread(get_equity_curve().view, days, max_points, method)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
@@ -1,33 +1,159 @@
-from fastapi import APIRouter, HTTPException
-from datetime import datetime
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+from datetime import datetime, timezone
+import asyncio
+import time
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from core.bars import get_bar_aggregator
+from core.chain_archive import get_chain_archive
+from core.market_cache import get_market_cache
 from core.orchestrator import orchestrator
 from core.config import settings
+from core.retention import query_snapshots
+from core.shared_cache import get_shared_cache
+from models.database import get_db
+from plugins.data.base import OptionChain
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 router = APIRouter()
 
+
+def frame_to_records(df: "pd.DataFrame") -> List[Dict[str, Any]]:
+    """Convert a DataFrame to JSON-safe records.
+
+    Each column is converted with a single ``tolist`` call, which is faster
+    than ``to_dict(orient="records")`` on large chains.  NaN is mapped to None
+    because JSON responses reject non-finite floats.
+    """
+    columns = []
+    for name in df.columns:
+        values = df[name].tolist()
+        if df[name].dtype.kind == "f" and df[name].isna().any():
+            values = [None if v != v else v for v in values]
+        columns.append(values)
+    keys = [str(c) for c in df.columns]
+    return [dict(zip(keys, row)) for row in zip(*columns)]
+
+
+def serialize_chain(chain: OptionChain, expiration: str) -> Dict[str, Any]:
+    """Shape an option chain for the API response."""
+    return {
+        "symbol": chain.symbol,
+        "underlying_price": chain.underlying_price,
+        "expiration": expiration,
+        "puts": frame_to_records(chain.puts),
+        "calls": frame_to_records(chain.calls),
+    }
+
+
 @router.get("/option-chain/{symbol}")
 async def get_option_chain(symbol: str, expiration: str):
     """Get option chain for a symbol"""
+    exp_dt = datetime.fromisoformat(expiration)
+    cache = get_shared_cache()
+    if cache is not None:
+        shared = cache.chain(symbol)
+        if (
+            shared is not None
+            and shared.expiration.date() == exp_dt.date()
+            and time.time() - shared.timestamp.timestamp() <= settings.shared_chain_max_age
+        ):
+            body = {
+                "symbol": symbol,
+                "underlying_price": shared.underlying_price,
+                "expiration": expiration,
+                "puts": shared.records("puts"),
+                "calls": shared.records("calls"),
+            }
+            # Republished twice while we were reading: fall through to the plugin
+            if shared.is_current():
+                return body
+
     data_plugin = orchestrator.get_plugin("data")
     if not data_plugin:
         raise HTTPException(status_code=500, detail="Data plugin not loaded")
-    exp_dt = datetime.fromisoformat(expiration)
-    chain = await data_plugin.get_option_chain(symbol, exp_dt)
+    chain = await get_market_cache().option_chain(data_plugin, symbol, exp_dt)
+    return serialize_chain(chain, expiration)
+
+@router.get("/chain-history/{symbol}")
+async def get_chain_history(
+    symbol: str,
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    strike_range: Optional[float] = None,
+    expiration: Optional[str] = None,
+    right: Optional[str] = None,
+    columns: Optional[str] = None,
+    limit: int = Query(100_000, ge=1),
+):
+    """Archived chains for a symbol, e.g. strikes within +/-``strike_range`` of spot between two dates"""
+    archive = get_chain_archive()
+    if archive is None:
+        raise HTTPException(status_code=404, detail="Chain archive is not enabled")
+    try:
+        df = await asyncio.to_thread(
+            archive.query,
+            symbol,
+            start=start,
+            end=end,
+            strike_range=strike_range,
+            expirations=expiration.split(",") if expiration else None,
+            columns=columns.split(",") if columns else None,
+            right=right,
+            # One extra row tells whether the result was cut off
+            limit=limit + 1,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    truncated = len(df) > limit
+    df = df.head(limit)
     return {
-        "symbol": chain.symbol,
-        "underlying_price": chain.underlying_price,
-        "expiration": expiration,
-        "puts": chain.puts.to_dict(orient="records"),
-        "calls": chain.calls.to_dict(orient="records"),
+        "symbol": symbol,
+        "rows": len(df),
+        "truncated": truncated,
+        "data": frame_to_records(df),
     }
 
+@router.get("/snapshots/{symbol}")
+async def get_snapshots(
+    symbol: str,
+    start: datetime,
+    end: Optional[datetime] = None,
+    resolution: Optional[str] = None,
+    max_points: Optional[int] = None,
+    db: Session = Depends(get_db),
+):
+    """Market snapshot history, served from the coarsest table the range needs unless ``resolution`` is given"""
+    try:
+        resolution, points = query_snapshots(db, symbol, start, end, resolution, max_points)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"symbol": symbol, "resolution": resolution, "points": points}
+
 @router.get("/quote/{symbol}")
 async def get_quote(symbol: str):
     """Get real-time quote for a symbol"""
+    cache = get_shared_cache()
+    if cache is not None:
+        quote = cache.quote(symbol)
+        if quote is not None and time.time() - quote["timestamp"] <= settings.shared_quote_max_age:
+            return {
+                "symbol": symbol,
+                "price": quote["price"],
+                "volume": int(quote["volume"]),
+                "atr": quote["atr"],
+                "vix": quote["vix"],
+                "timestamp": datetime.fromtimestamp(quote["timestamp"], tz=timezone.utc).replace(tzinfo=None).isoformat(),
+            }
     data_plugin = orchestrator.get_plugin("data")
     if not data_plugin:
         raise HTTPException(status_code=500, detail="Data plugin not loaded")
-    md = await data_plugin.get_market_data(symbol)
+    md = await get_market_cache().market_data(data_plugin, symbol)
+    # Replaying a cached quote leaves the bars unchanged
+    get_bar_aggregator().on_market_data(md)
     return {
         "symbol": md.symbol,
         "price": md.price,
@@ -43,7 +169,7 @@ async def get_volatility_data(symbol: str):
     data_plugin = orchestrator.get_plugin("data")
     if not data_plugin:
         raise HTTPException(status_code=500, detail="Data plugin not loaded")
-    md = await data_plugin.get_market_data(symbol)
+    md = await get_market_cache().market_data(data_plugin, symbol)
     return {
         "symbol": md.symbol,
         "vix": md.vix,
@@ -1,7 +1,15 @@
-from fastapi import APIRouter, HTTPException, BackgroundTasks
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from typing import Optional, List
 from datetime import datetime
+import asyncio
+import json
+
+from core.config import settings
+from core.orchestrator import orchestrator
+from core.orders import order_manager
+from core.scanner import OpportunityScanner
 
 router = APIRouter()
 
@@ -23,10 +31,8 @@ class OrderResponse(BaseModel):
     commission: Optional[float] = None
 
 @router.post("/execute", response_model=OrderResponse)
-async def execute_trade(order: SpreadOrder, background_tasks: BackgroundTasks):
-    """Execute a new credit spread order"""
-    # TODO: Implement real order execution
-    
+async def execute_trade(order: SpreadOrder):
+    """Queue a new credit spread order for submission to the broker"""
     # Validate order
     if order.quantity <= 0:
         raise HTTPException(status_code=400, detail="Quantity must be positive")
@@ -34,43 +40,65 @@ async def execute_trade(order: SpreadOrder, background_tasks: BackgroundTasks):
     if order.short_strike <= order.long_strike and order.spread_type == "PUT":
         raise HTTPException(status_code=400, detail="Short strike must be higher than long strike for PUT spreads")
     
-    # Simulate order execution
-    order_id = f"ORD_{datetime.utcnow().timestamp()}"
-    
-    # Add background task for order monitoring
-    background_tasks.add_task(monitor_order, order_id)
-    
+    queued = await order_manager.place(order.dict())
     return OrderResponse(
-        order_id=order_id,
-        status="FILLED",
-        message="Order executed successfully",
-        execution_price=2.35,
-        commission=2.60
+        order_id=queued["order_id"],
+        status=queued["status"],
+        message="Order queued for submission",
     )
 
-async def monitor_order(order_id: str):
-    """Background task to monitor order status"""
-    # TODO: Implement order monitoring
-    pass
+@router.get("/orders")
+async def list_orders(status: Optional[str] = None, limit: int = 100):
+    """List recent orders, optionally filtered by status"""
+    return {"orders": await asyncio.to_thread(order_manager.list, status, limit)}
+
+@router.get("/orders/{order_id}")
+async def get_order(order_id: str):
+    """Current state of one order"""
+    order = await asyncio.to_thread(order_manager.get, order_id)
+    if order is None:
+        raise HTTPException(status_code=404, detail="Order not found")
+    return order
+
+@router.post("/orders/{order_id}/cancel")
+async def cancel_order(order_id: str):
+    """Cancel a queued order, or request cancellation of a working one"""
+    order = await order_manager.cancel(order_id)
+    if order is None:
+        raise HTTPException(status_code=404, detail="Order not found")
+    return order
 
 @router.get("/opportunities")
-async def get_trade_opportunities():
-    """Get current trade opportunities based on signals"""
-    # TODO: Implement trade opportunity scanning
+async def get_trade_opportunities(
+    symbols: Optional[str] = None,
+    top_k: Optional[int] = Query(None, ge=1),
+    stream: bool = False,
+):
+    """Scan the configured universe for the top-k credit spread opportunities.
+
+    With ``stream=true`` the response is newline-delimited JSON with one
+    progress event per scanned symbol followed by a final ``complete`` event.
+    """
+    required = ("data", "signals")
+    if any(orchestrator.get_plugin(name) is None for name in required):
+        raise HTTPException(status_code=500, detail="Scanner plugins not loaded")
+    scanner = OpportunityScanner(orchestrator.plugins, settings.model_dump())
+    universe = [s.strip().upper() for s in symbols.split(",") if s.strip()] if symbols else None
+    events = scanner.scan(universe, top_k)
+
+    if stream:
+        async def ndjson():
+            async for event in events:
+                yield json.dumps(event) + "\n"
+        return StreamingResponse(ndjson(), media_type="application/x-ndjson")
+
+    result = {}
+    async for event in events:
+        result = event
     return {
-        "opportunities": [
-            {
-                "type": "PUT",
-                "short_strike": 4200,
-                "long_strike": 4150,
-                "expiration": "2025-01-29",
-                "credit": 2.35,
-                "probability_profit": 0.82,
-                "expected_value": 285.00,
-                "delta": 0.10,
-                "score": 8.5
-            }
-        ]
+        "opportunities": result.get("opportunities", []),
+        "scanned": result.get("completed", 0),
+        "errors": result.get("errors", []),
     }
 
 @router.post("/validate")
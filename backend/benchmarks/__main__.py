@@ -0,0 +1,51 @@
+"""Run the hot-path microbenchmarks.
+
+Examples (from the backend directory)::
+
+    python -m benchmarks --save benchmarks/baselines/local.json
+    python -m benchmarks --compare benchmarks/baselines/local.json --tolerance 0.25
+    python -m benchmarks --only compute_rsi compute_atr --max-size 100000
+    python -m benchmarks --only cold_import --imports   # per-module import times
+"""
+import argparse
+import sys
+
+from benchmarks.suite import BENCHMARKS, compare, load_report, run_benchmarks, save_report
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Hot-path microbenchmarks")
+    parser.add_argument("--save", help="write results to this JSON baseline")
+    parser.add_argument("--compare", help="fail if slower than this JSON baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown ratio (default 0.25)")
+    parser.add_argument("--only", nargs="*", choices=[b.name for b in BENCHMARKS], help="benchmarks to run")
+    parser.add_argument("--max-size", type=int, help="skip input sizes above this")
+    parser.add_argument("--repeat", type=int, default=5, help="timed repetitions per benchmark")
+    parser.add_argument("--imports", action="store_true", help="print the slowest modules imported by api.main")
+    args = parser.parse_args(argv)
+
+    if args.imports:
+        from core.startup import format_import_report, measure_imports
+
+        format_import_report(measure_imports("api.main"))
+
+    report = run_benchmarks(args.only, args.max_size, args.repeat)
+    if args.save:
+        save_report(report, args.save)
+        print(f"Saved baseline to {args.save}")
+
+    if args.compare:
+        regressions = compare(report, load_report(args.compare), args.tolerance)
+        for r in regressions:
+            print(
+                f"REGRESSION {r['benchmark']}: {1000 * r['baseline_s']:.3f} ms -> "
+                f"{1000 * r['current_s']:.3f} ms (x{r['ratio']})"
+            )
+        if regressions:
+            return 1
+        print(f"No regressions beyond {args.tolerance:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,244 @@
+import asyncio
+import json
+import platform
+import statistics
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+BAR_SIZES = (1_000, 100_000, 1_000_000)
+CHAIN_SIZES = (1_000, 5_000)
+ARCHIVE_DAYS = (21, 252)
+UNIVERSE_SIZES = (50, 500)
+SEED = 1234
+
+
+@dataclass
+class Benchmark:
+    """A hot path timed at several input sizes.
+
+    ``setup(size)`` builds seeded input data outside the timed region and
+    returns the zero-argument callable that is actually measured.
+    """
+    name: str
+    setup: Callable[[int], Callable[[], Any]]
+    sizes: Iterable[int]
+
+
+def _bars(size: int) -> pd.DataFrame:
+    from plugins.data.synthetic import DataPlugin
+
+    return DataPlugin({"synthetic_seed": SEED}).get_intraday_bars("SPX", 60, count=size)
+
+
+def _chain(size: int):
+    from plugins.data.synthetic import DataPlugin
+
+    plugin = DataPlugin({"synthetic_seed": SEED, "synthetic_strikes": size})
+    return asyncio.run(plugin.get_option_chain("SPX", datetime.utcnow() + timedelta(days=30)))
+
+
+def _setup_rsi(size):
+    from plugins.analysis.technical import compute_rsi
+    close = _bars(size)["close"]
+    return lambda: compute_rsi(close, 14)
+
+
+def _setup_ema(size):
+    from plugins.analysis.technical import compute_ema
+    close = _bars(size)["close"]
+    return lambda: compute_ema(close, 21)
+
+
+def _setup_macd(size):
+    from plugins.analysis.technical import compute_macd
+    close = _bars(size)["close"]
+    return lambda: compute_macd(close)
+
+
+def _setup_atr(size):
+    from plugins.analysis.technical import compute_atr
+    bars = _bars(size)
+    return lambda: compute_atr(bars, 14)
+
+
+def _setup_regime(size):
+    from plugins.analysis.technical import compute_atr, determine_volatility_regime
+    atr = compute_atr(_bars(size), 14)
+    return lambda: determine_volatility_regime(atr, 0.75)
+
+
+def _setup_serialize(size):
+    from api.routes.market_data import serialize_chain
+    chain = _chain(size)
+    return lambda: serialize_chain(chain, "2025-01-01")
+
+
+def _setup_spreads(size):
+    from plugins.trading.spread_selector import select_spreads
+    chain = _chain(size)
+    config = {"max_spread_width": 50, "credit_threshold": 0.5, "delta_target": 0.10}
+    return lambda: select_spreads(chain.puts, chain.calls, chain.underlying_price, None, config)
+
+
+def _setup_greeks(size):
+    from plugins.analysis.greeks import bs_greeks
+    chain = _chain(size)
+    strikes = chain.puts["strike"].to_numpy()
+    iv = chain.puts["impliedVolatility"].to_numpy()
+    return lambda: bs_greeks(chain.underlying_price, strikes, 30 / 365, iv, 0.04, False)
+
+
+def _setup_iv(size):
+    from plugins.analysis.greeks import implied_volatility
+    chain = _chain(size)
+    mid = ((chain.puts["bid"] + chain.puts["ask"]) / 2).to_numpy()
+    strikes = chain.puts["strike"].to_numpy()
+    return lambda: implied_volatility(mid, chain.underlying_price, strikes, 30 / 365, 0.04, False)
+
+
+def _setup_chain_archive(size):
+    import dataclasses
+    import tempfile
+
+    from core.chain_archive import ChainArchive
+    # Removed once the timed callable (which holds a reference) is released
+    tmp = tempfile.TemporaryDirectory(prefix="chain-archive-")
+    archive = ChainArchive(tmp.name)
+    chain = _chain(2_000)
+    start = datetime(2020, 1, 1, 21)
+    for day in range(size):
+        ts = start + timedelta(days=day)
+        archive.write(dataclasses.replace(chain, timestamp=ts), ts + timedelta(days=30))
+    end = start + timedelta(days=size)
+    columns = ["date", "expiration", "right", "strike", "bid", "ask", "impliedVolatility"]
+
+    def run():
+        tmp.name  # keep the directory alive
+        return archive.query("SPX", start, end, strike_range=0.05, columns=columns)
+    return run
+
+
+def _setup_correlation(size):
+    from core.correlation import RollingCorrelation
+    rng = np.random.default_rng(SEED)
+    engine = RollingCorrelation([f"S{i}" for i in range(size - 1)], window=390)
+    closes = 100 * np.exp(np.cumsum(rng.normal(0, 0.001, (400, size)), axis=0))
+    engine.load(closes)
+    bar = closes[-1] * 1.001
+    return lambda: engine.update(bar)
+
+
+def _setup_cold_import(size):
+    import subprocess
+    import sys
+
+    from core.startup import BACKEND_DIR
+    command = [sys.executable, "-c", "import api.main"]
+    return lambda: subprocess.run(command, cwd=BACKEND_DIR, check=True, capture_output=True)
+
+
+BENCHMARKS: List[Benchmark] = [
+    Benchmark("compute_rsi", _setup_rsi, BAR_SIZES),
+    Benchmark("compute_ema", _setup_ema, BAR_SIZES),
+    Benchmark("compute_macd", _setup_macd, BAR_SIZES),
+    Benchmark("compute_atr", _setup_atr, BAR_SIZES),
+    Benchmark("determine_volatility_regime", _setup_regime, BAR_SIZES),
+    Benchmark("serialize_chain", _setup_serialize, CHAIN_SIZES),
+    Benchmark("select_spreads", _setup_spreads, CHAIN_SIZES),
+    Benchmark("bs_greeks", _setup_greeks, CHAIN_SIZES),
+    Benchmark("implied_volatility", _setup_iv, CHAIN_SIZES),
+    Benchmark("chain_archive_query", _setup_chain_archive, ARCHIVE_DAYS),
+    Benchmark("rolling_correlation_update", _setup_correlation, UNIVERSE_SIZES),
+    # Fresh interpreter importing the app; the size is unused
+    Benchmark("cold_import", _setup_cold_import, (1,)),
+]
+
+
+def time_callable(fn: Callable[[], Any], repeat: int = 5, min_time: float = 0.05) -> Dict[str, float]:
+    """Median and best time per call, looping fast functions to reach ``min_time``."""
+    fn()  # warm-up
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            fn()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time or loops >= 1_000_000:
+            break
+        loops *= 10
+
+    samples = [elapsed / loops]
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(loops):
+            fn()
+        samples.append((time.perf_counter() - start) / loops)
+    return {
+        "median_s": statistics.median(samples),
+        "min_s": min(samples),
+        "loops": loops,
+        "repeat": repeat,
+    }
+
+
+def run_benchmarks(
+    names: Optional[Iterable[str]] = None,
+    max_size: Optional[int] = None,
+    repeat: int = 5,
+    log: Callable[[str], None] = print,
+) -> Dict[str, Any]:
+    """Run the selected benchmarks and return a JSON-serializable report."""
+    selected = set(names) if names else None
+    results: Dict[str, Dict[str, float]] = {}
+    for bench in BENCHMARKS:
+        if selected and bench.name not in selected:
+            continue
+        for size in bench.sizes:
+            if max_size and size > max_size:
+                continue
+            key = f"{bench.name}[{size}]"
+            results[key] = time_callable(bench.setup(size), repeat=repeat)
+            log(f"{key:<40} {1000 * results[key]['median_s']:>10.3f} ms")
+    return {
+        "meta": {
+            "created_at": datetime.utcnow().isoformat(),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "pandas": pd.__version__,
+            "machine": platform.machine(),
+        },
+        "results": results,
+    }
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], tolerance: float = 0.25) -> List[Dict[str, Any]]:
+    """Return every benchmark whose median slowed down by more than ``tolerance``."""
+    regressions = []
+    for key, base in baseline.get("results", {}).items():
+        now = current.get("results", {}).get(key)
+        if now is None or base["median_s"] <= 0:
+            continue
+        ratio = now["median_s"] / base["median_s"]
+        if ratio > 1 + tolerance:
+            regressions.append({
+                "benchmark": key,
+                "baseline_s": base["median_s"],
+                "current_s": now["median_s"],
+                "ratio": round(ratio, 3),
+            })
+    return regressions
+
+
+def load_report(path: str) -> Dict[str, Any]:
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def save_report(report: Dict[str, Any], path: str) -> None:
+    with open(path, "w") as f:
+        json.dump(report, f, indent=2, sort_keys=True)
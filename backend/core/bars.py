@@ -0,0 +1,193 @@
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from core.config import settings
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+BAR_FIELDS = ("timestamp", "open", "high", "low", "close", "volume")
+_FIELD_INDEX = {name: i for i, name in enumerate(BAR_FIELDS)}
+
+# Bar interval name -> length in seconds
+INTERVALS: Dict[str, int] = {"1s": 1, "1m": 60, "5m": 300}
+
+
+class BarRingBuffer:
+    """Fixed-size OHLCV store holding the last ``capacity`` bars.
+
+    Every bar is written twice, at ``i`` and ``i + capacity``, so the most
+    recent ``n`` bars always form one contiguous slice.  Windows are returned
+    as NumPy views into the buffer: no copy and no allocation per read, and
+    memory stays constant no matter how many bars are appended.
+    """
+
+    def __init__(self, capacity: int):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self._data = np.zeros((len(BAR_FIELDS), 2 * capacity), dtype=np.float64)
+        self._head = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def nbytes(self) -> int:
+        return self._data.nbytes
+
+    def append(self, timestamp: float, open_: float, high: float, low: float, close: float, volume: float) -> None:
+        row = (timestamp, open_, high, low, close, volume)
+        self._data[:, self._head] = row
+        self._data[:, self._head + self.capacity] = row
+        self._head = (self._head + 1) % self.capacity
+        if self._count < self.capacity:
+            self._count += 1
+
+    def _bounds(self, n: Optional[int]) -> Tuple[int, int]:
+        n = self._count if n is None else min(n, self._count)
+        end = self._head + self.capacity
+        return end - n, end
+
+    def window(self, n: Optional[int] = None) -> np.ndarray:
+        """View of shape (fields, n) over the last ``n`` bars, oldest first."""
+        start, end = self._bounds(n)
+        return self._data[:, start:end]
+
+    def field(self, name: str, n: Optional[int] = None) -> np.ndarray:
+        """Contiguous 1-D view of one field over the last ``n`` bars."""
+        start, end = self._bounds(n)
+        return self._data[_FIELD_INDEX[name], start:end]
+
+    def last(self) -> Optional[Dict[str, float]]:
+        if not self._count:
+            return None
+        idx = self._head + self.capacity - 1
+        return {name: float(self._data[i, idx]) for i, name in enumerate(BAR_FIELDS)}
+
+
+@dataclass
+class _OpenBar:
+    bucket: int
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: float
+
+
+def epoch_seconds(ts: datetime) -> float:
+    """POSIX timestamp of ``ts``, reading naive datetimes as UTC."""
+    if ts.tzinfo is None:
+        ts = ts.replace(tzinfo=timezone.utc)
+    return ts.timestamp()
+
+
+class BarAggregator:
+    """Builds OHLCV bars for several intervals from a stream of quotes."""
+
+    def __init__(self, intervals: Iterable[str] = ("1s", "1m", "5m"), capacity: int = 2048, max_symbols: int = 64):
+        unknown = set(intervals) - set(INTERVALS)
+        if unknown:
+            raise ValueError(f"Unsupported bar intervals: {', '.join(sorted(unknown))}")
+        self.intervals = tuple(intervals)
+        self.capacity = capacity
+        # Every symbol costs len(intervals) ring buffers, so the set is bounded
+        self.max_symbols = max_symbols
+        self._buffers: Dict[Tuple[str, str], BarRingBuffer] = {}
+        self._open: Dict[Tuple[str, str], _OpenBar] = {}
+        self._last_volume: Dict[str, float] = {}
+        # Called as fn(symbol, interval, bar) whenever a bar completes
+        self._listeners: List[Callable[[str, str, _OpenBar], None]] = []
+
+    def add_listener(self, fn: Callable[[str, str, _OpenBar], None]) -> None:
+        self._listeners.append(fn)
+
+    def remove_listener(self, fn: Callable[[str, str, _OpenBar], None]) -> None:
+        if fn in self._listeners:
+            self._listeners.remove(fn)
+
+    def symbols(self) -> list:
+        return sorted({symbol for symbol, _ in self._buffers})
+
+    def buffer(self, symbol: str, interval: str) -> Optional[BarRingBuffer]:
+        return self._buffers.get((symbol, interval))
+
+    def _writable_buffer(self, symbol: str, interval: str) -> BarRingBuffer:
+        key = (symbol, interval)
+        buf = self._buffers.get(key)
+        if buf is None:
+            buf = self._buffers[key] = BarRingBuffer(self.capacity)
+        return buf
+
+    def on_quote(self, symbol: str, price: float, cumulative_volume: float, timestamp: datetime) -> None:
+        """Fold one quote into the open bar of every interval."""
+        if price <= 0:
+            return
+        if symbol not in self._last_volume and len(self._last_volume) >= self.max_symbols:
+            return
+        ts = epoch_seconds(timestamp)
+
+        # Quotes carry session volume; bars need the traded amount since the last quote
+        prev = self._last_volume.get(symbol)
+        traded = cumulative_volume - prev if prev is not None and cumulative_volume >= prev else 0.0
+        self._last_volume[symbol] = cumulative_volume
+
+        for interval in self.intervals:
+            seconds = INTERVALS[interval]
+            bucket = int(ts // seconds) * seconds
+            key = (symbol, interval)
+            bar = self._open.get(key)
+            if bar is None or bucket > bar.bucket:
+                if bar is not None:
+                    self._writable_buffer(symbol, interval).append(
+                        bar.bucket, bar.open, bar.high, bar.low, bar.close, bar.volume
+                    )
+                    for listener in self._listeners:
+                        listener(symbol, interval, bar)
+                self._open[key] = _OpenBar(bucket, price, price, price, price, traded)
+            elif bucket == bar.bucket:
+                if price > bar.high:
+                    bar.high = price
+                if price < bar.low:
+                    bar.low = price
+                bar.close = price
+                bar.volume += traded
+            # Quotes older than the open bar are late arrivals and are dropped
+
+    def on_market_data(self, md) -> None:
+        """Convenience wrapper for ``MarketData`` objects from data plugins."""
+        self.on_quote(md.symbol, md.price, md.volume, md.timestamp)
+
+    def window(self, symbol: str, interval: str, n: Optional[int] = None) -> np.ndarray:
+        """Zero-copy (fields, n) view over the last ``n`` completed bars."""
+        buf = self.buffer(symbol, interval)
+        if buf is None:
+            return np.empty((len(BAR_FIELDS), 0))
+        return buf.window(n)
+
+    def as_frame(self, symbol: str, interval: str, n: Optional[int] = None) -> "pd.DataFrame":
+        """Completed bars as a DataFrame indexed by bar start time."""
+        import pandas as pd
+
+        buf = self.buffer(symbol, interval)
+        if buf is None:
+            return pd.DataFrame(columns=list(BAR_FIELDS[1:]))
+        columns = {name: buf.field(name, n) for name in BAR_FIELDS[1:]}
+        index = pd.to_datetime(buf.field("timestamp", n), unit="s", utc=True)
+        return pd.DataFrame(columns, index=index)
+
+
+_bar_aggregator: Optional[BarAggregator] = None
+
+
+def get_bar_aggregator() -> BarAggregator:
+    """The process-wide bar aggregator, created on first use."""
+    global _bar_aggregator
+    if _bar_aggregator is None:
+        _bar_aggregator = BarAggregator(settings.bar_intervals, settings.bar_capacity, settings.bar_max_symbols)
+    return _bar_aggregator
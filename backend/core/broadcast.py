@@ -0,0 +1,39 @@
+import asyncio
+import logging
+from typing import Any, Dict, Set
+
+logger = logging.getLogger(__name__)
+
+
+class Broadcaster:
+    """Fans messages out to WebSocket clients through per-client bounded queues.
+
+    Publishing never blocks: a client that falls ``max_queue`` messages behind
+    loses its oldest pending message instead of slowing everyone else down.
+    """
+
+    def __init__(self, max_queue: int = 100):
+        self.max_queue = max_queue
+        self._subscribers: Set[asyncio.Queue] = set()
+
+    def subscribe(self) -> asyncio.Queue:
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.max_queue)
+        self._subscribers.add(queue)
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue) -> None:
+        self._subscribers.discard(queue)
+
+    @property
+    def subscribers(self) -> int:
+        return len(self._subscribers)
+
+    def publish(self, message: Dict[str, Any]) -> None:
+        for queue in self._subscribers:
+            if queue.full():
+                queue.get_nowait()
+                logger.debug("Dropped a message for a slow WebSocket client")
+            queue.put_nowait(message)
+
+
+broadcaster = Broadcaster()
@@ -0,0 +1,208 @@
+import logging
+import os
+import uuid
+from datetime import date, datetime, timezone
+from typing import TYPE_CHECKING, Iterable, List, Optional, Sequence, Union
+
+from core.shared_cache import CHAIN_FIELDS
+from plugins.data.base import OptionChain
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+PARTITIONS = ("symbol", "date", "expiration")
+# Stored per contract row, besides the partition columns
+COLUMNS = ("timestamp", "right", "contractSymbol", *CHAIN_FIELDS, "underlying_price", "moneyness")
+# Rows per parquet row group; the min/max statistics of each group are what
+# lets a strike-range filter skip most of a file without decompressing it
+ROW_GROUP_SIZE = 512
+
+DateLike = Union[date, datetime, str]
+
+
+def _as_date(value: DateLike) -> date:
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(str(value)[:10])
+
+
+def chain_table(chain: OptionChain):
+    """Flatten both sides of a chain into one Arrow table sorted by strike."""
+    import numpy as np
+    import pyarrow as pa
+
+    ts = chain.timestamp.astimezone(timezone.utc).replace(tzinfo=None) if chain.timestamp.tzinfo else chain.timestamp
+    spot = float(chain.underlying_price)
+    sides = [("C", chain.calls), ("P", chain.puts)]
+    frames = [(right, df) for right, df in sides if df is not None and len(df)]
+
+    strikes = np.concatenate([df["strike"].to_numpy(dtype="f8") for _, df in frames]) if frames else np.empty(0)
+    order = np.argsort(strikes, kind="stable")
+    rows = len(strikes)
+
+    def column(name, dtype="f8", fill=np.nan):
+        parts = [
+            df[name].to_numpy(dtype=dtype, na_value=fill) if name in df else np.full(len(df), fill, dtype=dtype)
+            for _, df in frames
+        ]
+        return np.concatenate(parts)[order] if parts else np.empty(0, dtype=dtype)
+
+    rights = np.concatenate([np.full(len(df), right, dtype=object) for right, df in frames])[order] if frames else []
+    contracts = column("contractSymbol", dtype=object, fill=None)
+    data = {
+        "timestamp": pa.array(np.full(rows, np.datetime64(ts, "ms")), pa.timestamp("ms", "UTC")),
+        "right": pa.array(rights, pa.string()).dictionary_encode(),
+        "contractSymbol": pa.array(contracts, pa.string()),
+    }
+    for name in CHAIN_FIELDS:
+        data[name] = pa.array(column(name), pa.float64())
+    data["underlying_price"] = pa.array(np.full(rows, spot), pa.float64())
+    data["moneyness"] = pa.array(strikes[order] / spot if spot else np.full(rows, np.nan), pa.float64())
+    return pa.table(data)
+
+
+class ChainArchive:
+    """Option chain snapshots stored as zstd parquet under ``root``.
+
+    Files are laid out hive-style as
+    ``symbol=SPX/date=2024-01-02/expiration=2024-02-16/part-*.parquet`` with
+    one file per snapshot.  Rows are sorted by strike and written in small row
+    groups with dictionary-encoded strikes, so queries prune whole directories
+    by symbol/date/expiration, skip row groups outside the requested strike
+    range via parquet statistics, and decode only the requested columns.
+    """
+
+    def __init__(self, root: str, compression: str = "zstd"):
+        self.root = root
+        self.compression = compression
+
+    def _partition_dir(self, symbol: str, day: date, expiration: date) -> str:
+        return os.path.join(self.root, f"symbol={symbol}", f"date={day.isoformat()}", f"expiration={expiration.isoformat()}")
+
+    def write(self, chain: OptionChain, expiration: DateLike) -> str:
+        """Append one chain snapshot and return the file it was written to."""
+        import pyarrow.parquet as pq
+
+        table = chain_table(chain)
+        directory = self._partition_dir(chain.symbol, _as_date(chain.timestamp), _as_date(expiration))
+        os.makedirs(directory, exist_ok=True)
+        name = f"part-{chain.timestamp:%H%M%S%f}-{uuid.uuid4().hex[:8]}.parquet"
+        path = os.path.join(directory, name)
+        # Write beside the target and rename so readers never see a partial file
+        tmp = f"{path}.tmp"
+        pq.write_table(
+            table,
+            tmp,
+            compression=self.compression,
+            row_group_size=ROW_GROUP_SIZE,
+            use_dictionary=["right", "strike", "contractSymbol"],
+            write_statistics=True,
+        )
+        os.replace(tmp, path)
+        return path
+
+    def symbols(self) -> List[str]:
+        if not os.path.isdir(self.root):
+            return []
+        return sorted(e.name.split("=", 1)[1] for e in os.scandir(self.root) if e.is_dir() and e.name.startswith("symbol="))
+
+    def files(
+        self,
+        symbol: str,
+        start: Optional[DateLike] = None,
+        end: Optional[DateLike] = None,
+        expirations: Optional[Iterable[DateLike]] = None,
+    ) -> List[str]:
+        """Parquet files for a symbol, pruned by date and expiration from directory names alone."""
+        base = os.path.join(self.root, f"symbol={symbol}")
+        if not os.path.isdir(base):
+            return []
+        lo = _as_date(start) if start is not None else date.min
+        hi = _as_date(end) if end is not None else date.max
+        wanted = {_as_date(e).isoformat() for e in expirations} if expirations is not None else None
+
+        paths = []
+        for day_dir in sorted(os.scandir(base), key=lambda e: e.name):
+            if not day_dir.name.startswith("date=") or not lo <= _as_date(day_dir.name[5:]) <= hi:
+                continue
+            for exp_dir in sorted(os.scandir(day_dir.path), key=lambda e: e.name):
+                if not exp_dir.name.startswith("expiration=") or (wanted is not None and exp_dir.name[11:] not in wanted):
+                    continue
+                paths.extend(
+                    os.path.join(exp_dir.path, f)
+                    for f in sorted(os.listdir(exp_dir.path))
+                    if f.endswith(".parquet")
+                )
+        return paths
+
+    def query(
+        self,
+        symbol: str,
+        start: Optional[DateLike] = None,
+        end: Optional[DateLike] = None,
+        strike_range: Optional[float] = None,
+        expirations: Optional[Iterable[DateLike]] = None,
+        columns: Optional[Sequence[str]] = None,
+        right: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> "pd.DataFrame":
+        """Load archived chains for ``symbol`` between ``start`` and ``end`` (inclusive).
+
+        ``strike_range`` keeps strikes within that fraction of spot (0.05 for
+        +/-5%); ``columns`` limits which columns are read from disk.  With
+        ``limit`` the scan stops after that many matching rows.
+        """
+        import pyarrow as pa
+        import pyarrow.dataset as ds
+
+        available = PARTITIONS + COLUMNS
+        selected = list(columns) if columns else list(available)
+        unknown = [c for c in selected if c not in available]
+        if unknown:
+            raise ValueError(f"Unknown chain archive columns: {', '.join(unknown)}")
+
+        partitioning = ds.partitioning(
+            pa.schema([("symbol", pa.string()), ("date", pa.date32()), ("expiration", pa.date32())]),
+            flavor="hive",
+        )
+        paths = self.files(symbol, start, end, expirations)
+        if not paths:
+            return self._empty(selected)
+        dataset = ds.dataset(paths, format="parquet", partitioning=partitioning, partition_base_dir=self.root)
+
+        condition = None
+        if strike_range is not None:
+            condition = (ds.field("moneyness") >= 1 - strike_range) & (ds.field("moneyness") <= 1 + strike_range)
+        if right is not None:
+            side = ds.field("right") == right.upper()[0]
+            condition = side if condition is None else condition & side
+        if limit is not None:
+            table = dataset.head(limit, columns=selected, filter=condition)
+        else:
+            table = dataset.to_table(columns=selected, filter=condition)
+        return table.to_pandas()
+
+    @staticmethod
+    def _empty(columns: List[str]) -> "pd.DataFrame":
+        import pandas as pd
+
+        return pd.DataFrame({name: [] for name in columns})
+
+
+_archive: Optional[ChainArchive] = None
+
+
+def get_chain_archive() -> Optional[ChainArchive]:
+    """The configured archive, or None when ``chain_archive_path`` is unset."""
+    global _archive
+    from core.config import settings
+
+    if not settings.chain_archive_path:
+        return None
+    if _archive is None or _archive.root != settings.chain_archive_path:
+        _archive = ChainArchive(settings.chain_archive_path, settings.chain_archive_compression)
+    return _archive
@@ -1,5 +1,5 @@
 from pydantic_settings import BaseSettings
-from typing import Optional
+from typing import Dict, List, Optional
 from functools import lru_cache
 import yaml
 import os
@@ -10,6 +10,7 @@ class Settings(BaseSettings):
     app_env: str = "development"
     debug: bool = True
     secret_key: str
+    admin_token: Optional[str] = None  # enables /api/admin when set
     
     # Database
     database_url: str
@@ -33,6 +34,23 @@ class Settings(BaseSettings):
     credit_threshold: float = 0.50
     max_spread_width: int = 50
     
+    # Order Execution
+    order_rate_limit: float = 5.0  # broker requests per second
+    order_burst: int = 10
+    order_poll_seconds: float = 1.0
+    order_max_attempts: int = 3
+    order_batch_size: int = 50
+    commission_per_contract: float = 0.65
+
+    # Simulated Broker (broker_plugin: simulated)
+    sim_seed: int = 7
+    sim_latency_ms: float = 50.0
+    sim_fill_probability: float = 0.6
+    sim_partial_fill_probability: float = 0.5
+    sim_reject_probability: float = 0.0
+    sim_slippage: float = 0.05
+    sim_max_requests_per_second: float = 20.0
+
     # Risk Management
     max_positions: int = 5
     position_size_pct: float = 0.02
@@ -50,6 +68,97 @@ class Settings(BaseSettings):
     # Volatility Settings
     iv_percentile_period: int = 252
     high_vol_threshold: float = 0.75
+
+    # Synthetic Data Plugin (data_plugin: synthetic)
+    synthetic_seed: int = 42
+    synthetic_tick_rate: float = 10.0
+    synthetic_volatility: float = 0.18
+    synthetic_drift: float = 0.07
+    synthetic_jump_intensity: float = 4.0
+    synthetic_jump_std: float = 0.03
+    synthetic_strikes: int = 2000
+    synthetic_expirations: int = 8
+    synthetic_history_days: int = 1260
+    synthetic_rate: float = 0.04
+
+    # Plugin Lifecycle
+    plugin_init_timeout: float = 30.0
+    plugin_shutdown_timeout: float = 10.0
+    optional_plugins: List[str] = ["executor"]
+
+    # Multi-worker Deployment
+    leader_election: str = "none"  # none | file | redis | local
+    leader_lock_path: str = "/tmp/option_pilot.leader.lock"
+    leader_lock_key: str = "option_pilot:leader"
+    leader_lock_ttl: float = 15.0
+    leader_renew_seconds: float = 5.0
+    shared_cache_name: Optional[str] = None  # enables the shared-memory market cache
+    shared_quote_slots: int = 64
+    shared_chain_slots: int = 8
+    shared_chain_rows: int = 2048
+    shared_quote_max_age: float = 15.0
+    shared_chain_max_age: float = 180.0
+    chain_poll_seconds: int = 60
+
+    # Equity Curve
+    equity_refresh_seconds: float = 60.0
+    equity_max_points: int = 1000
+    equity_max_points_limit: int = 5000  # upper bound on any requested max_points
+
+    # Snapshot Retention
+    snapshot_rollup_seconds: int = 60
+    snapshot_rollup_batch_size: int = 10_000
+    snapshot_rollup_lag_seconds: float = 30.0  # newer raw rows wait for the next run
+    # Days kept per table; None keeps forever
+    snapshot_retention_days: Dict[str, Optional[float]] = {"raw": 2, "1m": 30, "1h": 730, "1d": None}
+    snapshot_max_points: int = 2000
+
+    # Chain Archive
+    chain_archive_path: Optional[str] = None  # enables the daily parquet chain archive
+    chain_archive_time: str = "16:15"  # US/Eastern, Monday-Friday
+    chain_archive_compression: str = "zstd"
+
+    # Plugin Pipeline
+    pipeline_concurrency: int = 4
+    pipeline_queue_size: int = 16
+    pipeline_history_period: str = "3mo"
+
+    # Opportunity Scanner
+    scan_universe: List[str] = ["SPX", "SPY", "QQQ", "IWM"]
+    scan_top_k: int = 10
+    scan_fetch_concurrency: int = 8
+    scan_workers: int = 4
+
+    # Signal Engine
+    signal_symbols: List[str] = []
+    signal_history_period: str = "1y"
+    signal_refresh_seconds: int = 60
+    signal_bar_interval: str = "1m"
+
+    # Correlation Engine
+    correlation_symbols: List[str] = []  # empty uses signal_symbols
+    correlation_benchmark: str = "SPX"
+    correlation_interval: str = "1m"
+    correlation_window: int = 390  # bars
+    max_beta_weighted_delta: Optional[float] = None  # per-trade limit in benchmark shares
+
+    # Intraday Bars
+    bar_intervals: List[str] = ["1s", "1m", "5m"]
+    bar_capacity: int = 2048
+    bar_max_symbols: int = 64  # quotes for further symbols are not aggregated
+    quote_poll_seconds: int = 5
+
+    # Market Cache & Job Scheduling
+    market_cache_quote_ttl: float = 10.0
+    market_cache_chain_ttl: float = 90.0
+    market_cache_history_ttl: float = 1800.0
+    market_cache_max_entries: int = 1024
+    warmup_time: str = "09:20"  # US/Eastern, Monday-Friday
+    warm_chains_minutes: int = 15
+    warm_history_minutes: int = 30
+    market_hours: str = "09:30-16:00"  # US/Eastern session the intraday refresh jobs run in
+    job_jitter_seconds: int = 5
+    job_misfire_grace_seconds: int = 30  # later runs are skipped, not run late
     
     class Config:
         env_file = ".env"
@@ -65,4 +174,21 @@ def get_settings() -> Settings:
             data = yaml.safe_load(f) or {}
     return Settings(**data)
 
-settings = get_settings()
+class LazySettings:
+    """Proxy that reads the YAML/env configuration on first attribute access, not at import"""
+
+    def __getattr__(self, name):
+        return getattr(get_settings(), name)
+
+    def __setattr__(self, name, value):
+        setattr(get_settings(), name, value)
+
+    def __repr__(self) -> str:
+        return repr(get_settings())
+
+settings = LazySettings()
+
+
+def tracked_symbols() -> List[str]:
+    """Symbols the signal, warm-up and chain jobs cover: ``signal_symbols``, else ``symbol``."""
+    return settings.signal_symbols or [settings.symbol]
@@ -0,0 +1,234 @@
+import logging
+import math
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+
+from core.bars import INTERVALS, get_bar_aggregator
+from core.config import settings, tracked_symbols
+
+logger = logging.getLogger(__name__)
+
+def _clean(value: Optional[float]) -> Optional[float]:
+    return None if value is None or not math.isfinite(value) else round(float(value), 6)
+
+
+class RollingCorrelation:
+    """Rolling means, covariances, correlations and betas of log returns.
+
+    Keeps the last ``window`` return vectors for a universe of N symbols in a
+    ring buffer together with running sums and the N x N matrix of summed
+    cross products.  Each new bar adds the outer product of the new return
+    vector and subtracts the one leaving the window, so an update is a single
+    vectorized O(N^2) step that never revisits the window.  The sums are
+    recomputed from the buffer once per ``window`` updates to stop floating
+    point drift, which keeps the amortized cost O(N^2).
+
+    A symbol that has not quoted yet contributes zero returns and its row and
+    column read NaN until every return left in the window is a real one; the
+    rest of the universe is unaffected.
+    """
+
+    def __init__(self, symbols: Iterable[str], window: int = 390, benchmark: str = "SPX", interval: str = "1m"):
+        if window < 2:
+            raise ValueError("window must be at least 2")
+        if interval not in INTERVALS:
+            raise ValueError(f"Unsupported bar interval: {interval}")
+        self.benchmark = benchmark
+        self.interval = interval
+        # The benchmark is always column 0
+        self.symbols: List[str] = list(dict.fromkeys([benchmark, *symbols]))
+        self.index = {symbol: i for i, symbol in enumerate(self.symbols)}
+        self.window = window
+        n = len(self.symbols)
+        self._returns = np.zeros((window, n))
+        self._sum = np.zeros(n)
+        self._cross = np.zeros((n, n))
+        self._last = np.full(n, np.nan)
+        # Real returns per symbol in the window, capped at ``window``
+        self._valid = np.zeros(n, dtype=int)
+        self._missing: List[str] = []
+        self._pos = 0
+        self._since_resync = 0
+        self.count = 0
+        # Bar closes waiting for the rest of the universe, by bar start time
+        self._pending: Dict[float, Dict[str, float]] = {}
+
+    def update(self, closes: Iterable[float]) -> None:
+        """Add one bar of closes (in ``symbols`` order; NaN carries the last close forward)."""
+        closes = np.asarray(closes, dtype=float)
+        closes = np.where(np.isnan(closes), self._last, closes)
+        # Only symbols with a previous and a current close have a return
+        ready = ~np.isnan(self._last) & ~np.isnan(closes)
+        self._report_missing(closes)
+        if not ready.any():
+            self._last = closes
+            return
+        with np.errstate(divide="ignore", invalid="ignore"):
+            r = np.where(ready, np.nan_to_num(np.log(closes / self._last)), 0.0)
+        self._last = closes
+        self._valid = np.where(ready, np.minimum(self._valid + 1, self.window), self._valid)
+
+        if self.count == self.window:
+            old = self._returns[self._pos]
+            self._sum -= old
+            self._cross -= np.outer(old, old)
+        else:
+            self.count += 1
+        self._returns[self._pos] = r
+        self._sum += r
+        self._cross += np.outer(r, r)
+        self._pos = (self._pos + 1) % self.window
+
+        self._since_resync += 1
+        if self._since_resync >= self.window:
+            self.resync()
+
+    def _report_missing(self, closes: np.ndarray) -> None:
+        missing = [symbol for symbol, close in zip(self.symbols, closes) if np.isnan(close)]
+        if missing and missing != self._missing:
+            logger.warning(f"No quotes yet for {', '.join(missing)}; their correlations and betas stay empty")
+        self._missing = missing
+
+    def load(self, closes: np.ndarray) -> None:
+        """Feed a (bars, symbols) matrix of historical closes, oldest first."""
+        for row in np.asarray(closes, dtype=float):
+            self.update(row)
+
+    def resync(self) -> None:
+        """Recompute the running sums exactly from the window."""
+        data = self.returns()
+        self._sum = data.sum(axis=0)
+        self._cross = data.T @ data
+        self._since_resync = 0
+
+    def returns(self) -> np.ndarray:
+        """(count, symbols) returns currently in the window, oldest first."""
+        if self.count < self.window:
+            return self._returns[:self.count]
+        return np.roll(self._returns, -self._pos, axis=0)
+
+    def covariance(self) -> np.ndarray:
+        n = self.count
+        size = len(self.symbols)
+        if n < 2:
+            return np.full((size, size), np.nan)
+        mean = self._sum / n
+        cov = (self._cross - n * np.outer(mean, mean)) / (n - 1)
+        # Symbols whose window still holds filler zeros have no statistics yet
+        partial = self._valid < n
+        cov[partial, :] = np.nan
+        cov[:, partial] = np.nan
+        return cov
+
+    def correlation(self) -> np.ndarray:
+        cov = self.covariance()
+        sd = np.sqrt(np.clip(np.diag(cov), 0.0, None))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            corr = cov / np.outer(sd, sd)
+        corr[~np.isfinite(corr)] = np.nan
+        return np.clip(corr, -1.0, 1.0)
+
+    def betas(self) -> np.ndarray:
+        """Beta of every symbol to the benchmark."""
+        cov = self.covariance()
+        with np.errstate(divide="ignore", invalid="ignore"):
+            betas = cov[:, 0] / cov[0, 0]
+        betas[~np.isfinite(betas)] = np.nan
+        return betas
+
+    def beta(self, symbol: str) -> Optional[float]:
+        i = self.index.get(symbol)
+        return None if i is None else _clean(self.betas()[i])
+
+    def pair(self, a: str, b: str) -> Optional[float]:
+        """Correlation of two symbols, or None if either is untracked."""
+        i, j = self.index.get(a), self.index.get(b)
+        return None if i is None or j is None else _clean(self.correlation()[i, j])
+
+    def beta_weighted_delta(self, deltas: Dict[str, float]) -> Dict[str, Any]:
+        """Express share deltas per underlying as benchmark-equivalent deltas.
+
+        Each delta is scaled by ``beta * price / benchmark_price``; symbols
+        outside the universe (or without a beta yet) are listed as untracked.
+        """
+        betas = self.betas()
+        bench_price = self._last[0] if np.isfinite(self._last[0]) else 0.0
+        by_symbol, untracked = {}, []
+        for symbol, delta in deltas.items():
+            i = self.index.get(symbol)
+            if i is None or not np.isfinite(betas[i]) or not np.isfinite(self._last[i]) or not bench_price:
+                untracked.append(symbol)
+                continue
+            by_symbol[symbol] = float(delta * betas[i] * self._last[i] / bench_price)
+        return {
+            "benchmark": self.benchmark,
+            "beta_weighted_delta": round(sum(by_symbol.values()), 4),
+            "by_symbol": {symbol: round(value, 4) for symbol, value in by_symbol.items()},
+            "untracked": untracked,
+        }
+
+    def on_bar(self, symbol: str, interval: str, bar) -> None:
+        """Bar aggregator listener: update once every symbol has closed a bar."""
+        if interval != self.interval or symbol not in self.index:
+            return
+        self._pending.setdefault(bar.bucket, {})[symbol] = bar.close
+        complete = [bucket for bucket, closes in self._pending.items() if len(closes) == len(self.symbols)]
+        if complete:
+            cutoff = max(complete)
+        else:
+            # A symbol that stopped quoting must not hold the others back forever
+            buckets = sorted(self._pending)
+            if len(buckets) < 3:
+                return
+            cutoff = buckets[-3]
+        # Earlier incomplete bars go in with the missing closes carried forward
+        for bucket in sorted(b for b in self._pending if b <= cutoff):
+            closes = self._pending.pop(bucket)
+            self.update([closes.get(symbol, np.nan) for symbol in self.symbols])
+
+    def snapshot(self) -> Dict[str, Any]:
+        """JSON-safe view for the risk endpoints."""
+        corr = self.correlation()
+        betas = self.betas()
+        return {
+            "benchmark": self.benchmark,
+            "interval": self.interval,
+            "window": self.window,
+            "observations": self.count,
+            "symbols": self.symbols,
+            "beta": {symbol: _clean(betas[i]) for i, symbol in enumerate(self.symbols)},
+            "correlation": [[_clean(v) for v in row] for row in corr.tolist()],
+        }
+
+
+def correlation_universe() -> List[str]:
+    return settings.correlation_symbols or tracked_symbols()
+
+
+_engine: Optional[RollingCorrelation] = None
+
+
+def init_correlation_engine() -> RollingCorrelation:
+    """Build the engine from the current settings and feed it intraday bars.
+
+    Replaces (and unsubscribes) any previous engine, so a restart or a test
+    picks up changed settings.
+    """
+    global _engine
+    if _engine is not None:
+        get_bar_aggregator().remove_listener(_engine.on_bar)
+    _engine = RollingCorrelation(
+        correlation_universe(),
+        window=settings.correlation_window,
+        benchmark=settings.correlation_benchmark,
+        interval=settings.correlation_interval,
+    )
+    # Fed by the intraday bars built from polled quotes
+    get_bar_aggregator().add_listener(_engine.on_bar)
+    return _engine
+
+
+def get_correlation_engine() -> RollingCorrelation:
+    """The live engine, built on first use if startup has not created it."""
+    return _engine if _engine is not None else init_correlation_engine()
@@ -0,0 +1,68 @@
+from typing import Tuple
+
+import numpy as np
+
+
+def lttb(x: np.ndarray, y: np.ndarray, n: int) -> np.ndarray:
+    """Indices of ``n`` points chosen by Largest-Triangle-Three-Buckets.
+
+    The first and last points are always kept.  Every bucket in between
+    contributes the point that forms the largest triangle with the previously
+    selected point and the average of the next bucket, which preserves peaks,
+    troughs and the overall shape of the line.
+    """
+    size = len(x)
+    n = max(n, 3)
+    if n >= size:
+        return np.arange(size)
+
+    edges = np.linspace(1, size - 1, n - 1).astype(np.int64)
+    selected = np.empty(n, dtype=np.int64)
+    selected[0], selected[-1] = 0, size - 1
+    a = 0
+    for i in range(n - 2):
+        lo, hi = edges[i], edges[i + 1]
+        # Average of the following bucket (the last bucket looks at the final point)
+        nxt_lo, nxt_hi = hi, edges[i + 2] if i + 2 < len(edges) else size
+        avg_x = x[nxt_lo:nxt_hi].mean()
+        avg_y = y[nxt_lo:nxt_hi].mean()
+        area = np.abs((x[a] - avg_x) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (avg_y - y[a]))
+        a = lo + int(np.argmax(area))
+        selected[i + 1] = a
+    return selected
+
+
+def minmax(x: np.ndarray, y: np.ndarray, n: int) -> np.ndarray:
+    """Indices of the first and last points plus the minimum and maximum of
+    ``(n - 2) // 2`` equal-count buckets.
+
+    Cheaper than LTTB and guarantees every extreme survives, at the cost of a
+    more jagged line.
+    """
+    size = len(y)
+    if n >= size:
+        return np.arange(size)
+    buckets = max((n - 2) // 2, 1)
+    edges = np.linspace(0, size, buckets + 1).astype(np.int64)
+    starts = edges[:-1]
+    lows = np.minimum.reduceat(y, starts)
+    highs = np.maximum.reduceat(y, starts)
+    indices = {0, size - 1}
+    for start, end, low, high in zip(starts, edges[1:], lows, highs):
+        window = y[start:end]
+        indices.add(start + int(np.argmax(window == low)))
+        indices.add(start + int(np.argmax(window == high)))
+    return np.array(sorted(indices), dtype=np.int64)
+
+
+METHODS = {"lttb": lttb, "minmax": minmax}
+
+
+def downsample(x: np.ndarray, y: np.ndarray, n: int, method: str = "lttb") -> Tuple[np.ndarray, np.ndarray]:
+    """Reduce a line to at most ``n`` points with a shape-preserving method."""
+    try:
+        select = METHODS[method]
+    except KeyError:
+        raise ValueError(f"Unknown downsampling method {method!r}; expected one of {', '.join(METHODS)}")
+    indices = select(np.asarray(x, dtype=float), np.asarray(y, dtype=float), n)
+    return np.asarray(x)[indices], np.asarray(y)[indices]
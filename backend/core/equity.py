@@ -0,0 +1,132 @@
+import logging
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, time as day_time, timedelta, timezone
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+from core.bars import epoch_seconds
+from core.config import settings
+from core.downsample import METHODS, downsample
+from core.metrics import record_cache
+from models import database
+from models.database import PerformanceMetric, Trade
+
+logger = logging.getLogger(__name__)
+
+
+class EquityCurve:
+    """Precomputed cumulative P&L series with cached, downsampled views.
+
+    The series is the daily cumulative ``PerformanceMetric.total_pnl``,
+    extended intraday by the realized P&L of trades closed after the latest
+    metric.  It is rebuilt at most every ``ttl`` seconds.  Downsampled windows
+    are cached per (range, max_points, method) until the series changes, so
+    repeated dashboard polls cost a dict lookup.
+    """
+
+    def __init__(self, ttl: float = 60.0, cache_size: int = 64, session_factory=None):
+        self.ttl = ttl
+        self.cache_size = cache_size
+        self.session_factory = session_factory
+        self.timestamps = np.empty(0)
+        self.values = np.empty(0)
+        self.version: Optional[Tuple[int, float, float]] = None
+        self.built_at = 0.0
+        self._views: "OrderedDict[Tuple, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _session(self):
+        return (self.session_factory or database.get_sessionmaker())()
+
+    def refresh(self, force: bool = False) -> None:
+        """Rebuild the series from the database if it is older than ``ttl``."""
+        with self._lock:
+            if not force and self.version is not None and time.monotonic() - self.built_at < self.ttl:
+                return
+            with self._session() as db:
+                metrics = db.query(PerformanceMetric.date, PerformanceMetric.total_pnl).order_by(PerformanceMetric.date).all()
+                trades = db.query(Trade.exit_date, Trade.pnl).filter(Trade.exit_date.isnot(None), Trade.pnl.isnot(None))
+                if metrics:
+                    trades = trades.filter(Trade.exit_date > metrics[-1].date)
+                trades = trades.order_by(Trade.exit_date).all()
+
+            base = (metrics[-1].total_pnl or 0.0) if metrics else 0.0
+            timestamps = np.array([epoch_seconds(m.date) for m in metrics] + [epoch_seconds(t.exit_date) for t in trades], dtype=float)
+            values = np.concatenate([
+                np.array([m.total_pnl or 0.0 for m in metrics], dtype=float),
+                base + np.cumsum(np.array([t.pnl for t in trades], dtype=float)),
+            ])
+            version = (len(values), float(timestamps[-1]) if len(values) else 0.0, float(values[-1]) if len(values) else 0.0)
+            if version != self.version:
+                self.timestamps, self.values, self.version = timestamps, values, version
+                self._views.clear()
+            self.built_at = time.monotonic()
+
+    def view(self, days: int, max_points: int, method: str = "lttb", now: Optional[datetime] = None) -> Dict[str, Any]:
+        """The last ``days`` of the curve reduced to at most ``max_points`` points.
+
+        The window runs from midnight ``days`` before ``now`` to the end of
+        ``now``'s day, so a cached view stays correct until the date changes.
+        """
+        if method not in METHODS:
+            raise ValueError(f"Unknown downsampling method {method!r}; expected one of {', '.join(METHODS)}")
+        now = now or datetime.utcnow()
+        self.refresh()
+        with self._lock:
+            timestamps, values, version = self.timestamps, self.values, self.version
+            # Windows move once a day so that keys stay stable between polls
+            day = now.date()
+            key = (days, max_points, method, day, version)
+            cached = self._views.get(key)
+            if cached is not None:
+                self._views.move_to_end(key)
+        record_cache("equity", cached is not None)
+        if cached is not None:
+            return cached
+
+        end = datetime.combine(day, day_time.min) + timedelta(days=1)
+        start = end - timedelta(days=days + 1)
+        lo, hi = np.searchsorted(timestamps, [epoch_seconds(start), epoch_seconds(end)], side="right")
+        x, y = timestamps[lo:hi], values[lo:hi]
+        if lo > 0:
+            # Open the window at the level reached before it
+            x = np.concatenate([[epoch_seconds(start)], x])
+            y = np.concatenate([[values[lo - 1]], y])
+        total = len(x)
+        if total > max_points:
+            x, y = downsample(x, y, max_points, method)
+        pnl = np.diff(y, prepend=y[0] if len(y) else 0.0)
+
+        body = {
+            "start_date": start.isoformat(),
+            "end_date": end.isoformat(),
+            "method": method,
+            "total_points": total,
+            "data": [
+                {
+                    "date": datetime.fromtimestamp(ts, tz=timezone.utc).replace(tzinfo=None).isoformat(),
+                    "pnl": round(float(change), 2),
+                    "cumulative_pnl": round(float(value), 2),
+                }
+                for ts, change, value in zip(x.tolist(), pnl.tolist(), y.tolist())
+            ],
+        }
+        with self._lock:
+            self._views[key] = body
+            if len(self._views) > self.cache_size:
+                self._views.popitem(last=False)
+        return body
+
+
+_equity_curve: Optional[EquityCurve] = None
+
+
+def get_equity_curve() -> EquityCurve:
+    """The process-wide equity curve, created on first use."""
+    global _equity_curve
+    if _equity_curve is None:
+        _equity_curve = EquityCurve(ttl=settings.equity_refresh_seconds)
+    return _equity_curve
@@ -0,0 +1,219 @@
+import asyncio
+import logging
+import os
+import time
+import uuid
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Extend the TTL / delete the key only while it still holds our token
+RENEW_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('pexpire', KEYS[1], ARGV[2])
+end
+return 0
+"""
+RELEASE_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+
+class LeaderLock:
+    """Mutual exclusion primitive that at most one worker holds at a time."""
+
+    async def acquire(self) -> bool:
+        """Try once, without blocking; True if this worker now holds the lock."""
+        raise NotImplementedError
+
+    async def renew(self) -> bool:
+        """Keep holding the lock; False if it was lost."""
+        return True
+
+    async def release(self) -> None:
+        raise NotImplementedError
+
+
+class FileLeaderLock(LeaderLock):
+    """``flock`` on a local file: elects one leader among workers on the same host.
+
+    The kernel drops the lock when the holding process exits, so a crashed
+    leader is replaced on the next acquisition attempt without any TTL.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._fd: Optional[int] = None
+
+    async def acquire(self) -> bool:
+        import fcntl
+
+        if self._fd is not None:
+            return True
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            os.close(fd)
+            return False
+        os.ftruncate(fd, 0)
+        os.write(fd, f"{os.getpid()}\n".encode())
+        self._fd = fd
+        return True
+
+    async def release(self) -> None:
+        import fcntl
+
+        if self._fd is None:
+            return
+        fcntl.flock(self._fd, fcntl.LOCK_UN)
+        os.close(self._fd)
+        self._fd = None
+
+
+class RedisLeaderLock(LeaderLock):
+    """``SET NX PX`` lease in Redis, renewed by the holder before it expires.
+
+    Works across hosts. ``client`` is a ``redis.asyncio.Redis`` or the
+    in-process :class:`LocalRedis` stand-in.
+    """
+
+    def __init__(self, client, key: str, ttl: float):
+        self.client = client
+        self.key = key
+        self.ttl_ms = int(ttl * 1000)
+        self.token = f"{os.getpid()}-{uuid.uuid4().hex}"
+
+    async def acquire(self) -> bool:
+        return bool(await self.client.set(self.key, self.token, nx=True, px=self.ttl_ms))
+
+    async def renew(self) -> bool:
+        return bool(await self.client.eval(RENEW_SCRIPT, 1, self.key, self.token, self.ttl_ms))
+
+    async def release(self) -> None:
+        await self.client.eval(RELEASE_SCRIPT, 1, self.key, self.token)
+
+
+class LocalRedis:
+    """In-process stand-in for the Redis commands used by :class:`RedisLeaderLock`.
+
+    Useful for tests and single-host development without a Redis server; it
+    only coordinates code running in the same process.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self.clock = clock
+        self._data: Dict[str, Tuple[str, float]] = {}
+
+    def _get(self, key: str) -> Optional[str]:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        if entry[1] <= self.clock():
+            del self._data[key]
+            return None
+        return entry[0]
+
+    async def get(self, key: str) -> Optional[str]:
+        return self._get(key)
+
+    async def set(self, key: str, value: str, nx: bool = False, px: Optional[int] = None) -> Optional[bool]:
+        if nx and self._get(key) is not None:
+            return None
+        expires = self.clock() + px / 1000 if px else float("inf")
+        self._data[key] = (value, expires)
+        return True
+
+    async def eval(self, script: str, numkeys: int, key: str, token: str, *args: Any) -> int:
+        if self._get(key) != token:
+            return 0
+        if script == RENEW_SCRIPT:
+            self._data[key] = (token, self.clock() + int(args[0]) / 1000)
+        elif script == RELEASE_SCRIPT:
+            del self._data[key]
+        else:
+            raise NotImplementedError("LocalRedis only supports the leader lock scripts")
+        return 1
+
+
+def build_leader_lock(config: Dict[str, Any]) -> Optional[LeaderLock]:
+    """Lock selected by ``leader_election``; None means this process always leads."""
+    mode = config.get("leader_election", "none")
+    if mode == "none":
+        return None
+    if mode == "file":
+        return FileLeaderLock(config.get("leader_lock_path", "/tmp/option_pilot.leader.lock"))
+    key = config.get("leader_lock_key", "option_pilot:leader")
+    ttl = config.get("leader_lock_ttl", 15.0)
+    if mode == "redis":
+        import redis.asyncio as redis
+
+        return RedisLeaderLock(redis.from_url(config["redis_url"], decode_responses=True), key, ttl)
+    if mode == "local":
+        return RedisLeaderLock(LocalRedis(), key, ttl)
+    raise ValueError(f"Unknown leader_election mode: {mode}")
+
+
+class LeaderElector:
+    """Campaigns for a :class:`LeaderLock` and runs callbacks on role changes.
+
+    Followers retry every ``interval`` seconds; the leader renews on the same
+    cadence, so a lease TTL should be a few intervals long.
+    """
+
+    def __init__(
+        self,
+        lock: LeaderLock,
+        on_elected: Callable[[], Awaitable[None]],
+        on_demoted: Callable[[], Awaitable[None]],
+        interval: float = 5.0,
+    ):
+        self.lock = lock
+        self.on_elected = on_elected
+        self.on_demoted = on_demoted
+        self.interval = interval
+        self.is_leader = False
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        """Run the first election inline, then keep campaigning in the background."""
+        await self._step()
+        self._task = asyncio.create_task(self._run(), name="leader-election")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self.is_leader:
+            await self._set_role(False)
+            await self.lock.release()
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self._step()
+            except Exception as e:
+                logger.warning(f"Leader election step failed: {e}")
+                if self.is_leader:
+                    await self._set_role(False)
+
+    async def _step(self) -> None:
+        if self.is_leader:
+            if not await self.lock.renew():
+                logger.warning(f"Worker {os.getpid()} lost leadership")
+                await self._set_role(False)
+        elif await self.lock.acquire():
+            logger.info(f"Worker {os.getpid()} elected leader")
+            await self._set_role(True)
+
+    async def _set_role(self, leader: bool) -> None:
+        self.is_leader = leader
+        await (self.on_elected() if leader else self.on_demoted())
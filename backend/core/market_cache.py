@@ -0,0 +1,125 @@
+import asyncio
+import time
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+from core.config import settings
+from core.metrics import record_cache
+
+
+class MarketCache:
+    """Per-process TTL cache in front of the data plugin.
+
+    Entries are filled by the scheduler's warm-up jobs before the open and on
+    intraday intervals, so request handlers normally find a fresh value.  On a
+    miss only one upstream call is made per key; concurrent requests for the
+    same key await that call instead of issuing their own.
+    """
+
+    def __init__(
+        self,
+        quote_ttl: float = 5.0,
+        chain_ttl: float = 60.0,
+        history_ttl: float = 900.0,
+        max_entries: int = 1024,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.ttl = {"quote": quote_ttl, "chain": chain_ttl, "history": history_ttl}
+        self.max_entries = max_entries
+        self.clock = clock
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None or entry[0] <= self.clock():
+            return None
+        return entry[1]
+
+    def put(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        if len(self._entries) >= self.max_entries:
+            self._evict()
+        self._entries[key] = (self.clock() + (ttl if ttl is not None else self.ttl[key[0]]), value)
+
+    def _evict(self) -> None:
+        now = self.clock()
+        for key in [k for k, (expires, _) in self._entries.items() if expires <= now]:
+            del self._entries[key]
+        # Still full of live entries: drop the ones closest to expiring
+        while len(self._entries) >= self.max_entries:
+            del self._entries[min(self._entries, key=lambda k: self._entries[k][0])]
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    async def get_or_fetch(self, key: Hashable, fetch: Callable[[], Awaitable[Any]], force: bool = False) -> Any:
+        """Cached value for ``key``, calling ``fetch`` on a miss (always when ``force``)."""
+        if not force:
+            value = self.get(key)
+            record_cache("market", value is not None)
+            if value is not None:
+                return value
+        while True:
+            pending = self._inflight.get(key)
+            if pending is None:
+                break
+            try:
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                if not pending.cancelled():
+                    raise
+                # The task fetching for us was cancelled, not this one: take over
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await fetch()
+        except Exception as e:
+            future.set_exception(e)
+            # Nobody else may be waiting; avoid "exception was never retrieved"
+            future.exception()
+            raise
+        except BaseException:
+            # Cancellation belongs to this task alone; a waiter retries the fetch
+            future.cancel()
+            raise
+        else:
+            self.put(key, value)
+            future.set_result(value)
+            return value
+        finally:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+
+    async def market_data(self, plugin, symbol: str, force: bool = False):
+        return await self.get_or_fetch(("quote", symbol), lambda: plugin.get_market_data(symbol), force)
+
+    async def option_chain(self, plugin, symbol: str, expiration: datetime, force: bool = False):
+        key = ("chain", symbol, expiration.date())
+        return await self.get_or_fetch(key, lambda: plugin.get_option_chain(symbol, expiration), force)
+
+    async def historical_data(self, plugin, symbol: str, period: str, force: bool = False):
+        key = ("history", symbol, period)
+        return await self.get_or_fetch(key, lambda: plugin.get_historical_data(symbol, period), force)
+
+    def put_quote(self, md) -> None:
+        self.put(("quote", md.symbol), md)
+
+
+_market_cache: Optional[MarketCache] = None
+
+
+def get_market_cache() -> MarketCache:
+    """The process-wide market cache, created on first use."""
+    global _market_cache
+    if _market_cache is None:
+        _market_cache = MarketCache(
+            quote_ttl=settings.market_cache_quote_ttl,
+            chain_ttl=settings.market_cache_chain_ttl,
+            history_ttl=settings.market_cache_history_ttl,
+            max_entries=settings.market_cache_max_entries,
+        )
+    return _market_cache
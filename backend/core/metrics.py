@@ -0,0 +1,276 @@
+import functools
+import time
+from bisect import bisect_left
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+# Latency buckets in seconds, from sub-millisecond cache hits to slow upstream calls
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    parts = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Metric:
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+
+    def header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+
+    def render(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """Monotonically increasing value per label set."""
+    kind = "counter"
+
+    def __init__(self, name, documentation, labelnames=()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def get(self, *labels: str) -> float:
+        return self._values.get(labels, 0.0)
+
+    def render(self) -> List[str]:
+        return [
+            f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}"
+            for labels, value in sorted(self._values.items())
+        ]
+
+
+class Gauge(_Metric):
+    """Value that can go up and down, or is read from a callback at scrape time."""
+    kind = "gauge"
+
+    def __init__(self, name, documentation, labelnames=()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+        self._callback: Optional[Callable[[], Iterable[Tuple[Tuple[str, ...], float]]]] = None
+
+    def set(self, value: float, *labels: str) -> None:
+        self._values[labels] = value
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def dec(self, *labels: str, amount: float = 1.0) -> None:
+        self.inc(*labels, amount=-amount)
+
+    def get(self, *labels: str) -> float:
+        return self._values.get(labels, 0.0)
+
+    def set_function(self, callback: Callable[[], Iterable[Tuple[Tuple[str, ...], float]]]) -> None:
+        """Compute ``(labels, value)`` pairs lazily when the registry is rendered."""
+        self._callback = callback
+
+    def render(self) -> List[str]:
+        values = dict(self._values)
+        if self._callback is not None:
+            values.update(self._callback())
+        return [
+            f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}"
+            for labels, value in sorted(values.items())
+        ]
+
+
+class Histogram(_Metric):
+    """Bucketed distribution; an observation is one bisect and three additions."""
+    kind = "histogram"
+
+    def __init__(self, name, documentation, labelnames=(), buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # labels -> [per-bucket counts..., +Inf count, sum]
+        self._series: Dict[Tuple[str, ...], List[float]] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        series = self._series.get(labels)
+        if series is None:
+            series = self._series[labels] = [0] * (len(self.buckets) + 1) + [0.0]
+        series[bisect_left(self.buckets, value)] += 1
+        series[-1] += value
+
+    def count(self, *labels: str) -> int:
+        series = self._series.get(labels)
+        return int(sum(series[:-1])) if series else 0
+
+    def time(self, *labels: str) -> "_Timer":
+        return _Timer(self, labels)
+
+    def render(self) -> List[str]:
+        lines = []
+        for labels, series in sorted(self._series.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), series[:-1]):
+                cumulative += count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, labels, le)} {cumulative}")
+            label_text = _format_labels(self.labelnames, labels)
+            lines.append(f"{self.name}_sum{label_text} {_format_value(series[-1])}")
+            lines.append(f"{self.name}_count{label_text} {cumulative}")
+        return lines
+
+
+class _Timer:
+    def __init__(self, histogram: Histogram, labels: Tuple[str, ...]):
+        self.histogram = histogram
+        self.labels = labels
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.histogram.observe(time.perf_counter() - self.start, *self.labels)
+        return False
+
+
+class MetricsRegistry:
+    """Holds metrics and renders them in the Prometheus text exposition format."""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+
+    def _register(self, metric: _Metric) -> _Metric:
+        existing = self._metrics.get(metric.name)
+        if existing is not None:
+            return existing
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for metric in self._metrics.values():
+            lines.extend(metric.header())
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+REQUEST_LATENCY = registry.histogram(
+    "http_request_duration_seconds", "HTTP request latency by route and status", ("method", "route", "status")
+)
+PLUGIN_LATENCY = registry.histogram(
+    "plugin_call_duration_seconds", "Plugin method latency", ("plugin", "method")
+)
+PLUGIN_ERRORS = registry.counter(
+    "plugin_call_errors_total", "Plugin method calls that raised", ("plugin", "method")
+)
+CACHE_REQUESTS = registry.counter(
+    "cache_requests_total", "Cache lookups by outcome", ("cache", "result")
+)
+CACHE_HIT_RATIO = registry.gauge("cache_hit_ratio", "Share of cache lookups served from cache", ("cache",))
+WEBSOCKET_CLIENTS = registry.gauge("websocket_clients", "Connected WebSocket clients")
+QUEUE_DEPTH = registry.gauge("queue_depth", "Items waiting in internal queues", ("queue",))
+JOB_DURATION = registry.histogram(
+    "scheduler_job_duration_seconds", "Scheduler job run time", ("job",),
+    buckets=(0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0, 300.0),
+)
+JOB_ERRORS = registry.counter("scheduler_job_errors_total", "Scheduler job runs that raised", ("job",))
+JOB_SKIPPED = registry.counter(
+    "scheduler_job_skipped_total", "Scheduler runs skipped as late or overlapping", ("job", "reason")
+)
+JOB_LAST_DURATION = registry.gauge("scheduler_job_last_duration_seconds", "Run time of the latest job run", ("job",))
+STARTUP_PHASE = registry.gauge("startup_phase_seconds", "Time spent in each cold-start phase", ("phase",))
+
+
+def _hit_ratios():
+    totals: Dict[str, List[float]] = {}
+    for (cache, result), value in CACHE_REQUESTS._values.items():
+        hits_total = totals.setdefault(cache, [0.0, 0.0])
+        hits_total[1] += value
+        if result == "hit":
+            hits_total[0] += value
+    return [((cache,), hits / total) for cache, (hits, total) in totals.items() if total]
+
+
+CACHE_HIT_RATIO.set_function(_hit_ratios)
+
+
+# job id -> last start (epoch), duration, error and run count, for /api/admin/jobs
+job_runs: Dict[str, Dict[str, Any]] = {}
+
+
+def record_cache(cache: str, hit: bool) -> None:
+    CACHE_REQUESTS.inc(cache, "hit" if hit else "miss")
+
+
+def timed_plugin_method(plugin: str, method: str, func: Callable) -> Callable:
+    """Wrap an async plugin method so every call lands in ``PLUGIN_LATENCY``."""
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return await func(*args, **kwargs)
+        except Exception:
+            PLUGIN_ERRORS.inc(plugin, method)
+            raise
+        finally:
+            PLUGIN_LATENCY.observe(time.perf_counter() - start, plugin, method)
+
+    wrapper._timed = True
+    return wrapper
+
+
+def timed_job(job_id: str, func: Callable) -> Callable:
+    """Wrap an async scheduler job so its run time lands in ``JOB_DURATION`` and ``job_runs``."""
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        run = job_runs.setdefault(job_id, {"runs": 0, "errors": 0})
+        run["last_start"] = time.time()
+        start = time.perf_counter()
+        error = None
+        try:
+            return await func(*args, **kwargs)
+        except Exception as e:
+            JOB_ERRORS.inc(job_id)
+            error = repr(e)
+            run["errors"] += 1
+            raise
+        finally:
+            duration = time.perf_counter() - start
+            JOB_DURATION.observe(duration, job_id)
+            JOB_LAST_DURATION.set(duration, job_id)
+            run.update(runs=run["runs"] + 1, last_duration=round(duration, 6), last_error=error)
+
+    return wrapper
@@ -1,5 +1,6 @@
+import asyncio
 import importlib
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Set
 import logging
 from core.config import settings
 
@@ -9,8 +10,26 @@ class PluginOrchestrator:
     """Dynamically loads and manages plugins"""
     
     def __init__(self):
-        self.plugins: Dict[str, Any] = {}
-        self._load_plugins()
+        # Plugin modules (and yfinance, scipy, ...) are imported on first access
+        self._plugins: Optional[Dict[str, Any]] = None
+        # name -> pending | ready | failed | timeout | blocked | stopped
+        self.status: Dict[str, str] = {}
+        self.errors: Dict[str, str] = {}
+        self._settled: Dict[str, asyncio.Event] = {}
+        # Plugins whose setup began and so may hold resources until shut down
+        self._started: Set[str] = set()
+        self._background: Set[asyncio.Task] = set()
+
+    @property
+    def plugins(self) -> Dict[str, Any]:
+        if self._plugins is None:
+            self._plugins = {}
+            self._load_plugins()
+        return self._plugins
+
+    @plugins.setter
+    def plugins(self, plugins: Dict[str, Any]) -> None:
+        self._plugins = plugins
     
     def _load_plugins(self):
         """Load configured plugins"""
@@ -27,18 +46,152 @@ class PluginOrchestrator:
             try:
                 module = importlib.import_module(module_path)
                 plugin_class = getattr(module, f"{name.title()}Plugin")
-                self.plugins[name] = plugin_class(settings.dict())
+                self.plugins[name] = plugin_class(settings.model_dump())
                 logger.info(f"Loaded plugin: {name} from {module_path}")
             except Exception as e:
                 logger.error(f"Failed to load plugin {name}: {e}")
     
-    async def initialize_all(self):
-        """Initialize all plugins"""
-        for name, plugin in self.plugins.items():
-            await plugin.initialize()
+    def is_optional(self, name: str) -> bool:
+        plugin = self.plugins.get(name)
+        return name in settings.optional_plugins or bool(getattr(plugin, "optional", False))
+
+    def dependency_levels(self) -> List[List[str]]:
+        """Group plugins so each level only requires plugins from earlier levels"""
+        requires = {
+            name: [dep for dep in getattr(plugin, "requires", ()) if dep in self.plugins]
+            for name, plugin in self.plugins.items()
+        }
+        levels: List[List[str]] = []
+        placed: Set[str] = set()
+        while len(placed) < len(requires):
+            level = [n for n, deps in requires.items() if n not in placed and placed.issuperset(deps)]
+            if not level:
+                cycle = sorted(set(requires) - placed)
+                raise ValueError(f"Plugin dependency cycle among: {', '.join(cycle)}")
+            levels.append(level)
+            placed.update(level)
+        return levels
+
+    async def initialize_all(self) -> Dict[str, str]:
+        """Initialize plugins concurrently, each as soon as its dependencies are ready.
+
+        Required plugins run in a task group that startup waits for; optional
+        plugins finish in the background so a slow broker login never holds up
+        readiness.  A failed required plugin is logged and leaves the app
+        running but not ready, so ``/ready`` reports it with a 503.
+        """
+        names = [name for level in self.dependency_levels() for name in level]
+        for name in names:
+            if self.status.get(name) == "ready" and self.plugins[name]._initialized:
+                continue
+            self.status[name] = "pending"
+            self.errors.pop(name, None)
+            self._settled[name] = asyncio.Event()
+
+        async with asyncio.TaskGroup() as group:
+            for name in names:
+                if self.status[name] != "pending":
+                    continue
+                if self.is_optional(name):
+                    task = asyncio.create_task(self._initialize_plugin(name), name=f"init-{name}")
+                    self._background.add(task)
+                    task.add_done_callback(self._background.discard)
+                else:
+                    group.create_task(self._initialize_plugin(name), name=f"init-{name}")
+
+        failed = [name for name in names if not self.is_optional(name) and self.status[name] != "ready"]
+        if failed:
+            details = "; ".join(f"{name}: {self.errors.get(name, self.status[name])}" for name in failed)
+            logger.error(f"Required plugins failed to initialize, not ready: {details}")
+        return dict(self.status)
+
+    async def _initialize_plugin(self, name: str) -> None:
+        plugin = self.plugins[name]
+        timeout = getattr(plugin, "init_timeout", None) or settings.plugin_init_timeout
+        try:
+            missing = [dep for dep in getattr(plugin, "requires", ()) if dep not in self.plugins]
+            for dep in getattr(plugin, "requires", ()):
+                if dep in self._settled:
+                    await self._settled[dep].wait()
+            blocked = missing + [
+                dep for dep in getattr(plugin, "requires", ()) if dep in self.plugins and self.status.get(dep) != "ready"
+            ]
+            if blocked:
+                self._settle(name, "blocked", f"requires {', '.join(blocked)}")
+                return
+            self._started.add(name)
+            async with asyncio.timeout(timeout):
+                await plugin.initialize()
+            self._settle(name, "ready")
+        except TimeoutError:
+            self._settle(name, "timeout", f"initialization exceeded {timeout}s")
+        except Exception as e:
+            self._settle(name, "failed", str(e) or e.__class__.__name__)
+        finally:
+            # Unblock dependents even when this task is cancelled mid-setup
+            self._settled[name].set()
+
+    def _settle(self, name: str, status: str, error: Optional[str] = None) -> None:
+        self.status[name] = status
+        if error is None:
+            logger.info(f"Plugin {name} ready")
+            return
+        self.errors[name] = error
+        if self.is_optional(name):
+            logger.warning(f"Optional plugin {name} {status}: {error}")
+        else:
+            logger.error(f"Plugin {name} {status}: {error}")
+
+    async def shutdown_all(self) -> None:
+        """Shut plugins down in reverse dependency order, each level concurrently"""
+        for task in list(self._background):
+            task.cancel()
+        if self._background:
+            await asyncio.gather(*self._background, return_exceptions=True)
+
+        for level in reversed(self.dependency_levels()):
+            # Includes plugins that timed out or failed part-way through setup
+            targets = [name for name in level if name in self._started]
+            await asyncio.gather(*(self._shutdown_plugin(name) for name in targets))
+
+    async def _shutdown_plugin(self, name: str) -> None:
+        try:
+            async with asyncio.timeout(settings.plugin_shutdown_timeout):
+                await self.plugins[name].shutdown()
+        except Exception as e:
+            logger.error(f"Plugin {name} failed to shut down cleanly: {e!r}")
+        self.plugins[name]._initialized = False
+        self._started.discard(name)
+        self.status[name] = "stopped"
+
+    def readiness(self) -> Dict[str, Any]:
+        """Ready once every required plugin is; failed optional plugins only degrade"""
+        plugins = {
+            name: {
+                "status": self.status.get(name, "pending"),
+                "optional": self.is_optional(name),
+                **({"error": self.errors[name]} if name in self.errors else {}),
+            }
+            for name in self.plugins
+        }
+        ready = all(p["status"] == "ready" for p in plugins.values() if not p["optional"])
+        degraded = any(p["status"] != "ready" for p in plugins.values() if p["optional"])
+        return {"ready": ready, "degraded": degraded, "plugins": plugins}
     
     def get_plugin(self, name: str):
         """Get a specific plugin"""
         return self.plugins.get(name)
 
+    def build_pipeline(self, concurrency: Optional[Dict[str, int]] = None, execute_orders: bool = False):
+        """Connect the loaded plugins into a streaming trade pipeline"""
+        from core.pipeline import build_trade_pipeline
+
+        return build_trade_pipeline(
+            self.plugins,
+            settings.model_dump(),
+            concurrency=concurrency,
+            queue_size=settings.pipeline_queue_size,
+            execute_orders=execute_orders,
+        )
+
 orchestrator = PluginOrchestrator()
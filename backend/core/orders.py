@@ -0,0 +1,335 @@
+import asyncio
+import logging
+import uuid
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+from core.broadcast import broadcaster
+from core.config import settings
+from core.metrics import QUEUE_DEPTH
+from core.orchestrator import orchestrator
+from core.rate_limit import TokenBucket
+from models import database
+from models.database import Order, Trade
+from plugins.execution.base import (
+    BrokerRateLimitError,
+    OrderUpdate,
+    CANCELLED,
+    FILLED,
+    PARTIALLY_FILLED,
+    REJECTED,
+    SUBMITTED,
+)
+
+logger = logging.getLogger(__name__)
+
+QUEUED = "QUEUED"
+CANCEL_REQUESTED = "CANCEL_REQUESTED"
+FINAL_STATUSES = (FILLED, CANCELLED, REJECTED)
+
+
+def order_to_dict(order: Order) -> Dict[str, Any]:
+    return {
+        "order_id": order.client_order_id,
+        "broker_order_id": order.broker_order_id,
+        "symbol": order.symbol,
+        "spread_type": order.spread_type,
+        "short_strike": order.short_strike,
+        "long_strike": order.long_strike,
+        "quantity": order.quantity,
+        "expiration": order.expiration_date.isoformat() if order.expiration_date else None,
+        "limit_credit": order.limit_credit,
+        "status": order.status,
+        "filled_quantity": order.filled_quantity or 0,
+        "avg_fill_price": order.avg_fill_price,
+        "commission": order.commission or 0.0,
+        "message": order.message,
+        "updated_at": order.updated_at.isoformat() if order.updated_at else None,
+    }
+
+
+class OrderManager:
+    """Persistent queue of orders worked through the executor plugin.
+
+    The ``orders`` table is the queue: new orders are stored as QUEUED, so
+    they survive restarts and can be placed from any worker.  One loop (on the
+    leader) submits queued orders under a token-bucket rate limit, polls the
+    status of every working order in a single batched broker call per
+    interval, records fills in ``Trade`` and broadcasts each change.
+
+    Database work runs in worker threads (``asyncio.to_thread``) so a slow
+    database never stalls the event loop; broker calls and broadcasts stay on
+    the loop.
+    """
+
+    def __init__(
+        self,
+        get_executor: Callable[[], Any],
+        limiter: Optional[TokenBucket] = None,
+        poll_interval: Optional[float] = None,
+        max_attempts: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        publish: Callable[[Dict[str, Any]], None] = broadcaster.publish,
+        session_factory: Optional[Callable[[], Any]] = None,
+    ):
+        self.get_executor = get_executor
+        self.session_factory = session_factory
+        # Unset limits are read from settings when the manager first runs
+        self.limiter = limiter
+        self.poll_interval = poll_interval
+        self.max_attempts = max_attempts
+        self.batch_size = batch_size
+        self.publish = publish
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    def _session(self):
+        return (self.session_factory or database.get_sessionmaker())()
+
+    async def place(self, order: Dict[str, Any]) -> Dict[str, Any]:
+        """Store a new order as QUEUED and wake the submit loop."""
+        data = await asyncio.to_thread(self._store, order)
+        self._notify([data])
+        self._wakeup.set()
+        return data
+
+    def _store(self, order: Dict[str, Any]) -> Dict[str, Any]:
+        with self._session() as db:
+            row = Order(
+                client_order_id=f"ORD-{uuid.uuid4().hex[:16]}",
+                symbol=order.get("symbol", settings.symbol),
+                spread_type=order["spread_type"],
+                short_strike=order["short_strike"],
+                long_strike=order["long_strike"],
+                quantity=order["quantity"],
+                expiration_date=order.get("expiration"),
+                order_type=order.get("order_type", "LIMIT"),
+                limit_credit=order.get("limit_credit"),
+                status=QUEUED,
+                filled_quantity=0,
+                commission=0.0,
+                attempts=0,
+            )
+            db.add(row)
+            db.commit()
+            return order_to_dict(row)
+
+    def get(self, order_id: str) -> Optional[Dict[str, Any]]:
+        with self._session() as db:
+            row = db.query(Order).filter(Order.client_order_id == order_id).one_or_none()
+            return order_to_dict(row) if row else None
+
+    def list(self, status: Optional[str] = None, limit: int = 100) -> List[Dict[str, Any]]:
+        with self._session() as db:
+            query = db.query(Order)
+            if status:
+                query = query.filter(Order.status == status.upper())
+            return [order_to_dict(row) for row in query.order_by(Order.id.desc()).limit(limit)]
+
+    async def cancel(self, order_id: str) -> Optional[Dict[str, Any]]:
+        """Cancel a queued order now, or flag a working one for the loop to cancel."""
+        data = await asyncio.to_thread(self._request_cancel, order_id)
+        if data is not None:
+            self._notify([data])
+            self._wakeup.set()
+        return data
+
+    def _request_cancel(self, order_id: str) -> Optional[Dict[str, Any]]:
+        with self._session() as db:
+            row = db.query(Order).filter(Order.client_order_id == order_id).one_or_none()
+            if row is None:
+                return None
+            if row.status == QUEUED:
+                row.status = CANCELLED
+            elif row.status in (SUBMITTED, PARTIALLY_FILLED):
+                row.status = CANCEL_REQUESTED
+            db.commit()
+            return order_to_dict(row)
+
+    def _configure(self) -> None:
+        if self.limiter is None:
+            self.limiter = TokenBucket(rate=settings.order_rate_limit, capacity=settings.order_burst)
+        if self.poll_interval is None:
+            self.poll_interval = settings.order_poll_seconds
+        if self.max_attempts is None:
+            self.max_attempts = settings.order_max_attempts
+        if self.batch_size is None:
+            self.batch_size = settings.order_batch_size
+
+    async def start(self) -> None:
+        self._configure()
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="order-manager")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.process_once()
+            except Exception as e:
+                logger.error(f"Order processing failed: {e}")
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+
+    async def process_once(self) -> None:
+        """Submit queued orders, send pending cancels, then poll working orders."""
+        self._configure()
+        executor = self.get_executor()
+        if executor is None:
+            return
+        # The session is used by one thread at a time: queries and commits run
+        # off-loop, while the loop only edits the loaded rows between them
+        with self._session() as db:
+            for stage in (self._submit_queued, self._send_cancels, self._poll_working):
+                changed = await stage(db, executor)
+                self._notify(await asyncio.to_thread(self._commit, db, changed))
+            await asyncio.to_thread(self._record_depth, db)
+
+    def _commit(self, db, changed: List[Order]) -> List[Dict[str, Any]]:
+        """Record the fills of changed orders, commit and return their new state."""
+        for row in changed:
+            if row.filled_quantity:
+                self._record_fill(db, row)
+        db.commit()
+        return [order_to_dict(row) for row in changed]
+
+    @staticmethod
+    def _record_depth(db) -> None:
+        QUEUE_DEPTH.set(db.query(Order).filter(Order.status == QUEUED).count(), "orders.queued")
+        QUEUE_DEPTH.set(
+            db.query(Order).filter(Order.status.in_((SUBMITTED, PARTIALLY_FILLED, CANCEL_REQUESTED))).count(),
+            "orders.working",
+        )
+
+    async def _submit_queued(self, db, executor) -> List[Order]:
+        query = db.query(Order).filter(Order.status == QUEUED).order_by(Order.id).limit(self.batch_size)
+        queued = await asyncio.to_thread(query.all)
+        results = await asyncio.gather(*(self._submit(db, executor, row) for row in queued))
+        return [row for row, changed in zip(queued, results) if changed]
+
+    async def _submit(self, db, executor, row: Order) -> bool:
+        await self.limiter.acquire()
+        row.attempts = (row.attempts or 0) + 1
+        payload = {
+            "client_order_id": row.client_order_id,
+            "symbol": row.symbol,
+            "spread_type": row.spread_type,
+            "short_strike": row.short_strike,
+            "long_strike": row.long_strike,
+            "quantity": row.quantity,
+            "expiration": row.expiration_date,
+            "order_type": row.order_type,
+            "limit_credit": row.limit_credit,
+        }
+        try:
+            update = await executor.submit_order(payload)
+        except BrokerRateLimitError as e:
+            # Not the order's fault: leave it queued for the next cycle
+            row.attempts -= 1
+            row.message = str(e)
+            return False
+        except Exception as e:
+            row.message = str(e)
+            if row.attempts < self.max_attempts:
+                return False
+            row.status = REJECTED
+            return True
+        row.broker_order_id = update.order_id
+        return self._apply(row, update, force=True)
+
+    async def _send_cancels(self, db, executor) -> List[Order]:
+        pending = await asyncio.to_thread(db.query(Order).filter(Order.status == CANCEL_REQUESTED).limit(self.batch_size).all)
+        changed = []
+        for row in pending:
+            await self.limiter.acquire()
+            try:
+                update = await executor.cancel_order(row.broker_order_id)
+            except Exception as e:
+                logger.warning(f"Cancel failed for {row.client_order_id}: {e}")
+                continue
+            if self._apply(row, update):
+                changed.append(row)
+        return changed
+
+    async def _poll_working(self, db, executor) -> List[Order]:
+        query = db.query(Order).filter(Order.status.in_((SUBMITTED, PARTIALLY_FILLED))).order_by(Order.id)
+        working = await asyncio.to_thread(query.all)
+        changed = []
+        for start in range(0, len(working), self.batch_size):
+            batch = working[start:start + self.batch_size]
+            await self.limiter.acquire()
+            try:
+                updates = await executor.get_order_statuses([row.broker_order_id for row in batch])
+            except Exception as e:
+                logger.warning(f"Order status poll failed: {e}")
+                break
+            for row in batch:
+                update = updates.get(row.broker_order_id)
+                if update is not None and self._apply(row, update):
+                    changed.append(row)
+        return changed
+
+    def _apply(self, row: Order, update: OrderUpdate, force: bool = False) -> bool:
+        """Copy a broker update onto the order; True if anything changed.
+
+        Only edits the loaded row: fills are recorded when the stage commits.
+        """
+        status = update.status
+        # A cancel in flight stays requested until the broker reports a final state
+        if row.status == CANCEL_REQUESTED and status not in FINAL_STATUSES:
+            status = CANCEL_REQUESTED
+        new_fill = update.filled_quantity > (row.filled_quantity or 0)
+        if not (force or new_fill or status != row.status):
+            return False
+        row.status = status
+        row.filled_quantity = update.filled_quantity
+        row.avg_fill_price = update.avg_fill_price
+        row.commission = update.commission
+        row.message = update.message or row.message
+        row.updated_at = datetime.utcnow()
+        return True
+
+    def _record_fill(self, db, row: Order) -> None:
+        trade = db.query(Trade).filter(Trade.order_id == row.client_order_id).one_or_none()
+        if trade is None:
+            trade = Trade(
+                order_id=row.client_order_id,
+                symbol=row.symbol,
+                trade_type=row.spread_type,
+                short_strike=row.short_strike,
+                long_strike=row.long_strike,
+                expiration_date=row.expiration_date,
+                entry_date=datetime.utcnow(),
+                status="OPEN",
+            )
+            db.add(trade)
+        trade.quantity = row.filled_quantity
+        trade.entry_credit = row.avg_fill_price
+        trade.commission = row.commission
+        db.flush()
+        logger.info(f"Order {row.client_order_id} filled {row.filled_quantity}/{row.quantity} @ {row.avg_fill_price}")
+
+    def _notify(self, orders: List[Dict[str, Any]]) -> None:
+        for order in orders:
+            self.publish({"type": "order_update", "data": order})
+
+
+def _ready_executor():
+    """The executor plugin once it has initialized (it is optional and may still be starting)."""
+    if orchestrator.status.get("executor") != "ready":
+        return None
+    return orchestrator.get_plugin("executor")
+
+
+order_manager = OrderManager(_ready_executor)
@@ -0,0 +1,294 @@
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, List, Optional
+
+from core.metrics import QUEUE_DEPTH
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+StageHandler = Callable[[Dict[str, Any]], Awaitable[Optional[Dict[str, Any]]]]
+
+# Marker pushed through the queues once the upstream stage has drained
+_DONE = object()
+
+
+@dataclass
+class PipelineStage:
+    """A named async step with its own worker pool and bounded input queue."""
+    name: str
+    handler: StageHandler
+    concurrency: int = 1
+    queue_size: int = 8
+
+
+@dataclass
+class StageStats:
+    """Runtime counters collected for a single pipeline stage."""
+    name: str
+    concurrency: int
+    processed: int = 0
+    dropped: int = 0
+    errors: int = 0
+    total_latency: float = 0.0
+    max_latency: float = 0.0
+    queue_depth: int = 0
+    max_queue_depth: int = 0
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+
+    def record(self, latency: float) -> None:
+        self.processed += 1
+        self.total_latency += latency
+        if latency > self.max_latency:
+            self.max_latency = latency
+
+    def to_dict(self) -> Dict[str, Any]:
+        elapsed = 0.0
+        if self.started_at is not None:
+            elapsed = (self.finished_at or time.perf_counter()) - self.started_at
+        return {
+            "stage": self.name,
+            "concurrency": self.concurrency,
+            "processed": self.processed,
+            "dropped": self.dropped,
+            "errors": self.errors,
+            "throughput_per_sec": self.processed / elapsed if elapsed > 0 else 0.0,
+            "avg_latency_ms": 1000 * self.total_latency / self.processed if self.processed else 0.0,
+            "max_latency_ms": 1000 * self.max_latency,
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+        }
+
+
+@dataclass
+class _StageRuntime:
+    stage: PipelineStage
+    stats: StageStats
+    queue: asyncio.Queue
+    active_workers: int = 0
+
+
+class PluginPipeline:
+    """Runs items through a chain of stages joined by bounded asyncio queues.
+
+    Every stage owns ``concurrency`` workers, so stage N can work on the next
+    symbol while stage N+1 is still busy with the previous one.  Bounded
+    queues provide backpressure: a slow stage blocks the ``put`` of the stage
+    feeding it instead of letting work pile up in memory.
+    """
+
+    def __init__(self, stages: List[PipelineStage], output_queue_size: int = 32):
+        if not stages:
+            raise ValueError("Pipeline needs at least one stage")
+        self.stages = stages
+        self.output_queue_size = output_queue_size
+        self.errors: List[Dict[str, Any]] = []
+        self._runtimes: List[_StageRuntime] = []
+
+    def stats(self) -> List[Dict[str, Any]]:
+        """Per-stage throughput, queue depth and latency of the last run."""
+        for rt in self._runtimes:
+            rt.stats.queue_depth = rt.queue.qsize()
+        return [rt.stats.to_dict() for rt in self._runtimes]
+
+    async def run(self, symbols: Iterable[str]) -> List[Dict[str, Any]]:
+        """Process every symbol and return the items that reached the end."""
+        return [item async for item in self.stream(symbols)]
+
+    async def stream(self, symbols: Iterable[str]) -> AsyncIterator[Dict[str, Any]]:
+        """Yield items as soon as they leave the last stage."""
+        self.errors = []
+        self._runtimes = [
+            _StageRuntime(
+                stage=stage,
+                stats=StageStats(name=stage.name, concurrency=stage.concurrency),
+                queue=asyncio.Queue(maxsize=stage.queue_size),
+            )
+            for stage in self.stages
+        ]
+        output: asyncio.Queue = asyncio.Queue(maxsize=self.output_queue_size)
+
+        tasks = [asyncio.create_task(self._feed(symbols))]
+        for index, rt in enumerate(self._runtimes):
+            downstream = self._runtimes[index + 1] if index + 1 < len(self._runtimes) else None
+            rt.active_workers = rt.stage.concurrency
+            for _ in range(rt.stage.concurrency):
+                tasks.append(asyncio.create_task(self._worker(rt, downstream, output)))
+
+        try:
+            while True:
+                item = await output.get()
+                if item is _DONE:
+                    break
+                yield item
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _feed(self, symbols: Iterable[str]) -> None:
+        first = self._runtimes[0]
+        for symbol in symbols:
+            await first.queue.put({"symbol": symbol})
+        for _ in range(first.stage.concurrency):
+            await first.queue.put(_DONE)
+
+    async def _worker(
+        self,
+        rt: _StageRuntime,
+        downstream: Optional[_StageRuntime],
+        output: asyncio.Queue,
+    ) -> None:
+        stats = rt.stats
+        while True:
+            item = await rt.queue.get()
+            if item is _DONE:
+                break
+            if stats.started_at is None:
+                stats.started_at = time.perf_counter()
+            depth = rt.queue.qsize()
+            stats.queue_depth = depth
+            QUEUE_DEPTH.set(depth, f"pipeline.{rt.stage.name}")
+            if depth > stats.max_queue_depth:
+                stats.max_queue_depth = depth
+
+            start = time.perf_counter()
+            try:
+                result = await rt.stage.handler(item)
+            except Exception as e:
+                stats.errors += 1
+                self.errors.append({"stage": rt.stage.name, "symbol": item.get("symbol"), "error": str(e)})
+                logger.warning(f"Pipeline stage {rt.stage.name} failed for {item.get('symbol')}: {e}")
+                continue
+            stats.record(time.perf_counter() - start)
+
+            if result is None:
+                stats.dropped += 1
+                continue
+            if downstream is not None:
+                await downstream.queue.put(result)
+            else:
+                await output.put(result)
+
+        # The last worker out signals the next stage (or the consumer) to stop
+        rt.active_workers -= 1
+        if rt.active_workers == 0:
+            stats.finished_at = time.perf_counter()
+            if downstream is not None:
+                for _ in range(downstream.stage.concurrency):
+                    await downstream.queue.put(_DONE)
+            else:
+                await output.put(_DONE)
+
+
+def normalize_ohlc(df: "pd.DataFrame") -> "pd.DataFrame":
+    """Lower-case OHLC column names so provider frames fit the indicator helpers."""
+    import pandas as pd
+
+    if df is None or df.empty:
+        return pd.DataFrame()
+    if isinstance(df.columns, pd.MultiIndex):
+        df = df.droplevel(-1, axis=1)
+    return df.rename(columns=lambda c: str(c).lower())
+
+
+def build_trade_pipeline(
+    plugins: Dict[str, Any],
+    config: Dict[str, Any],
+    concurrency: Optional[Dict[str, int]] = None,
+    queue_size: int = 16,
+    execute_orders: bool = False,
+) -> PluginPipeline:
+    """Wire data -> technical -> signals -> selector -> risk -> executor plugins."""
+    concurrency = concurrency or {}
+    default_concurrency = config.get("pipeline_concurrency", 4)
+    history_period = config.get("pipeline_history_period", "3mo")
+
+    async def data_stage(item: Dict[str, Any]) -> Dict[str, Any]:
+        data = plugins["data"]
+        symbol = item["symbol"]
+        expiration = datetime.utcnow() + timedelta(days=config.get("dte_min", 30))
+        md, history, chain = await asyncio.gather(
+            data.get_market_data(symbol),
+            data.get_historical_data(symbol, history_period),
+            data.get_option_chain(symbol, expiration),
+        )
+        item.update(
+            market_data=md,
+            price_data=normalize_ohlc(history),
+            option_chain=chain,
+            expiration=expiration.date().isoformat(),
+        )
+        return item
+
+    async def technical_stage(item: Dict[str, Any]) -> Dict[str, Any]:
+        price_data = item["price_data"]
+        if {"high", "low", "close"}.issubset(price_data.columns):
+            item["technical"] = await plugins["technical"].execute(price_data)
+        else:
+            item["technical"] = {}
+        return item
+
+    async def signals_stage(item: Dict[str, Any]) -> Dict[str, Any]:
+        md = item["market_data"]
+        item["signal"] = await plugins["signals"].execute({
+            "symbol": md.symbol,
+            "price": md.price,
+            "vix": md.vix,
+            "atr": md.atr,
+            "technical": item["technical"],
+            "price_data": item["price_data"],
+        })
+        return item
+
+    async def selector_stage(item: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        chain = item["option_chain"]
+        spread = await plugins["selector"].execute({
+            "symbol": chain.symbol,
+            "underlying_price": chain.underlying_price,
+            "puts": chain.puts,
+            "calls": chain.calls,
+            "bias": item["signal"].get("bias"),
+            "expiration": item["expiration"],
+        })
+        if not spread:
+            return None
+        item["spread"] = spread
+        return item
+
+    async def risk_stage(item: Dict[str, Any]) -> Dict[str, Any]:
+        item["risk"] = await plugins["risk"].execute(dict(item["spread"], symbol=item["symbol"]))
+        return item
+
+    async def executor_stage(item: Dict[str, Any]) -> Dict[str, Any]:
+        if execute_orders and item["risk"].get("approved"):
+            item["order"] = await plugins["executor"].execute(dict(item["spread"], symbol=item["symbol"]))
+        return item
+
+    handlers = [
+        ("data", data_stage),
+        ("technical", technical_stage),
+        ("signals", signals_stage),
+        ("selector", selector_stage),
+        ("risk", risk_stage),
+        ("executor", executor_stage),
+    ]
+    missing = [name for name, _ in handlers if name not in plugins]
+    if missing:
+        raise ValueError(f"Pipeline requires plugins that are not loaded: {', '.join(missing)}")
+
+    return PluginPipeline([
+        PipelineStage(
+            name=name,
+            handler=handler,
+            concurrency=concurrency.get(name, default_concurrency),
+            queue_size=queue_size,
+        )
+        for name, handler in handlers
+    ])
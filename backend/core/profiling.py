@@ -0,0 +1,157 @@
+import asyncio
+import os
+import sys
+import threading
+import time
+import tracemalloc
+import uuid
+from collections import Counter, OrderedDict
+from typing import Any, Callable, Dict, List, Optional
+
+# Path prefixes trimmed from frame labels to keep collapsed stacks readable
+_PATH_PREFIXES = sorted({p for p in sys.path if p and os.path.isdir(p)}, key=len, reverse=True)
+
+
+def _frame_label(code) -> str:
+    filename = code.co_filename
+    for prefix in _PATH_PREFIXES:
+        if filename.startswith(prefix):
+            filename = filename[len(prefix):].lstrip(os.sep)
+            break
+    return f"{code.co_name} ({filename}:{code.co_firstlineno})"
+
+
+class SamplingProfiler:
+    """Low-overhead wall-clock sampler producing flamegraph collapsed stacks.
+
+    A daemon thread wakes every ``interval`` seconds and records the Python
+    stack of every other thread via ``sys._current_frames()``.  The profiled
+    code is never instrumented, so overhead is bounded by the sample rate.
+    ``sample_filter`` lets callers keep only some samples, e.g. those taken
+    while a particular asyncio task is running.
+    """
+
+    def __init__(
+        self,
+        interval: float = 0.005,
+        thread_ids: Optional[List[int]] = None,
+        sample_filter: Optional[Callable[[], bool]] = None,
+    ):
+        self.interval = interval
+        self.thread_ids = set(thread_ids) if thread_ids else None
+        self.sample_filter = sample_filter
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self.duration = 0.0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "SamplingProfiler":
+        self._started = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> "SamplingProfiler":
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.duration = time.perf_counter() - self._started
+        return self
+
+    def _run(self) -> None:
+        own = threading.get_ident()
+        names = {}
+        while not self._stop.wait(self.interval):
+            if self.sample_filter is not None and not self.sample_filter():
+                continue
+            if len(names) != threading.active_count():
+                names = {t.ident: t.name for t in threading.enumerate()}
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own or (self.thread_ids is not None and thread_id not in self.thread_ids):
+                    continue
+                stack = []
+                while frame is not None:
+                    stack.append(_frame_label(frame.f_code))
+                    frame = frame.f_back
+                stack.append(names.get(thread_id, str(thread_id)))
+                self.stacks[";".join(reversed(stack))] += 1
+            self.samples += 1
+
+    def collapsed(self) -> str:
+        """Stacks in ``frame;frame;frame count`` format (flamegraph.pl, speedscope)."""
+        return "\n".join(f"{stack} {count}" for stack, count in self.stacks.most_common()) + "\n"
+
+
+def task_filter(loop: asyncio.AbstractEventLoop, task: asyncio.Task) -> Callable[[], bool]:
+    """Sample filter matching only while ``task`` is the loop's running task."""
+    return lambda: asyncio.current_task(loop) is task
+
+
+async def profile_cpu(seconds: float, interval: float = 0.005) -> SamplingProfiler:
+    """Sample every thread of the running process for ``seconds``."""
+    profiler = SamplingProfiler(interval=interval).start()
+    try:
+        await asyncio.sleep(seconds)
+    finally:
+        profiler.stop()
+    return profiler
+
+
+async def trace_allocations(seconds: float, top: int = 25, frames: int = 10) -> Dict[str, Any]:
+    """Diff two tracemalloc snapshots taken ``seconds`` apart."""
+    started_here = not tracemalloc.is_tracing()
+    if started_here:
+        tracemalloc.start(frames)
+    try:
+        before = tracemalloc.take_snapshot()
+        await asyncio.sleep(seconds)
+        after = tracemalloc.take_snapshot()
+    finally:
+        current, peak = tracemalloc.get_traced_memory()
+        if started_here:
+            tracemalloc.stop()
+
+    filters = [tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, "<frozen importlib._bootstrap>")]
+    before, after = before.filter_traces(filters), after.filter_traces(filters)
+
+    def site(stat) -> Dict[str, Any]:
+        frame = stat.traceback[0]
+        return {"file": frame.filename, "line": frame.lineno, "size_bytes": stat.size, "count": stat.count}
+
+    growth = [
+        dict(site(diff), size_diff_bytes=diff.size_diff, count_diff=diff.count_diff)
+        for diff in after.compare_to(before, "lineno")[:top]
+    ]
+    return {
+        "seconds": seconds,
+        "traced_current_bytes": current,
+        "traced_peak_bytes": peak,
+        "top_growth": growth,
+        "top_allocations": [site(stat) for stat in after.statistics("lineno")[:top]],
+    }
+
+
+class ProfileStore:
+    """Keeps the most recent per-request profiles for later download."""
+
+    def __init__(self, limit: int = 20):
+        self.limit = limit
+        self._profiles: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+    def new_id(self) -> str:
+        return uuid.uuid4().hex[:12]
+
+    def put(self, profile_id: str, profile: Dict[str, Any]) -> None:
+        self._profiles[profile_id] = profile
+        while len(self._profiles) > self.limit:
+            self._profiles.popitem(last=False)
+
+    def get(self, profile_id: str) -> Optional[Dict[str, Any]]:
+        return self._profiles.get(profile_id)
+
+
+profile_store = ProfileStore()
+
+# Only one process-wide CPU or allocation session may run at a time
+profile_lock = asyncio.Lock()
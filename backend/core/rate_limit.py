@@ -0,0 +1,41 @@
+import asyncio
+import time
+from typing import Callable
+
+
+class TokenBucket:
+    """Token-bucket rate limiter: ``rate`` tokens per second, bursts up to ``capacity``."""
+
+    def __init__(self, rate: float, capacity: float, clock: Callable[[], float] = time.monotonic):
+        if rate <= 0 or capacity < 1:
+            raise ValueError("rate must be positive and capacity at least 1")
+        self.rate = rate
+        self.capacity = capacity
+        self.clock = clock
+        self._tokens = float(capacity)
+        self._updated = clock()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = self.clock()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    @property
+    def tokens(self) -> float:
+        self._refill()
+        return self._tokens
+
+    def try_acquire(self, tokens: float = 1.0) -> bool:
+        """Take ``tokens`` now if available, without waiting."""
+        self._refill()
+        if self._tokens >= tokens:
+            self._tokens -= tokens
+            return True
+        return False
+
+    async def acquire(self, tokens: float = 1.0) -> None:
+        """Wait until ``tokens`` are available; waiters are served in FIFO order."""
+        async with self._lock:
+            while not self.try_acquire(tokens):
+                await asyncio.sleep((tokens - self._tokens) / self.rate)
@@ -0,0 +1,328 @@
+import asyncio
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from itertools import takewhile
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from core.config import settings
+from models import database
+from models.database import (
+    MarketSnapshot,
+    MarketSnapshot1d,
+    MarketSnapshot1h,
+    MarketSnapshot1m,
+    RollupWatermark,
+)
+
+logger = logging.getLogger(__name__)
+
+WATERMARK = "market_snapshots"
+MEANS = ("iv_rank", "vix", "signal_confidence")
+
+
+@dataclass(frozen=True)
+class Rollup:
+    name: str
+    model: Any
+    step: timedelta
+
+    def bucket(self, ts: datetime) -> datetime:
+        """Start of the bucket holding ``ts``."""
+        if self.step >= timedelta(days=1):
+            return ts.replace(hour=0, minute=0, second=0, microsecond=0)
+        if self.step >= timedelta(hours=1):
+            return ts.replace(minute=0, second=0, microsecond=0)
+        return ts.replace(second=0, microsecond=0)
+
+
+# Finest to coarsest
+ROLLUPS = (
+    Rollup("1m", MarketSnapshot1m, timedelta(minutes=1)),
+    Rollup("1h", MarketSnapshot1h, timedelta(hours=1)),
+    Rollup("1d", MarketSnapshot1d, timedelta(days=1)),
+)
+RESOLUTIONS = ("raw",) + tuple(r.name for r in ROLLUPS)
+
+
+def _retention(name: str) -> Optional[timedelta]:
+    days = settings.snapshot_retention_days.get(name)
+    return timedelta(days=days) if days is not None else None
+
+
+def _naive_utc(ts: datetime) -> datetime:
+    # Snapshot timestamps are stored as naive UTC
+    return ts.astimezone(timezone.utc).replace(tzinfo=None) if ts.tzinfo else ts
+
+
+def _combine(fn, a, b):
+    if a is None:
+        return b
+    if b is None:
+        return a
+    return fn(a, b)
+
+
+class _Bucket:
+    """Partial aggregate of the snapshots in one bucket, mergeable with another."""
+
+    __slots__ = ("open", "high", "low", "close", "means", "market_bias", "samples", "first_at", "last_at")
+
+    def __init__(self, row):
+        self.open = self.high = self.low = self.close = row.price
+        self.means = {name: (getattr(row, name), 1 if getattr(row, name) is not None else 0) for name in MEANS}
+        self.market_bias = row.market_bias
+        self.samples = 1
+        self.first_at = self.last_at = row.timestamp
+
+    def add(self, row) -> None:
+        price = row.price
+        self.high = _combine(max, self.high, price)
+        self.low = _combine(min, self.low, price)
+        if row.timestamp < self.first_at:
+            self.first_at, self.open = row.timestamp, price
+        if row.timestamp >= self.last_at:
+            self.last_at, self.close, self.market_bias = row.timestamp, price, row.market_bias
+        for name in MEANS:
+            value = getattr(row, name)
+            if value is not None:
+                mean, n = self.means[name]
+                self.means[name] = ((mean or 0.0) * n + value) / (n + 1), n + 1
+        self.samples += 1
+
+    def merge_into(self, target) -> None:
+        """Combine with an existing rollup row in place."""
+        if target.samples:
+            if target.first_at <= self.first_at:
+                self.open, self.first_at = target.open, target.first_at
+            if target.last_at > self.last_at:
+                self.close, self.market_bias, self.last_at = target.close, target.market_bias, target.last_at
+            self.high = _combine(max, self.high, target.high)
+            self.low = _combine(min, self.low, target.low)
+            for name in MEANS:
+                mean, n = self.means[name]
+                existing = getattr(target, name)
+                # The stored mean covers only the rows where the field was set
+                weight = getattr(target, f"{name}_samples") or 0
+                if existing is not None and weight:
+                    self.means[name] = (((mean or 0.0) * n + existing * weight) / (n + weight), n + weight)
+            self.samples += target.samples
+        target.open, target.high, target.low, target.close = self.open, self.high, self.low, self.close
+        for name in MEANS:
+            mean, n = self.means[name]
+            setattr(target, name, mean)
+            setattr(target, f"{name}_samples", n)
+        target.market_bias = self.market_bias
+        target.samples = self.samples
+        target.first_at, target.last_at = self.first_at, self.last_at
+
+
+class SnapshotRollup:
+    """Incrementally rolls ``market_snapshots`` up into 1m/1h/1d tables.
+
+    Each run reads only the raw rows with an id above the stored watermark,
+    aggregates them per symbol and bucket, merges those partial aggregates into
+    the existing bucket rows and advances the watermark in the same
+    transaction.  Retention then drops raw rows (only once rolled up) and
+    rollup buckets older than ``snapshot_retention_days``.
+
+    Ids are assigned at insert but become visible at commit, so a slow
+    transaction can commit a row below the watermark.  Rows younger than
+    ``lag`` seconds are therefore left for a later run; a row committed more
+    than ``lag`` seconds after its timestamp is still never rolled up.
+    """
+
+    def __init__(self, batch_size: int = 10_000, lag: float = 30.0, session_factory=None):
+        self.batch_size = batch_size
+        self.lag = timedelta(seconds=lag)
+        self.session_factory = session_factory
+
+    def _session(self):
+        return (self.session_factory or database.get_sessionmaker())()
+
+    def watermark(self, db) -> RollupWatermark:
+        mark = db.get(RollupWatermark, WATERMARK)
+        if mark is None:
+            mark = RollupWatermark(name=WATERMARK, last_id=0)
+            db.add(mark)
+        return mark
+
+    def rollup_batch(self, db, now: Optional[datetime] = None) -> int:
+        """Roll up the next batch of new raw rows; returns how many were processed."""
+        cutoff = (now or datetime.utcnow()) - self.lag
+        mark = self.watermark(db)
+        rows = (
+            db.query(MarketSnapshot)
+            .filter(MarketSnapshot.id > mark.last_id, MarketSnapshot.timestamp.isnot(None))
+            .order_by(MarketSnapshot.id)
+            .limit(self.batch_size)
+            .all()
+        )
+        # Stop at the first row inside the lag so the watermark never passes it
+        rows = list(takewhile(lambda row: row.timestamp <= cutoff, rows))
+        if not rows:
+            return 0
+        for rollup in ROLLUPS:
+            self._merge(db, rollup, self._aggregate(rollup, rows))
+        mark.last_id = rows[-1].id
+        mark.updated_at = datetime.utcnow()
+        db.commit()
+        return len(rows)
+
+    @staticmethod
+    def _aggregate(rollup: Rollup, rows: Iterable[MarketSnapshot]) -> Dict[Tuple[str, datetime], _Bucket]:
+        buckets: Dict[Tuple[str, datetime], _Bucket] = {}
+        for row in rows:
+            key = (row.symbol, rollup.bucket(row.timestamp))
+            bucket = buckets.get(key)
+            if bucket is None:
+                buckets[key] = _Bucket(row)
+            else:
+                bucket.add(row)
+        return buckets
+
+    @staticmethod
+    def _merge(db, rollup: Rollup, buckets: Dict[Tuple[str, datetime], _Bucket]) -> None:
+        model = rollup.model
+        starts = [start for _, start in buckets]
+        existing = {
+            (row.symbol, row.bucket): row
+            for row in db.query(model).filter(
+                model.symbol.in_({symbol for symbol, _ in buckets}),
+                model.bucket >= min(starts),
+                model.bucket <= max(starts),
+            )
+        }
+        for (symbol, start), bucket in buckets.items():
+            target = existing.get((symbol, start))
+            if target is None:
+                target = model(symbol=symbol, bucket=start, samples=0)
+                db.add(target)
+            bucket.merge_into(target)
+
+    def apply_retention(self, db, now: Optional[datetime] = None) -> Dict[str, int]:
+        """Delete data past its retention window; raw rows go only once rolled up."""
+        now = now or datetime.utcnow()
+        deleted = {}
+        raw = _retention("raw")
+        if raw is not None:
+            mark = self.watermark(db)
+            deleted["raw"] = (
+                db.query(MarketSnapshot)
+                .filter(MarketSnapshot.timestamp < now - raw, MarketSnapshot.id <= mark.last_id)
+                .delete(synchronize_session=False)
+            )
+        for rollup in ROLLUPS:
+            keep = _retention(rollup.name)
+            if keep is not None:
+                deleted[rollup.name] = (
+                    db.query(rollup.model).filter(rollup.model.bucket < now - keep).delete(synchronize_session=False)
+                )
+        db.commit()
+        return deleted
+
+    def run(self) -> int:
+        """Catch up with every new raw row, then apply retention."""
+        processed = 0
+        with self._session() as db:
+            while True:
+                count = self.rollup_batch(db)
+                processed += count
+                if count < self.batch_size:
+                    break
+            deleted = self.apply_retention(db)
+        if processed or any(deleted.values()):
+            logger.info(f"Rolled up {processed} market snapshots, retention removed {deleted}")
+        return processed
+
+
+def choose_resolution(db, symbol: str, start: datetime, end: datetime, max_points: int, now: Optional[datetime] = None) -> str:
+    """Finest table that still holds ``start`` and fits the range into ``max_points``.
+
+    Longer ranges therefore land on the coarser tables without the caller
+    having to pick one; 1d is used when nothing finer qualifies.
+    """
+    now = now or datetime.utcnow()
+    raw = _retention("raw")
+    if raw is None or start >= now - raw:
+        count = (
+            db.query(MarketSnapshot)
+            .filter(MarketSnapshot.symbol == symbol, MarketSnapshot.timestamp >= start, MarketSnapshot.timestamp <= end)
+            .limit(max_points + 1)
+            .count()
+        )
+        if count <= max_points:
+            return "raw"
+    for rollup in ROLLUPS:
+        keep = _retention(rollup.name)
+        if keep is not None and start < now - keep:
+            continue
+        if (end - start) / rollup.step <= max_points:
+            return rollup.name
+    return ROLLUPS[-1].name
+
+
+def query_snapshots(
+    db,
+    symbol: str,
+    start: datetime,
+    end: Optional[datetime] = None,
+    resolution: Optional[str] = None,
+    max_points: Optional[int] = None,
+) -> Tuple[str, List[Dict[str, Any]]]:
+    """Snapshots for ``symbol`` in ``[start, end]`` from the raw or a rollup table."""
+    start = _naive_utc(start)
+    end = _naive_utc(end) if end else datetime.utcnow()
+    max_points = max_points or settings.snapshot_max_points
+    if resolution is None:
+        resolution = choose_resolution(db, symbol, start, end, max_points)
+    if resolution not in RESOLUTIONS:
+        raise ValueError(f"Unknown resolution {resolution!r}; expected one of {', '.join(RESOLUTIONS)}")
+
+    if resolution == "raw":
+        rows = (
+            db.query(MarketSnapshot)
+            .filter(MarketSnapshot.symbol == symbol, MarketSnapshot.timestamp >= start, MarketSnapshot.timestamp <= end)
+            .order_by(MarketSnapshot.timestamp)
+            .all()
+        )
+        return resolution, [
+            {
+                "timestamp": row.timestamp.isoformat(),
+                "price": row.price,
+                "iv_rank": row.iv_rank,
+                "vix": row.vix,
+                "market_bias": row.market_bias,
+                "signal_confidence": row.signal_confidence,
+            }
+            for row in rows
+        ]
+
+    model = next(r.model for r in ROLLUPS if r.name == resolution)
+    rows = (
+        db.query(model)
+        .filter(model.symbol == symbol, model.bucket >= start, model.bucket <= end)
+        .order_by(model.bucket)
+        .all()
+    )
+    return resolution, [
+        {
+            "timestamp": row.bucket.isoformat(),
+            "open": row.open,
+            "high": row.high,
+            "low": row.low,
+            "close": row.close,
+            "iv_rank": row.iv_rank,
+            "vix": row.vix,
+            "market_bias": row.market_bias,
+            "signal_confidence": row.signal_confidence,
+            "samples": row.samples,
+        }
+        for row in rows
+    ]
+
+
+async def rollup_market_snapshots():
+    """Scheduler job: roll new market snapshots up and enforce retention."""
+    rollup = SnapshotRollup(batch_size=settings.snapshot_rollup_batch_size, lag=settings.snapshot_rollup_lag_seconds)
+    await asyncio.to_thread(rollup.run)
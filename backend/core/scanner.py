@@ -0,0 +1,164 @@
+import asyncio
+import heapq
+import itertools
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple
+
+from core.pipeline import normalize_ohlc
+from plugins.trading.spread_selector import select_spreads
+
+logger = logging.getLogger(__name__)
+
+_scoring_pool: Optional[ThreadPoolExecutor] = None
+
+
+def get_scoring_pool(max_workers: int) -> ThreadPoolExecutor:
+    """Shared pool that keeps chain scoring off the event loop."""
+    global _scoring_pool
+    if _scoring_pool is None:
+        _scoring_pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="scanner")
+    return _scoring_pool
+
+
+def target_expiration(config: Dict[str, Any], today: Optional[datetime] = None) -> datetime:
+    """Friday closest to the middle of the configured DTE window."""
+    today = today or datetime.utcnow()
+    mid = (config.get("dte_min", 30) + config.get("dte_max", 45)) // 2
+    target = today + timedelta(days=mid)
+    offset = (4 - target.weekday()) % 7
+    if offset > 3:
+        offset -= 7
+    return (target + timedelta(days=offset)).replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+class TopK:
+    """Bounded min-heap keeping the ``k`` highest-scoring candidates."""
+
+    def __init__(self, k: int):
+        if k < 1:
+            raise ValueError("k must be at least 1")
+        self.k = k
+        self._heap: List[Tuple[float, int, Dict[str, Any]]] = []
+        self._counter = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def push(self, candidate: Dict[str, Any]) -> bool:
+        """Offer a candidate; returns True if it made it into the top-k."""
+        entry = (candidate["score"], next(self._counter), candidate)
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, entry)
+            return True
+        if entry[0] > self._heap[0][0]:
+            heapq.heapreplace(self._heap, entry)
+            return True
+        return False
+
+    def items(self) -> List[Dict[str, Any]]:
+        """Current members, best first."""
+        return [c for _, _, c in sorted(self._heap, key=lambda e: (-e[0], e[1]))]
+
+
+class OpportunityScanner:
+    """Evaluates signals and spreads across a universe of underlyings."""
+
+    def __init__(self, plugins: Dict[str, Any], config: Dict[str, Any]):
+        self.plugins = plugins
+        self.config = config
+
+    async def scan(
+        self,
+        universe: Optional[Sequence[str]] = None,
+        top_k: Optional[int] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Yield a progress event after each symbol, then a final result.
+
+        Each event carries the global top-k so far, so a client can render the
+        first opportunities before the whole universe has been scanned.
+        """
+        universe = list(universe or self.config.get("scan_universe") or [self.config.get("symbol", "SPX")])
+        ranking = TopK(top_k or self.config.get("scan_top_k", 10))
+        semaphore = asyncio.Semaphore(self.config.get("scan_fetch_concurrency", 8))
+        pool = get_scoring_pool(self.config.get("scan_workers", 4))
+        expiration = target_expiration(self.config)
+
+        tasks = [
+            asyncio.create_task(self._scan_symbol(symbol, expiration, semaphore, pool))
+            for symbol in universe
+        ]
+        errors: List[Dict[str, str]] = []
+        completed = 0
+        try:
+            for finished in asyncio.as_completed(tasks):
+                symbol, candidates, error = await finished
+                completed += 1
+                if error:
+                    errors.append({"symbol": symbol, "error": error})
+                for candidate in candidates:
+                    ranking.push(candidate)
+                yield {
+                    "type": "progress",
+                    "symbol": symbol,
+                    "completed": completed,
+                    "total": len(universe),
+                    "opportunities": ranking.items(),
+                }
+        finally:
+            for task in tasks:
+                task.cancel()
+            # Wait for the cancellations so no task outlives the scan
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        yield {
+            "type": "complete",
+            "completed": completed,
+            "total": len(universe),
+            "opportunities": ranking.items(),
+            "errors": errors,
+        }
+
+    async def _scan_symbol(
+        self,
+        symbol: str,
+        expiration: datetime,
+        semaphore: asyncio.Semaphore,
+        pool: ThreadPoolExecutor,
+    ) -> Tuple[str, List[Dict[str, Any]], Optional[str]]:
+        data = self.plugins["data"]
+        try:
+            async with semaphore:
+                md, history, chain = await asyncio.gather(
+                    data.get_market_data(symbol),
+                    data.get_historical_data(symbol, self.config.get("pipeline_history_period", "3mo")),
+                    data.get_option_chain(symbol, expiration),
+                )
+            signal = await self.plugins["signals"].execute({
+                "symbol": symbol,
+                "price": md.price,
+                "vix": md.vix,
+                "atr": md.atr,
+                "price_data": normalize_ohlc(history),
+            })
+            loop = asyncio.get_running_loop()
+            candidates = await loop.run_in_executor(
+                pool,
+                select_spreads,
+                chain.puts,
+                chain.calls,
+                chain.underlying_price,
+                signal.get("bias"),
+                self.config,
+            )
+        except Exception as e:
+            logger.warning(f"Opportunity scan failed for {symbol}: {e}")
+            return symbol, [], str(e)
+
+        exp = expiration.date().isoformat()
+        for candidate in candidates:
+            candidate["symbol"] = symbol
+            candidate["expiration"] = exp
+            candidate["bias"] = signal.get("bias")
+        return symbol, candidates, None
@@ -1,27 +1,264 @@
+from apscheduler.events import EVENT_JOB_MAX_INSTANCES, EVENT_JOB_MISSED
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from apscheduler.triggers.combining import OrTrigger
 from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
+import asyncio
 import logging
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
 from core.orchestrator import orchestrator
-from core.config import settings
+from core.config import settings, tracked_symbols
+from core.chain_archive import get_chain_archive
+from core.leader import LeaderElector, build_leader_lock
+from core.metrics import JOB_SKIPPED, job_runs, timed_job
+from core.orders import order_manager
+from core.retention import rollup_market_snapshots
+from core.shared_cache import get_shared_cache
+from core.signals import follow_quotes, poll_quotes, refresh_signal_snapshots
+from core.warmup import market_open_tasks, pre_open_warmup, warm_chains, warm_history
 
 logger = logging.getLogger(__name__)
 
 scheduler = AsyncIOScheduler()
+# Keeps a follower's own bars and signal snapshots current; paused while leading
+follower_scheduler = AsyncIOScheduler()
 
+# Set when leader_election is enabled; jobs only run while this worker leads
+leader: Optional[LeaderElector] = None
 
-async def market_open_tasks():
-    """Job that runs at market open to fetch initial market data."""
-    logger.info("Running market open routine")
+
+def _on_job_skipped(event):
+    reason = "overlap" if event.code == EVENT_JOB_MAX_INSTANCES else "late"
+    JOB_SKIPPED.inc(event.job_id, reason)
+    logger.warning(f"Skipped {event.job_id} run ({reason})")
+
+
+scheduler.add_listener(_on_job_skipped, EVENT_JOB_MISSED | EVENT_JOB_MAX_INSTANCES)
+follower_scheduler.add_listener(_on_job_skipped, EVENT_JOB_MISSED | EVENT_JOB_MAX_INSTANCES)
+
+
+async def poll_chains():
+    """Job that publishes the target-expiration chain of tracked symbols to the shared cache."""
+    from core.scanner import target_expiration
+
+    cache = get_shared_cache()
     data_plugin = orchestrator.get_plugin("data")
-    if data_plugin:
-        await data_plugin.initialize()
-        md = await data_plugin.get_market_data(settings.symbol)
-        logger.info(f"{settings.symbol} open price: {md.price}")
+    if cache is None or not data_plugin:
+        return
+    expiration = target_expiration(settings.model_dump())
+    symbols = tracked_symbols()
+    chains = await asyncio.gather(
+        *(data_plugin.get_option_chain(symbol, expiration) for symbol in symbols),
+        return_exceptions=True,
+    )
+    for symbol, chain in zip(symbols, chains):
+        if isinstance(chain, Exception):
+            logger.warning(f"Chain poll failed for {symbol}: {chain}")
+            continue
+        cache.publish_chain(chain, expiration)
+
+
+async def archive_chains():
+    """Job that writes every available expiration of the tracked symbols to the chain archive."""
+    archive = get_chain_archive()
+    data_plugin = orchestrator.get_plugin("data")
+    if archive is None or not data_plugin:
+        return
+    from core.scanner import target_expiration
+
+    for symbol in tracked_symbols():
+        try:
+            chains = await data_plugin.get_option_chains(symbol)
+            if not chains:
+                # Provider cannot list expirations: archive the one we trade
+                expiration = target_expiration(settings.model_dump())
+                chains = {expiration: await data_plugin.get_option_chain(symbol, expiration)}
+        except Exception as e:
+            logger.warning(f"Chain archive fetch failed for {symbol}: {e}")
+            continue
+        for expiration, chain in chains.items():
+            await asyncio.to_thread(archive.write, chain, expiration)
+        logger.info(f"Archived {len(chains)} {symbol} chains")
+
+
+def _eastern(at: str, **fields) -> CronTrigger:
+    """Weekday cron trigger at ``HH:MM`` US/Eastern."""
+    hour, minute = at.split(":")
+    return CronTrigger(hour=int(hour), minute=int(minute), day_of_week="mon-fri", timezone="US/Eastern", **fields)
+
+
+def _minute_of_day(at: str) -> int:
+    hour, minute = at.split(":")
+    return int(hour) * 60 + int(minute)
+
+
+def _intraday(minutes: int) -> OrTrigger:
+    """Every ``minutes`` from the open to the close of ``market_hours`` on weekdays, jittered."""
+    open_at, close_at = (_minute_of_day(at) for at in settings.market_hours.split("-"))
+    # Cron fields cannot say "from 09:30", so group the session's slots by hour
+    slots: Dict[int, List[str]] = {}
+    for t in range(open_at, close_at + 1, minutes):
+        slots.setdefault(t // 60, []).append(str(t % 60))
+    hours: Dict[str, List[str]] = {}
+    for hour, minute in slots.items():
+        hours.setdefault(",".join(minute), []).append(str(hour))
+    return OrTrigger(
+        [
+            CronTrigger(minute=minute, hour=",".join(hour), day_of_week="mon-fri", timezone="US/Eastern")
+            for minute, hour in hours.items()
+        ],
+        jitter=settings.job_jitter_seconds,
+    )
+
+
+def add_job(job_id: str, func, trigger, target: AsyncIOScheduler = scheduler, **options) -> None:
+    """Add a timed job that never overlaps itself and is skipped rather than run late.
+
+    A run still going when the next one is due makes that run a no-op, and runs
+    missed while the loop was blocked collapse into one, provided it can still
+    start within ``misfire_grace_time`` seconds of its slot.
+    """
+    options.setdefault("misfire_grace_time", settings.job_misfire_grace_seconds)
+    target.add_job(
+        timed_job(job_id, func),
+        trigger,
+        id=job_id,
+        max_instances=1,
+        coalesce=True,
+        replace_existing=True,
+        **options,
+    )
 
 
 def init_scheduler():
     """Configure scheduler jobs."""
+    # Warm quotes, chains, history and indicators ahead of the open; a late run
+    # is still worth doing until the open itself
+    add_job(
+        "pre_open_warmup",
+        pre_open_warmup,
+        _eastern(settings.warmup_time, jitter=settings.job_jitter_seconds),
+        misfire_grace_time=600,
+    )
     # Market open at 9:30am US/Eastern Monday-Friday
-    trigger = CronTrigger(hour=9, minute=30, day_of_week="mon-fri", timezone="US/Eastern")
-    scheduler.add_job(market_open_tasks, trigger, id="market_open")
+    add_job("market_open", market_open_tasks, _eastern("09:30"))
+
+    # Stream quotes into the intraday bar aggregator
+    add_job("poll_quotes", poll_quotes, IntervalTrigger(seconds=settings.quote_poll_seconds))
+
+    # Recompute composite signal snapshots whenever a new bar is available
+    add_job("refresh_signals", refresh_signal_snapshots, IntervalTrigger(seconds=settings.signal_refresh_seconds))
+
+    # Keep the DTE-window chains and daily history warm through the session
+    add_job(
+        "warm_chains",
+        warm_chains,
+        _intraday(settings.warm_chains_minutes),
+        misfire_grace_time=settings.warm_chains_minutes * 30,
+    )
+    add_job(
+        "warm_history",
+        warm_history,
+        _intraday(settings.warm_history_minutes),
+        misfire_grace_time=settings.warm_history_minutes * 30,
+    )
+
+    # Roll raw market snapshots up into 1m/1h/1d tables and enforce retention
+    add_job("rollup_snapshots", rollup_market_snapshots, IntervalTrigger(seconds=settings.snapshot_rollup_seconds))
+
+    if settings.shared_cache_name:
+        add_job("poll_chains", poll_chains, IntervalTrigger(seconds=settings.chain_poll_seconds))
+
+    if settings.chain_archive_path:
+        add_job(
+            "archive_chains",
+            archive_chains,
+            _eastern(settings.chain_archive_time, jitter=settings.job_jitter_seconds),
+            misfire_grace_time=3600,
+        )
+
+
+def _iso(ts: Optional[float]) -> Optional[str]:
+    return None if ts is None else datetime.fromtimestamp(ts, tz=timezone.utc).isoformat()
+
+
+def job_status() -> List[Dict[str, Any]]:
+    """Schedule, overlap settings and last recorded run of every job."""
+    jobs = []
+    for job in scheduler.get_jobs() + follower_scheduler.get_jobs():
+        run = job_runs.get(job.id, {})
+        # Jobs added before the scheduler starts have no next run time yet
+        next_run = getattr(job, "next_run_time", None)
+        jobs.append({
+            "id": job.id,
+            "trigger": str(job.trigger),
+            "next_run_time": next_run.isoformat() if next_run else None,
+            "max_instances": job.max_instances,
+            "coalesce": job.coalesce,
+            "misfire_grace_time": job.misfire_grace_time,
+            "runs": run.get("runs", 0),
+            "errors": run.get("errors", 0),
+            "last_start": _iso(run.get("last_start")),
+            "last_duration": run.get("last_duration"),
+            "last_error": run.get("last_error"),
+            "skipped": {reason: int(JOB_SKIPPED.get(job.id, reason)) for reason in ("late", "overlap")},
+        })
+    return jobs
+
+
+def init_follower_jobs():
+    """Read-only jobs for workers that lose the election: no upstream writes, no orders."""
+    add_job("follow_quotes", follow_quotes, IntervalTrigger(seconds=settings.quote_poll_seconds), follower_scheduler)
+    add_job(
+        "follow_signals",
+        refresh_signal_snapshots,
+        IntervalTrigger(seconds=settings.signal_refresh_seconds),
+        follower_scheduler,
+    )
+
+
+async def _resume_jobs():
+    follower_scheduler.pause()
+    scheduler.resume()
+    await order_manager.start()
+
+
+async def _pause_jobs():
+    scheduler.pause()
+    follower_scheduler.resume()
+    await order_manager.stop()
+
+
+async def start_scheduler():
+    """Start the jobs and order manager, or only once this worker wins the leader election."""
+    global leader
+    lock = build_leader_lock(settings.model_dump())
+    if lock is None:
+        scheduler.start()
+        await order_manager.start()
+        return
+    scheduler.start(paused=True)
+    init_follower_jobs()
+    follower_scheduler.start()
+    leader = LeaderElector(lock, _resume_jobs, _pause_jobs, interval=settings.leader_renew_seconds)
+    await leader.start()
+
+
+def scheduler_role() -> str:
+    """``leader`` or ``follower`` under leader election, else ``single``."""
+    if leader is None:
+        return "single"
+    return "leader" if leader.is_leader else "follower"
+
 
+async def stop_scheduler():
+    """Give up leadership (letting another worker take over) and stop the jobs."""
+    global leader
+    if leader is not None:
+        await leader.stop()
+        leader = None
+    await order_manager.stop()
+    if follower_scheduler.running:
+        follower_scheduler.shutdown()
+    scheduler.shutdown()
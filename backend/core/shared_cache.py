@@ -0,0 +1,287 @@
+import logging
+import math
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from multiprocessing import resource_tracker, shared_memory
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from core.bars import epoch_seconds
+from core.config import settings
+
+logger = logging.getLogger(__name__)
+
+QUOTE_FIELDS = ("price", "volume", "atr", "vix", "timestamp")
+CHAIN_FIELDS = (
+    "strike", "bid", "ask", "lastPrice", "volume", "openInterest",
+    "impliedVolatility", "delta", "gamma", "theta", "vega",
+)
+# Per chain buffer: puts rows, calls rows, underlying price, expiration, timestamp
+_CHAIN_META = 5
+_MAGIC = 0x4F50_4331  # "OPC1"
+_NAME = "S16"
+_ALIGN = 64
+
+
+def _layout(quote_slots: int, chain_slots: int, chain_rows: int) -> Tuple[Dict[str, Tuple[int, str, tuple]], int]:
+    """Byte offset, dtype and shape of every array in the segment."""
+    arrays = [
+        ("header", "i8", (8,)),
+        ("quote_names", _NAME, (quote_slots,)),
+        ("quote_seq", "i8", (quote_slots,)),
+        ("quotes", "f8", (quote_slots, len(QUOTE_FIELDS))),
+        ("chain_names", _NAME, (chain_slots,)),
+        ("chain_gen", "i8", (chain_slots,)),
+        ("chain_meta", "f8", (chain_slots, 2, _CHAIN_META)),
+        # slot, double buffer, side (puts/calls), field, row
+        ("chains", "f8", (chain_slots, 2, 2, len(CHAIN_FIELDS), chain_rows)),
+    ]
+    layout, offset = {}, 0
+    for name, dtype, shape in arrays:
+        layout[name] = (offset, dtype, shape)
+        nbytes = np.dtype(dtype).itemsize * math.prod(shape)
+        offset += -(-nbytes // _ALIGN) * _ALIGN
+    return layout, offset
+
+
+def _untrack(shm: shared_memory.SharedMemory) -> None:
+    # The resource tracker unlinks segments when the registering process exits,
+    # which would pull the cache away from the other workers (bpo-39959)
+    try:
+        resource_tracker.unregister(shm._name, "shared_memory")
+    except Exception:
+        pass
+
+
+@dataclass
+class SharedChain:
+    """Option chain read straight out of shared memory.
+
+    ``puts`` and ``calls`` are ``(len(CHAIN_FIELDS), rows)`` views, not copies.
+    The writer double-buffers, so a view stays intact until the chain has been
+    republished twice; :meth:`is_current` tells whether that happened.
+    """
+    cache: "SharedMarketCache"
+    slot: int
+    generation: int
+    symbol: str
+    underlying_price: float
+    expiration: datetime
+    timestamp: datetime
+    puts: np.ndarray
+    calls: np.ndarray
+
+    def is_current(self) -> bool:
+        return int(self.cache._chain_gen[self.slot]) - self.generation < 2
+
+    def records(self, side: str) -> List[Dict[str, Any]]:
+        """JSON-safe rows for ``puts`` or ``calls``; columns that are all NaN are omitted."""
+        block = self.puts if side == "puts" else self.calls
+        keys, columns = [], []
+        for name, values in zip(CHAIN_FIELDS, block):
+            nan = np.isnan(values)
+            if nan.all():
+                continue
+            column = values.tolist()
+            if nan.any():
+                column = [None if v != v else v for v in column]
+            keys.append(name)
+            columns.append(column)
+        return [dict(zip(keys, row)) for row in zip(*columns)]
+
+    def frame(self, side: str):
+        """Copy one side into a DataFrame shaped like a data plugin's chain."""
+        import pandas as pd
+
+        block = self.puts if side == "puts" else self.calls
+        frame = pd.DataFrame({name: block[i] for i, name in enumerate(CHAIN_FIELDS)})
+        return frame.dropna(axis=1, how="all")
+
+
+class SharedMarketCache:
+    """Latest quotes and option chains in a ``multiprocessing.shared_memory`` segment.
+
+    One process (the elected leader) publishes and every worker maps the same
+    segment, so reads are plain memory loads with no IPC round trip. Quotes are
+    guarded by a per-slot sequence counter (seqlock): odd while a write is in
+    progress, and a reader retries if it changed under it. Chains are double
+    buffered and a generation counter flips the active buffer after a write.
+    Symbols are assigned slots on first publish and never move.
+    """
+
+    def __init__(
+        self,
+        shm: shared_memory.SharedMemory,
+        quote_slots: int,
+        chain_slots: int,
+        chain_rows: int,
+    ):
+        self.shm = shm
+        self.quote_slots = quote_slots
+        self.chain_slots = chain_slots
+        self.chain_rows = chain_rows
+        layout, size = _layout(quote_slots, chain_slots, chain_rows)
+        if shm.size < size:
+            raise ValueError(f"Shared segment {shm.name} is {shm.size} bytes, layout needs {size}")
+        for name, (offset, dtype, shape) in layout.items():
+            setattr(self, f"_{name}", np.ndarray(shape, dtype=dtype, buffer=shm.buf, offset=offset))
+        self._slots: Dict[Tuple[str, str], int] = {}
+
+        header = self._header
+        expected = (_MAGIC, quote_slots, chain_slots, chain_rows)
+        if header[0] == 0:
+            header[1:4] = expected[1:]
+            header[0] = _MAGIC
+        elif tuple(int(v) for v in header[:4]) != expected:
+            raise ValueError(f"Shared segment {shm.name} was created with a different layout: {header[:4].tolist()}")
+
+    @classmethod
+    def open(cls, name: str, quote_slots: int = 64, chain_slots: int = 8, chain_rows: int = 2048) -> "SharedMarketCache":
+        """Create the named segment, or attach to it if another worker already did."""
+        _, size = _layout(quote_slots, chain_slots, chain_rows)
+        try:
+            shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+            logger.info(f"Created shared market cache {name} ({size / 1e6:.1f} MB)")
+        except FileExistsError:
+            shm = shared_memory.SharedMemory(name=name)
+        _untrack(shm)
+        return cls(shm, quote_slots, chain_slots, chain_rows)
+
+    def close(self, unlink: bool = False) -> None:
+        for attr in list(vars(self)):
+            if attr.startswith("_") and isinstance(getattr(self, attr), np.ndarray):
+                delattr(self, attr)
+        self.shm.close()
+        if unlink:
+            self.shm.unlink()
+
+    def _slot(self, kind: str, symbol: str, create: bool = False) -> Optional[int]:
+        slot = self._slots.get((kind, symbol))
+        if slot is not None:
+            return slot
+        names = self._quote_names if kind == "quote" else self._chain_names
+        key = symbol.encode()[:16]
+        found = np.flatnonzero(names == key)
+        if len(found):
+            slot = int(found[0])
+        elif create:
+            count_index = 4 if kind == "quote" else 5
+            slot = int(self._header[count_index])
+            if slot >= len(names):
+                logger.warning(f"Shared {kind} cache is full, not caching {symbol}")
+                return None
+            names[slot] = key
+            self._header[count_index] = slot + 1
+        else:
+            return None
+        self._slots[(kind, symbol)] = slot
+        return slot
+
+    def publish_quote(self, md) -> None:
+        """Write a ``MarketData`` quote (leader only)."""
+        slot = self._slot("quote", md.symbol, create=True)
+        if slot is None:
+            return
+        self._quote_seq[slot] += 1
+        self._quotes[slot] = (md.price, md.volume, md.atr, md.vix, epoch_seconds(md.timestamp))
+        self._quote_seq[slot] += 1
+
+    def quote(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """Latest quote for ``symbol`` as a dict, or None if none was published."""
+        slot = self._slot("quote", symbol)
+        if slot is None:
+            return None
+        seq, quotes = self._quote_seq, self._quotes
+        for _ in range(100):
+            before = int(seq[slot])
+            if before == 0:
+                return None
+            if before % 2 == 0:
+                values = quotes[slot].tolist()
+                if int(seq[slot]) == before:
+                    return dict(zip(QUOTE_FIELDS, values), symbol=symbol)
+        return None
+
+    def publish_chain(self, chain, expiration: datetime) -> None:
+        """Write an ``OptionChain`` into the inactive buffer, then flip it (leader only)."""
+        slot = self._slot("chain", chain.symbol, create=True)
+        if slot is None:
+            return
+        generation = int(self._chain_gen[slot])
+        target = (generation + 1) % 2
+        counts = []
+        for side, frame in enumerate((chain.puts, chain.calls)):
+            counts.append(self._write_side(self._chains[slot, target, side], frame, chain.underlying_price))
+        self._chain_meta[slot, target] = (
+            counts[0], counts[1], chain.underlying_price, epoch_seconds(expiration), epoch_seconds(chain.timestamp),
+        )
+        self._chain_gen[slot] = generation + 1
+
+    def _write_side(self, block: np.ndarray, frame, underlying_price: float) -> int:
+        if frame is None or frame.empty or "strike" not in frame.columns:
+            return 0
+        rows = len(frame)
+        if rows > self.chain_rows:
+            # Keep the strikes nearest the money, still in strike order
+            distance = (frame["strike"] - underlying_price).abs()
+            frame = frame.loc[distance.nsmallest(self.chain_rows).index].sort_values("strike")
+            rows = self.chain_rows
+        for i, name in enumerate(CHAIN_FIELDS):
+            if name in frame.columns:
+                block[i, :rows] = frame[name].to_numpy(dtype=float, na_value=np.nan)
+            else:
+                block[i, :rows] = np.nan
+        return rows
+
+    def chain(self, symbol: str) -> Optional[SharedChain]:
+        """Zero-copy view of the latest chain for ``symbol``."""
+        slot = self._slot("chain", symbol)
+        if slot is None:
+            return None
+        generation = int(self._chain_gen[slot])
+        if generation == 0:
+            return None
+        active = generation % 2
+        n_puts, n_calls, underlying, expiration, timestamp = self._chain_meta[slot, active].tolist()
+        data = self._chains[slot, active]
+        return SharedChain(
+            cache=self,
+            slot=slot,
+            generation=generation,
+            symbol=symbol,
+            underlying_price=underlying,
+            expiration=datetime.fromtimestamp(expiration, tz=timezone.utc),
+            timestamp=datetime.fromtimestamp(timestamp, tz=timezone.utc),
+            puts=data[0, :, :int(n_puts)],
+            calls=data[1, :, :int(n_calls)],
+        )
+
+
+def segment_name(name: str, quote_slots: int, chain_slots: int, chain_rows: int) -> str:
+    """Segment name for one layout, so a deploy with other sizes never attaches to an old segment."""
+    return f"{name}-{quote_slots}x{chain_slots}x{chain_rows}"
+
+
+_shared_cache: Optional[SharedMarketCache] = None
+
+
+def get_shared_cache() -> Optional[SharedMarketCache]:
+    """Process-wide cache, opened on first use; None unless ``shared_cache_name`` is set."""
+    global _shared_cache
+    if _shared_cache is None and settings.shared_cache_name:
+        layout = (settings.shared_quote_slots, settings.shared_chain_slots, settings.shared_chain_rows)
+        _shared_cache = SharedMarketCache.open(segment_name(settings.shared_cache_name, *layout), *layout)
+    return _shared_cache
+
+
+def close_shared_cache() -> None:
+    """Unmap this worker's view of the segment at shutdown.
+
+    The segment itself is left in place: workers that are still running (or
+    about to start) keep using it, and its name is tied to the layout.
+    """
+    global _shared_cache
+    if _shared_cache is not None:
+        _shared_cache.close()
+        _shared_cache = None
@@ -0,0 +1,113 @@
+import asyncio
+import logging
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from core.bars import get_bar_aggregator
+from core.config import settings, tracked_symbols
+from core.correlation import get_correlation_engine
+from core.market_cache import get_market_cache
+from core.orchestrator import orchestrator
+from core.pipeline import normalize_ohlc
+from core.shared_cache import get_shared_cache
+from core.snapshots import Snapshot, SnapshotStore
+
+logger = logging.getLogger(__name__)
+
+signal_snapshots = SnapshotStore("signals")
+
+# Timestamp of the last bar each snapshot was computed from
+_last_bar: Dict[str, Any] = {}
+_locks: Dict[str, asyncio.Lock] = {}
+
+
+async def refresh_signals(symbol: Optional[str] = None, force: bool = False) -> Optional[Snapshot]:
+    """Recompute the composite signal for ``symbol`` if a new bar has arrived."""
+    symbol = symbol or settings.symbol
+    data_plugin = orchestrator.get_plugin("data")
+    signals_plugin = orchestrator.get_plugin("signals")
+    if not data_plugin or not signals_plugin:
+        return None
+
+    lock = _locks.setdefault(symbol, asyncio.Lock())
+    async with lock:
+        current = signal_snapshots.get(symbol, record=False)
+        # Prefer intraday bars built from live quotes once enough have accumulated
+        history = get_bar_aggregator().as_frame(symbol, settings.signal_bar_interval)
+        if len(history) < max(settings.ema_slow, settings.rsi_period) + 1:
+            history = normalize_ohlc(
+                await get_market_cache().historical_data(data_plugin, symbol, settings.signal_history_period)
+            )
+        if history.empty:
+            return current
+
+        last_bar = history.index[-1]
+        if not force and current is not None and _last_bar.get(symbol) == last_bar:
+            return current
+
+        result = await signals_plugin.execute({"symbol": symbol, "price_data": history})
+        snapshot = signal_snapshots.publish(symbol, {
+            "symbol": symbol,
+            "market_bias": result["bias"],
+            "confidence": result["confidence"],
+            "signals": result["details"],
+            "recommendation": result["recommendation"],
+            "as_of": str(last_bar),
+        })
+        _last_bar[symbol] = last_bar
+        logger.info(f"Signal snapshot v{snapshot.version} for {symbol}: {result['bias']}")
+        return snapshot
+
+
+async def refresh_signal_snapshots():
+    """Scheduler job: refresh the snapshot of every tracked symbol."""
+    for symbol in tracked_symbols():
+        try:
+            await refresh_signals(symbol)
+        except Exception as e:
+            logger.warning(f"Signal refresh failed for {symbol}: {e}")
+
+
+def polled_symbols() -> List[str]:
+    """Symbols whose quotes are polled: the signal symbols plus the correlation universe."""
+    return list(dict.fromkeys([*tracked_symbols(), *get_correlation_engine().symbols]))
+
+
+async def poll_quotes():
+    """Scheduler job: feed fresh quotes into the bar aggregator and the market caches."""
+    data_plugin = orchestrator.get_plugin("data")
+    if not data_plugin:
+        return
+    symbols = polled_symbols()
+    cache = get_shared_cache()
+    results = await asyncio.gather(
+        *(data_plugin.get_market_data(symbol) for symbol in symbols),
+        return_exceptions=True,
+    )
+    for symbol, md in zip(symbols, results):
+        if isinstance(md, Exception):
+            logger.warning(f"Quote poll failed for {symbol}: {md}")
+            continue
+        get_bar_aggregator().on_market_data(md)
+        get_market_cache().put_quote(md)
+        if cache is not None:
+            cache.publish_quote(md)
+
+
+async def follow_quotes():
+    """Follower job: build this worker's bars from the quotes the leader publishes.
+
+    Without a shared cache there is nothing to read, so the follower polls
+    quotes itself; it never runs the leader's write jobs.
+    """
+    cache = get_shared_cache()
+    if cache is None:
+        await poll_quotes()
+        return
+    for symbol in polled_symbols():
+        quote = cache.quote(symbol)
+        if quote is None:
+            continue
+        # Re-reading an unchanged quote leaves the bars unchanged
+        timestamp = datetime.fromtimestamp(quote["timestamp"], tz=timezone.utc)
+        get_bar_aggregator().on_quote(symbol, quote["price"], quote["volume"], timestamp)
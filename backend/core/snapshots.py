@@ -0,0 +1,56 @@
+import hashlib
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from core.metrics import record_cache
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    """Immutable, pre-serialized payload served as-is by read endpoints."""
+    key: str
+    version: int
+    etag: str
+    payload: Dict[str, Any]
+    body: bytes
+    created_at: datetime
+
+
+class SnapshotStore:
+    """Versioned snapshots keyed by name; reads are a single dict lookup."""
+
+    def __init__(self, name: str = "snapshots"):
+        self.name = name
+        self._snapshots: Dict[str, Snapshot] = {}
+
+    def get(self, key: str, record: bool = True) -> Optional[Snapshot]:
+        snapshot = self._snapshots.get(key)
+        if record:
+            record_cache(self.name, snapshot is not None)
+        return snapshot
+
+    def publish(self, key: str, payload: Dict[str, Any]) -> Snapshot:
+        """Store a new version unless the content is unchanged."""
+        content = json.dumps(payload, sort_keys=True, default=str).encode()
+        digest = hashlib.sha1(content).hexdigest()[:16]
+        current = self._snapshots.get(key)
+        if current is not None and current.etag.endswith(f'-{digest}"'):
+            return current
+
+        version = current.version + 1 if current else 1
+        body = dict(payload, version=version)
+        snapshot = Snapshot(
+            key=key,
+            version=version,
+            etag=f'"{version}-{digest}"',
+            payload=body,
+            body=json.dumps(body, default=str).encode(),
+            created_at=datetime.utcnow(),
+        )
+        self._snapshots[key] = snapshot
+        return snapshot
+
+    def clear(self) -> None:
+        self._snapshots.clear()
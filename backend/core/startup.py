@@ -0,0 +1,96 @@
+import logging
+import os
+import re
+import subprocess
+import sys
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from core.metrics import STARTUP_PHASE
+
+logger = logging.getLogger(__name__)
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# "import time:       self [us] |  cumulative | imported package"
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)\s*$")
+
+
+class StartupTimer:
+    """Records how long each cold-start phase took (import, init_db, plugins, ...)."""
+
+    def __init__(self):
+        self.phases: Dict[str, float] = {}
+
+    def record(self, phase: str, seconds: float) -> None:
+        self.phases[phase] = seconds
+        STARTUP_PHASE.set(seconds, phase)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def summary(self) -> str:
+        return ", ".join(f"{name} {1000 * seconds:.0f}ms" for name, seconds in self.phases.items())
+
+    def report(self) -> Dict[str, Any]:
+        return {
+            "phases": {name: round(seconds, 4) for name, seconds in self.phases.items()},
+            "total_seconds": round(sum(self.phases.values()), 4),
+        }
+
+
+startup_timer = StartupTimer()
+
+
+def parse_importtime(output: str) -> List[Dict[str, Any]]:
+    """Parse ``python -X importtime`` output into per-module timings, slowest first."""
+    modules = []
+    for line in output.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match is None:
+            continue
+        self_us, cumulative_us, indent, name = match.groups()
+        modules.append({
+            "module": name,
+            "self_ms": int(self_us) / 1000,
+            "cumulative_ms": int(cumulative_us) / 1000,
+            "depth": len(indent) // 2,
+        })
+    return sorted(modules, key=lambda m: m["cumulative_ms"], reverse=True)
+
+
+def measure_imports(module: str = "api.main", python: Optional[str] = None) -> Dict[str, Any]:
+    """Import ``module`` in a fresh interpreter and report per-module import times."""
+    start = time.perf_counter()
+    result = subprocess.run(
+        [python or sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True,
+    )
+    elapsed = time.perf_counter() - start
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{result.stderr[-2000:]}")
+    modules = parse_importtime(result.stderr)
+    return {
+        "module": module,
+        "process_seconds": round(elapsed, 4),
+        "import_ms": modules[0]["cumulative_ms"] if modules else 0.0,
+        "modules": modules,
+    }
+
+
+def format_import_report(report: Dict[str, Any], top: int = 25, write: Callable[[str], None] = print) -> None:
+    write(
+        f"import {report['module']}: {report['import_ms']:.1f} ms "
+        f"(fresh process {1000 * report['process_seconds']:.0f} ms)"
+    )
+    write(f"{'cumulative':>12}{'self':>10}  module")
+    for entry in report["modules"][:top]:
+        write(f"{entry['cumulative_ms']:>10.1f}ms{entry['self_ms']:>8.1f}ms  {'  ' * entry['depth']}{entry['module']}")
@@ -0,0 +1,83 @@
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+from core.config import settings, tracked_symbols
+from core.market_cache import get_market_cache
+from core.orchestrator import orchestrator
+from core.signals import poll_quotes, refresh_signals
+
+logger = logging.getLogger(__name__)
+
+
+def window_expirations(expirations: List[datetime], today: Optional[datetime] = None) -> List[datetime]:
+    """Expirations between ``dte_min`` and ``dte_max`` days out."""
+    today = (today or datetime.utcnow()).date()
+    lo, hi = today + timedelta(days=settings.dte_min), today + timedelta(days=settings.dte_max)
+    return [exp for exp in expirations if lo <= exp.date() <= hi]
+
+
+async def warm_chains():
+    """Scheduler job: fetch the chains of every expiration in the DTE window into the market cache."""
+    from core.scanner import target_expiration
+
+    data_plugin = orchestrator.get_plugin("data")
+    if not data_plugin:
+        return
+    for symbol in tracked_symbols():
+        try:
+            expirations = window_expirations(await data_plugin.get_expirations(symbol))
+        except Exception as e:
+            logger.warning(f"Expiration lookup failed for {symbol}: {e}")
+            expirations = []
+        # Provider cannot list expirations: warm the one we trade
+        expirations = expirations or [target_expiration(settings.model_dump())]
+        results = await asyncio.gather(
+            *(get_market_cache().option_chain(data_plugin, symbol, exp, force=True) for exp in expirations),
+            return_exceptions=True,
+        )
+        for exp, result in zip(expirations, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Chain warm-up failed for {symbol} {exp.date()}: {result}")
+
+
+async def warm_history():
+    """Scheduler job: fetch the daily history the signal engine falls back to."""
+    data_plugin = orchestrator.get_plugin("data")
+    if not data_plugin:
+        return
+    symbols = tracked_symbols()
+    results = await asyncio.gather(
+        *(get_market_cache().historical_data(data_plugin, s, settings.signal_history_period, force=True) for s in symbols),
+        return_exceptions=True,
+    )
+    for symbol, result in zip(symbols, results):
+        if isinstance(result, Exception):
+            logger.warning(f"History warm-up failed for {symbol}: {result}")
+
+
+async def warm_indicators():
+    """Recompute every tracked symbol's signal snapshot from the warmed history."""
+    for symbol in tracked_symbols():
+        try:
+            await refresh_signals(symbol, force=True)
+        except Exception as e:
+            logger.warning(f"Indicator warm-up failed for {symbol}: {e}")
+
+
+async def pre_open_warmup():
+    """Scheduler job: fill quotes, chains, history and indicator state before the open."""
+    logger.info("Warming market caches before the open")
+    await poll_quotes()
+    await asyncio.gather(warm_chains(), warm_history())
+    await warm_indicators()
+
+
+async def market_open_tasks():
+    """Scheduler job at the open: replace pre-market quotes and signals with opening ones."""
+    await poll_quotes()
+    await warm_indicators()
+    md = get_market_cache().get(("quote", settings.symbol))
+    if md is not None:
+        logger.info(f"{settings.symbol} open price: {md.price}")
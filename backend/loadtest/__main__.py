@@ -0,0 +1,64 @@
+"""Load-test the API with a mix of REST calls and WebSocket subscribers.
+
+In-process (default) the app runs inside this process against an in-memory
+database and the synthetic data plugin, so no network or services are needed::
+
+    python -m loadtest --duration 10 --concurrency 20 --ws-clients 50
+    python -m loadtest --mix quote=5,option_chain=1,signals=3 --json report.json
+
+Against a running server (start it with ``data_plugin: synthetic`` to stay offline)::
+
+    python -m loadtest --url http://localhost:8000 --duration 30
+"""
+import argparse
+import asyncio
+import json
+import logging
+import sys
+
+from loadtest.harness import LoadTest, format_report, parse_mix, prepare_offline_app
+
+
+async def _run(args) -> dict:
+    app = None
+    if not args.url:
+        app = await prepare_offline_app({"synthetic_strikes": args.strikes})
+    test = LoadTest(
+        app=app,
+        base_url=args.url,
+        mix=parse_mix(args.mix),
+        concurrency=args.concurrency,
+        ws_clients=args.ws_clients,
+        ws_interval=args.ws_interval,
+        duration=args.duration,
+        symbols=args.symbols.split(","),
+        seed=args.seed,
+    )
+    return await test.run()
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="API load generator")
+    parser.add_argument("--url", help="base URL of a running server (default: in-process ASGI)")
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds to run")
+    parser.add_argument("--concurrency", type=int, default=10, help="concurrent REST clients")
+    parser.add_argument("--ws-clients", type=int, default=0, help="WebSocket subscribers")
+    parser.add_argument("--ws-interval", type=float, default=0.5, help="seconds between WebSocket messages")
+    parser.add_argument("--mix", default="quote=5,signals=3,performance=1,positions=1", help="route=weight list")
+    parser.add_argument("--symbols", default="SPX", help="comma-separated symbols to request")
+    parser.add_argument("--strikes", type=int, default=2000, help="synthetic strikes per expiration")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the request mix")
+    parser.add_argument("--json", help="also write the report to this file")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING)
+    report = asyncio.run(_run(args))
+    format_report(report)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
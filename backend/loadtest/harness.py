@@ -0,0 +1,286 @@
+import asyncio
+import json
+import logging
+import random
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional
+
+import httpx
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Route name -> path template; {symbol} and {expiration} are filled per request
+ROUTES: Dict[str, str] = {
+    "quote": "/api/market/quote/{symbol}",
+    "volatility": "/api/market/volatility/{symbol}",
+    "option_chain": "/api/market/option-chain/{symbol}?expiration={expiration}",
+    "signals": "/api/dashboard/signals?symbol={symbol}",
+    "metrics": "/api/dashboard/metrics",
+    "performance": "/api/dashboard/performance",
+    "positions": "/api/positions/",
+    "health": "/health",
+}
+
+DEFAULT_MIX = {"quote": 5, "signals": 3, "performance": 1, "positions": 1}
+
+
+def parse_mix(text: str) -> Dict[str, int]:
+    """Parse ``quote=5,signals=3`` into a route weight mapping."""
+    mix = {}
+    for part in filter(None, (p.strip() for p in text.split(","))):
+        name, _, weight = part.partition("=")
+        if name not in ROUTES:
+            raise ValueError(f"Unknown route '{name}', choose from: {', '.join(ROUTES)}")
+        mix[name] = int(weight or 1)
+    return mix
+
+
+@dataclass
+class RouteStats:
+    latencies: List[float] = field(default_factory=list)
+    errors: int = 0
+    status_codes: Dict[int, int] = field(default_factory=lambda: defaultdict(int))
+
+    def summary(self, elapsed: float) -> Dict[str, Any]:
+        count = len(self.latencies)
+        lat = np.asarray(self.latencies) * 1000 if count else np.zeros(1)
+        p50, p95, p99 = np.percentile(lat, [50, 95, 99])
+        return {
+            "requests": count,
+            "errors": self.errors,
+            "error_rate": self.errors / count if count else 0.0,
+            "throughput_rps": count / elapsed if elapsed > 0 else 0.0,
+            "p50_ms": float(p50),
+            "p95_ms": float(p95),
+            "p99_ms": float(p99),
+            "max_ms": float(lat.max()),
+            "status_codes": dict(self.status_codes),
+        }
+
+
+class ASGIWebSocket:
+    """Minimal in-process WebSocket client that talks to an ASGI app directly."""
+
+    def __init__(self, app, path: str):
+        self.app = app
+        self.path = path
+        self._to_app: asyncio.Queue = asyncio.Queue()
+        self._from_app: asyncio.Queue = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+
+    async def connect(self) -> None:
+        scope = {
+            "type": "websocket",
+            "asgi": {"version": "3.0"},
+            "scheme": "ws",
+            "path": self.path,
+            "raw_path": self.path.encode(),
+            "query_string": b"",
+            "headers": [(b"host", b"loadtest")],
+            "client": ("127.0.0.1", 0),
+            "server": ("loadtest", 80),
+            "subprotocols": [],
+        }
+        self._task = asyncio.create_task(self.app(scope, self._to_app.get, self._from_app.put))
+        await self._to_app.put({"type": "websocket.connect"})
+        message = await self._from_app.get()
+        if message["type"] != "websocket.accept":
+            raise ConnectionError(f"WebSocket rejected: {message}")
+
+    async def send_text(self, text: str) -> None:
+        await self._to_app.put({"type": "websocket.receive", "text": text})
+
+    async def receive_text(self) -> str:
+        message = await self._from_app.get()
+        if message["type"] == "websocket.close":
+            raise ConnectionError("WebSocket closed by server")
+        return message.get("text") or message.get("bytes", b"").decode()
+
+    async def close(self) -> None:
+        await self._to_app.put({"type": "websocket.disconnect", "code": 1000})
+        if self._task:
+            try:
+                await asyncio.wait_for(self._task, timeout=1.0)
+            except (asyncio.TimeoutError, Exception):
+                self._task.cancel()
+
+
+class _RemoteWebSocket:
+    """Adapter giving a ``websockets`` connection the in-process client interface."""
+
+    def __init__(self, url: str):
+        self.url = url
+        self._conn = None
+
+    async def connect(self) -> None:
+        import websockets
+
+        self._conn = await websockets.connect(self.url)
+
+    async def send_text(self, text: str) -> None:
+        await self._conn.send(text)
+
+    async def receive_text(self) -> str:
+        return await self._conn.recv()
+
+    async def close(self) -> None:
+        await self._conn.close()
+
+
+async def prepare_offline_app(synthetic_config: Optional[Dict[str, Any]] = None):
+    """Import the app with an in-memory database and the synthetic data plugin."""
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+    from sqlalchemy.pool import StaticPool
+
+    from models import database
+
+    engine = create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    database.engine = engine
+    database.SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    database.Base.metadata.create_all(bind=engine)
+
+    from api.main import app
+    from core.config import settings
+    from core.orchestrator import orchestrator
+    from plugins.data.synthetic import DataPlugin
+
+    orchestrator.plugins["data"] = DataPlugin({**settings.model_dump(), **(synthetic_config or {})})
+    await orchestrator.initialize_all()
+    return app
+
+
+class LoadTest:
+    """Drives REST clients and WebSocket subscribers and collects latencies."""
+
+    def __init__(
+        self,
+        app=None,
+        base_url: Optional[str] = None,
+        mix: Optional[Dict[str, int]] = None,
+        concurrency: int = 10,
+        ws_clients: int = 0,
+        ws_interval: float = 0.5,
+        duration: float = 10.0,
+        symbols: Optional[List[str]] = None,
+        seed: int = 0,
+    ):
+        if app is None and base_url is None:
+            raise ValueError("Provide an ASGI app or a base URL")
+        self.app = app
+        self.base_url = base_url or "http://loadtest"
+        self.mix = mix or DEFAULT_MIX
+        self.concurrency = concurrency
+        self.ws_clients = ws_clients
+        self.ws_interval = ws_interval
+        self.duration = duration
+        self.symbols = symbols or ["SPX"]
+        self.rng = random.Random(seed)
+        self.stats: Dict[str, RouteStats] = defaultdict(RouteStats)
+        self._deadline = 0.0
+
+    def _client(self) -> httpx.AsyncClient:
+        if self.app is not None:
+            return httpx.AsyncClient(transport=httpx.ASGITransport(app=self.app), base_url=self.base_url)
+        return httpx.AsyncClient(base_url=self.base_url, timeout=30.0)
+
+    def _websocket(self):
+        if self.app is not None:
+            return ASGIWebSocket(self.app, "/ws")
+        return _RemoteWebSocket(self.base_url.replace("http", "ws", 1) + "/ws")
+
+    def _next_path(self) -> tuple:
+        names = list(self.mix)
+        name = self.rng.choices(names, weights=[self.mix[n] for n in names])[0]
+        expiration = (datetime.utcnow() + timedelta(days=30)).date().isoformat()
+        return name, ROUTES[name].format(symbol=self.rng.choice(self.symbols), expiration=expiration)
+
+    async def _rest_worker(self, client: httpx.AsyncClient) -> None:
+        while time.perf_counter() < self._deadline:
+            name, path = self._next_path()
+            stats = self.stats[name]
+            start = time.perf_counter()
+            try:
+                response = await client.get(path)
+                stats.status_codes[response.status_code] += 1
+                # 404 is a valid answer for empty tables, anything 5xx is a failure
+                if response.status_code >= 500:
+                    stats.errors += 1
+            except Exception as e:
+                stats.errors += 1
+                logger.debug(f"{name} request failed: {e}")
+            stats.latencies.append(time.perf_counter() - start)
+
+    @staticmethod
+    async def _ws_reply(ws) -> None:
+        """Wait for the reply to our message, skipping pushed updates such as ``order_update``."""
+        while json.loads(await ws.receive_text()).get("type") != "market_update":
+            pass
+
+    async def _ws_subscriber(self, index: int) -> None:
+        stats = self.stats["ws"]
+        ws = self._websocket()
+        try:
+            await ws.connect()
+        except Exception as e:
+            stats.errors += 1
+            logger.warning(f"WebSocket client {index} failed to connect: {e}")
+            return
+        try:
+            while time.perf_counter() < self._deadline:
+                start = time.perf_counter()
+                try:
+                    await ws.send_text(json.dumps({"type": "subscribe", "client": index}))
+                    await asyncio.wait_for(self._ws_reply(ws), timeout=5.0)
+                    stats.status_codes[101] += 1
+                except Exception:
+                    stats.errors += 1
+                stats.latencies.append(time.perf_counter() - start)
+                await asyncio.sleep(self.ws_interval)
+        finally:
+            await ws.close()
+
+    async def run(self) -> Dict[str, Any]:
+        """Run for ``duration`` seconds and return the per-route report."""
+        self.stats.clear()
+        start = time.perf_counter()
+        self._deadline = start + self.duration
+        async with self._client() as client:
+            await asyncio.gather(
+                *(self._rest_worker(client) for _ in range(self.concurrency)),
+                *(self._ws_subscriber(i) for i in range(self.ws_clients)),
+            )
+        elapsed = time.perf_counter() - start
+
+        routes = {name: stats.summary(elapsed) for name, stats in sorted(self.stats.items())}
+        total = sum(r["requests"] for r in routes.values())
+        errors = sum(r["errors"] for r in routes.values())
+        return {
+            "duration_s": elapsed,
+            "concurrency": self.concurrency,
+            "ws_clients": self.ws_clients,
+            "total_requests": total,
+            "throughput_rps": total / elapsed if elapsed > 0 else 0.0,
+            "error_rate": errors / total if total else 0.0,
+            "routes": routes,
+        }
+
+
+def format_report(report: Dict[str, Any], write: Callable[[str], None] = print) -> None:
+    write(
+        f"{report['total_requests']} requests in {report['duration_s']:.1f}s "
+        f"({report['throughput_rps']:.1f} req/s, error rate {report['error_rate']:.2%})"
+    )
+    header = f"{'route':<14}{'reqs':>8}{'rps':>9}{'err%':>7}{'p50':>9}{'p95':>9}{'p99':>9}{'max':>9}"
+    write(header)
+    write("-" * len(header))
+    for name, r in report["routes"].items():
+        write(
+            f"{name:<14}{r['requests']:>8}{r['throughput_rps']:>9.1f}{100 * r['error_rate']:>6.1f}%"
+            f"{r['p50_ms']:>9.2f}{r['p95_ms']:>9.2f}{r['p99_ms']:>9.2f}{r['max_ms']:>9.2f}"
+        )
+    write("latencies in ms")
@@ -1,6 +1,6 @@
-from sqlalchemy import create_engine, Column, Integer, String, Float, DateTime, Boolean, ForeignKey
+from sqlalchemy import create_engine, Column, Integer, String, Float, DateTime, Boolean, ForeignKey, Index, UniqueConstraint
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, relationship
+from sqlalchemy.orm import declared_attr, sessionmaker, relationship
 from datetime import datetime
 
 from core.config import settings
@@ -28,11 +28,36 @@ class Trade(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+class Order(Base):
+    __tablename__ = "orders"
+    
+    id = Column(Integer, primary_key=True)
+    client_order_id = Column(String, unique=True, index=True)
+    broker_order_id = Column(String, nullable=True, index=True)
+    symbol = Column(String)
+    spread_type = Column(String)  # PUT or CALL
+    short_strike = Column(Float)
+    long_strike = Column(Float)
+    quantity = Column(Integer)
+    expiration_date = Column(DateTime)
+    order_type = Column(String, default="LIMIT")
+    limit_credit = Column(Float, nullable=True)
+    # QUEUED, SUBMITTED, PARTIALLY_FILLED, CANCEL_REQUESTED, FILLED, CANCELLED, REJECTED
+    status = Column(String, default="QUEUED", index=True)
+    filled_quantity = Column(Integer, default=0)
+    avg_fill_price = Column(Float, nullable=True)
+    commission = Column(Float, default=0.0)
+    attempts = Column(Integer, default=0)
+    message = Column(String, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
 class MarketSnapshot(Base):
     __tablename__ = "market_snapshots"
+    __table_args__ = (Index("ix_market_snapshots_symbol_timestamp", "symbol", "timestamp"),)
     
     id = Column(Integer, primary_key=True)
-    timestamp = Column(DateTime, default=datetime.utcnow)
+    timestamp = Column(DateTime, default=datetime.utcnow, index=True)
     symbol = Column(String)
     price = Column(Float)
     iv_rank = Column(Float)
@@ -40,6 +65,48 @@ class MarketSnapshot(Base):
     market_bias = Column(String)
     signal_confidence = Column(Float)
 
+class SnapshotRollupMixin:
+    """Aggregated market snapshots per symbol and time bucket"""
+    
+    @declared_attr
+    def __table_args__(cls):
+        return (UniqueConstraint("symbol", "bucket", name=f"uq_{cls.__tablename__}_symbol_bucket"),)
+    
+    id = Column(Integer, primary_key=True)
+    symbol = Column(String, nullable=False)
+    bucket = Column(DateTime, nullable=False)  # bucket start (UTC)
+    open = Column(Float)
+    high = Column(Float)
+    low = Column(Float)
+    close = Column(Float)
+    iv_rank = Column(Float)  # means over the bucket
+    vix = Column(Float)
+    signal_confidence = Column(Float)
+    # Non-null values behind each mean, so merges weight them correctly
+    iv_rank_samples = Column(Integer, default=0)
+    vix_samples = Column(Integer, default=0)
+    signal_confidence_samples = Column(Integer, default=0)
+    market_bias = Column(String)  # as of the last snapshot in the bucket
+    samples = Column(Integer, default=0)
+    first_at = Column(DateTime)
+    last_at = Column(DateTime)
+
+class MarketSnapshot1m(SnapshotRollupMixin, Base):
+    __tablename__ = "market_snapshots_1m"
+
+class MarketSnapshot1h(SnapshotRollupMixin, Base):
+    __tablename__ = "market_snapshots_1h"
+
+class MarketSnapshot1d(SnapshotRollupMixin, Base):
+    __tablename__ = "market_snapshots_1d"
+
+class RollupWatermark(Base):
+    __tablename__ = "rollup_watermarks"
+    
+    name = Column(String, primary_key=True)
+    last_id = Column(Integer, default=0)  # highest source row id already rolled up
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
 class PerformanceMetric(Base):
     __tablename__ = "performance_metrics"
     
@@ -52,17 +119,37 @@ class PerformanceMetric(Base):
     total_trades = Column(Integer)
     winning_trades = Column(Integer)
 
-# Database setup
-engine = create_engine(settings.database_url)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Database setup; the engine and session factory are built on first use so that
+# importing the models does not load a DBAPI driver. Assigning ``engine`` or
+# ``SessionLocal`` on this module (as the tests do) takes precedence.
+def get_engine():
+    """Return the module engine, creating it from settings on first use"""
+    engine = globals().get("engine")
+    if engine is None:
+        engine = globals()["engine"] = create_engine(settings.database_url)
+    return engine
+
+def get_sessionmaker():
+    """Return the module session factory, bound to ``get_engine()``"""
+    factory = globals().get("SessionLocal")
+    if factory is None:
+        factory = globals()["SessionLocal"] = sessionmaker(autocommit=False, autoflush=False, bind=get_engine())
+    return factory
+
+def __getattr__(name):
+    if name == "engine":
+        return get_engine()
+    if name == "SessionLocal":
+        return get_sessionmaker()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 async def init_db():
     """Initialize database tables"""
-    Base.metadata.create_all(bind=engine)
+    Base.metadata.create_all(bind=get_engine())
 
 def get_db():
     """Get database session"""
-    db = SessionLocal()
+    db = get_sessionmaker()()
     try:
         yield db
     finally:
@@ -1,16 +1,118 @@
 import asyncio
+from typing import Any, Dict, Optional
+
+import numpy as np
+import pandas as pd
+
 from plugins.base import PluginInterface
+from plugins.analysis.technical import compute_ema, compute_macd, compute_rsi
+
+# Relative weight of each indicator's vote in the composite score
+SIGNAL_WEIGHTS = {"rsi": 0.3, "ema_cross": 0.35, "macd": 0.35}
+BIAS_THRESHOLD = 0.2
+
+
+def compute_iv_percentile(price_data: pd.DataFrame, lookback: int = 252, window: int = 20) -> Optional[float]:
+    """Percentile (0-100) of the latest IV reading within the lookback period.
+
+    Uses an ``iv`` column when the frame has one, otherwise falls back to
+    annualised realised volatility of close-to-close returns.
+    """
+    if "iv" in price_data.columns:
+        iv = price_data["iv"].dropna()
+    else:
+        returns = np.log(price_data["close"]).diff()
+        iv = returns.rolling(window=window, min_periods=window).std().dropna() * np.sqrt(252)
+    iv = iv.iloc[-lookback:]
+    if iv.empty:
+        return None
+    return float((iv <= iv.iloc[-1]).mean() * 100)
+
+
+def compute_composite_signal(price_data: pd.DataFrame, config: Dict[str, Any]) -> Dict[str, Any]:
+    """Combine RSI, EMA cross, MACD and IV percentile into a market bias."""
+    fast = config.get("ema_fast", 9)
+    slow = config.get("ema_slow", 21)
+    if price_data is None or "close" not in price_data.columns or len(price_data) < slow:
+        return {
+            "bias": "NEUTRAL",
+            "confidence": 0.0,
+            "details": {},
+            "recommendation": {"action": "NO_TRADE", "reason": "Not enough price history"},
+        }
+
+    close = price_data["close"].astype(float)
+    overbought = config.get("rsi_overbought", 70)
+    oversold = config.get("rsi_oversold", 30)
+
+    rsi = float(compute_rsi(close, config.get("rsi_period", 14)).iloc[-1])
+    if rsi >= overbought:
+        rsi_signal, rsi_vote = "OVERBOUGHT", -1.0
+    elif rsi <= oversold:
+        rsi_signal, rsi_vote = "OVERSOLD", 1.0
+    else:
+        rsi_signal, rsi_vote = "NEUTRAL", 0.5 if rsi > 50 else -0.5
+
+    cross = 1 if compute_ema(close, fast).iloc[-1] > compute_ema(close, slow).iloc[-1] else -1
+    macd = compute_macd(close, fast, slow).iloc[-1]
+    # Direction from the MACD line, half weight when the histogram disagrees
+    macd_vote = 1.0 if macd["macd"] > 0 else -1.0
+    if (macd["hist"] > 0) != (macd_vote > 0):
+        macd_vote *= 0.5
+
+    iv_pct = compute_iv_percentile(price_data, config.get("iv_percentile_period", 252))
+    high_vol = 100 * config.get("high_vol_threshold", 0.75)
+    if iv_pct is None:
+        iv_signal = "UNKNOWN"
+    elif iv_pct >= high_vol:
+        iv_signal = "HIGH"
+    elif iv_pct <= 100 - high_vol:
+        iv_signal = "LOW"
+    else:
+        iv_signal = "NORMAL"
+
+    score = (
+        SIGNAL_WEIGHTS["rsi"] * rsi_vote
+        + SIGNAL_WEIGHTS["ema_cross"] * cross
+        + SIGNAL_WEIGHTS["macd"] * macd_vote
+    )
+    if score > BIAS_THRESHOLD:
+        bias = "BULLISH"
+    elif score < -BIAS_THRESHOLD:
+        bias = "BEARISH"
+    else:
+        bias = "NEUTRAL"
+
+    vol_text = {"HIGH": "elevated", "LOW": "low", "NORMAL": "normal"}.get(iv_signal, "unknown")
+    if bias == "BULLISH":
+        action = "PUT_CREDIT_SPREAD"
+    elif bias == "BEARISH":
+        action = "CALL_CREDIT_SPREAD"
+    else:
+        action = "NO_TRADE" if iv_signal == "LOW" else "IRON_CONDOR"
+
+    return {
+        "bias": bias,
+        "confidence": round(0.5 + 0.5 * abs(score), 2),
+        "details": {
+            "rsi": {"value": round(rsi, 2), "signal": rsi_signal},
+            "ema_cross": {"value": cross, "signal": "BULLISH" if cross > 0 else "BEARISH"},
+            "macd": {"value": round(float(macd["macd"]), 4), "signal": "BULLISH" if macd_vote > 0 else "BEARISH"},
+            "iv_percentile": {"value": None if iv_pct is None else round(iv_pct, 1), "signal": iv_signal},
+        },
+        "recommendation": {
+            "action": action,
+            "reason": f"{bias.title()} signals with {vol_text} volatility",
+        },
+    }
+
 
 class SignalsPlugin(PluginInterface):
-    """Combine various signal calculations. Returns a simple bullish signal."""
+    """Combine RSI, EMA cross, MACD and IV percentile into a composite signal."""
 
     async def _setup(self) -> None:
         await asyncio.sleep(0)
 
     async def execute(self, market_data: dict | None = None) -> dict:
-        await asyncio.sleep(0)
-        return {
-            "bias": "BULLISH",
-            "confidence": 0.7,
-            "details": {"rsi": 55, "macd": 0.5},
-        }
+        price_data = (market_data or {}).get("price_data")
+        return compute_composite_signal(price_data, self.config)
@@ -0,0 +1,88 @@
+from typing import Dict
+
+import numpy as np
+from scipy.special import ndtr
+
+SQRT_2PI = np.sqrt(2 * np.pi)
+
+
+def _norm_pdf(x: np.ndarray) -> np.ndarray:
+    return np.exp(-0.5 * x * x) / SQRT_2PI
+
+
+def _d1_d2(spot, strike, t, vol, rate):
+    spot, strike, t, vol = (np.asarray(a, dtype=float) for a in (spot, strike, t, vol))
+    sqrt_t = np.sqrt(np.maximum(t, 1e-12))
+    vol = np.maximum(vol, 1e-12)
+    d1 = (np.log(spot / strike) + (rate + 0.5 * vol * vol) * t) / (vol * sqrt_t)
+    return d1, d1 - vol * sqrt_t, sqrt_t
+
+
+def bs_price(spot, strike, t, vol, rate: float = 0.0, is_call=True) -> np.ndarray:
+    """Black-Scholes price, vectorized over any broadcastable inputs."""
+    d1, d2, _ = _d1_d2(spot, strike, t, vol, rate)
+    discount = np.exp(-rate * np.asarray(t, dtype=float))
+    call = spot * ndtr(d1) - strike * discount * ndtr(d2)
+    put = call - spot + strike * discount
+    return np.where(is_call, call, put)
+
+
+def bs_greeks(spot, strike, t, vol, rate: float = 0.0, is_call=True) -> Dict[str, np.ndarray]:
+    """Delta, gamma, theta (per day) and vega (per vol point) for each option."""
+    d1, d2, sqrt_t = _d1_d2(spot, strike, t, vol, rate)
+    t = np.asarray(t, dtype=float)
+    vol = np.asarray(vol, dtype=float)
+    pdf = _norm_pdf(d1)
+    discount = np.exp(-rate * t)
+
+    call_delta = ndtr(d1)
+    gamma = pdf / (spot * vol * sqrt_t)
+    vega = spot * pdf * sqrt_t / 100
+    call_theta = -spot * pdf * vol / (2 * sqrt_t) - rate * strike * discount * ndtr(d2)
+    put_theta = -spot * pdf * vol / (2 * sqrt_t) + rate * strike * discount * ndtr(-d2)
+    return {
+        "delta": np.where(is_call, call_delta, call_delta - 1.0),
+        "gamma": gamma,
+        "theta": np.where(is_call, call_theta, put_theta) / 365,
+        "vega": vega,
+    }
+
+
+def implied_volatility(
+    price,
+    spot,
+    strike,
+    t,
+    rate: float = 0.0,
+    is_call=True,
+    tol: float = 1e-6,
+    max_iter: int = 50,
+) -> np.ndarray:
+    """Vectorized implied volatility using Newton steps guarded by bisection.
+
+    Prices outside the no-arbitrage bounds come back as NaN.
+    """
+    price, spot, strike, t = np.broadcast_arrays(*(np.asarray(a, dtype=float) for a in (price, spot, strike, t)))
+    is_call = np.broadcast_to(is_call, price.shape)
+    discount = np.exp(-rate * t)
+    intrinsic = np.where(is_call, np.maximum(spot - strike * discount, 0), np.maximum(strike * discount - spot, 0))
+    upper_bound = np.where(is_call, spot, strike * discount)
+    valid = (price > intrinsic) & (price < upper_bound) & (t > 0)
+
+    lo = np.full(price.shape, 1e-4)
+    hi = np.full(price.shape, 5.0)
+    vol = np.full(price.shape, 0.2)
+    for _ in range(max_iter):
+        model = bs_price(spot, strike, t, vol, rate, is_call)
+        diff = model - price
+        if np.all(np.abs(diff[valid]) < tol):
+            break
+        hi = np.where(diff > 0, vol, hi)
+        lo = np.where(diff <= 0, vol, lo)
+        d1, _, sqrt_t = _d1_d2(spot, strike, t, vol, rate)
+        vega = spot * _norm_pdf(d1) * sqrt_t
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            newton = vol - diff / vega
+        # Fall back to bisection whenever Newton leaves the bracket
+        vol = np.where((newton > lo) & (newton < hi), newton, 0.5 * (lo + hi))
+    return np.where(valid, vol, np.nan)
@@ -1,11 +1,35 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
+import inspect
 import logging
+import time
+
+from core.metrics import PLUGIN_ERRORS, PLUGIN_LATENCY, timed_plugin_method
 
 logger = logging.getLogger(__name__)
 
 class PluginInterface(ABC):
     """Base interface for all plugins"""
+
+    # Label used for this plugin class in metrics, e.g. "data.yfinance"
+    _plugin_label = "base"
+
+    # Orchestrator names of plugins that must be ready before this one initializes
+    requires: Tuple[str, ...] = ()
+    # Optional plugins may fail or time out without blocking readiness
+    optional: bool = False
+    # Per-plugin override of ``settings.plugin_init_timeout`` (seconds)
+    init_timeout: Optional[float] = None
+
+    def __init_subclass__(cls, **kwargs):
+        """Record latency of ``execute`` and ``get_*`` coroutines on every subclass"""
+        super().__init_subclass__(**kwargs)
+        cls._plugin_label = cls.__module__.removeprefix("plugins.")
+        for name, attr in list(cls.__dict__.items()):
+            if name != "execute" and not name.startswith("get_"):
+                continue
+            if inspect.iscoroutinefunction(attr) and not getattr(attr, "_timed", False):
+                setattr(cls, name, timed_plugin_method(cls._plugin_label, name, attr))
     
     def __init__(self, config: Dict[str, Any]):
         self.config = config
@@ -16,7 +40,14 @@ class PluginInterface(ABC):
         if self._initialized:
             return
         
-        await self._setup()
+        start = time.perf_counter()
+        try:
+            await self._setup()
+        except Exception:
+            PLUGIN_ERRORS.inc(self._plugin_label, "initialize")
+            raise
+        finally:
+            PLUGIN_LATENCY.observe(time.perf_counter() - start, self._plugin_label, "initialize")
         self._initialized = True
         logger.info(f"{self.__class__.__name__} initialized")
     
@@ -2,16 +2,19 @@ from plugins.base import PluginInterface
 from abc import abstractmethod
 from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Optional
-import pandas as pd
+from typing import TYPE_CHECKING, Dict, List, Optional
+import asyncio
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 @dataclass
 class OptionChain:
     symbol: str
     underlying_price: float
     timestamp: datetime
-    calls: pd.DataFrame
-    puts: pd.DataFrame
+    calls: "pd.DataFrame"
+    puts: "pd.DataFrame"
 
 @dataclass
 class MarketData:
@@ -36,6 +39,16 @@ class DataPlugin(PluginInterface):
         pass
     
     @abstractmethod
-    async def get_historical_data(self, symbol: str, period: str) -> pd.DataFrame:
+    async def get_historical_data(self, symbol: str, period: str) -> "pd.DataFrame":
         """Fetch historical price data"""
         pass
+
+    async def get_expirations(self, symbol: str) -> List[datetime]:
+        """List available option expirations (empty if the provider cannot say)"""
+        return []
+
+    async def get_option_chains(self, symbol: str) -> Dict[datetime, OptionChain]:
+        """Fetch the chain for every available expiration concurrently"""
+        expirations = await self.get_expirations(symbol)
+        chains = await asyncio.gather(*(self.get_option_chain(symbol, exp) for exp in expirations))
+        return dict(zip(expirations, chains))
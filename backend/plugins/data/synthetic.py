@@ -0,0 +1,204 @@
+import asyncio
+import re
+import time
+import zlib
+from datetime import datetime, timedelta
+from typing import AsyncIterator, Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from plugins.analysis.greeks import bs_greeks, bs_price
+from .base import DataPlugin as BaseDataPlugin, OptionChain, MarketData
+
+TRADING_DAYS = 252
+SECONDS_PER_YEAR = TRADING_DAYS * 6.5 * 3600
+
+# Starting prices for common underlyings; anything else is derived from the symbol
+BASE_PRICES = {"SPX": 4400.0, "SPY": 440.0, "QQQ": 380.0, "IWM": 190.0, "DIA": 350.0, "^VIX": 16.0}
+
+_PERIOD_RE = re.compile(r"^(\d+)(d|wk|mo|y)$")
+_PERIOD_DAYS = {"d": 1, "wk": 5, "mo": 21, "y": TRADING_DAYS}
+
+
+def period_to_days(period: str, default: int = TRADING_DAYS) -> int:
+    """Translate yfinance-style periods ('5d', '3mo', '1y') into trading days."""
+    match = _PERIOD_RE.match(period or "")
+    if not match:
+        return default
+    return int(match.group(1)) * _PERIOD_DAYS[match.group(2)]
+
+
+class DataPlugin(BaseDataPlugin):
+    """Offline data plugin producing deterministic, seeded market data.
+
+    Prices follow geometric Brownian motion with Poisson jumps, option chains
+    are priced with Black-Scholes over a volatility smile, and live quotes
+    advance at ``synthetic_tick_rate`` ticks per second of wall-clock time.
+    The same seed always yields the same history and chains.
+    """
+
+    def __init__(self, config):
+        super().__init__(config)
+        self.seed = int(self.config.get("synthetic_seed", 42))
+        self.tick_rate = float(self.config.get("synthetic_tick_rate", 10.0))
+        self.volatility = float(self.config.get("synthetic_volatility", 0.18))
+        self.drift = float(self.config.get("synthetic_drift", 0.07))
+        self.jump_intensity = float(self.config.get("synthetic_jump_intensity", 4.0))
+        self.jump_std = float(self.config.get("synthetic_jump_std", 0.03))
+        self.strike_count = int(self.config.get("synthetic_strikes", 2000))
+        self.expiration_count = int(self.config.get("synthetic_expirations", 8))
+        self.history_days = int(self.config.get("synthetic_history_days", 5 * TRADING_DAYS))
+        self.rate = float(self.config.get("synthetic_rate", 0.04))
+        self._history: Dict[str, pd.DataFrame] = {}
+        self._live: Dict[str, Tuple[int, float, int, np.random.Generator]] = {}
+        self._clock_start = time.monotonic()
+
+    async def _setup(self) -> None:
+        await asyncio.sleep(0)
+
+    async def execute(self, *args, **kwargs):
+        pass
+
+    def _rng(self, *keys) -> np.random.Generator:
+        return np.random.default_rng([self.seed, *(zlib.crc32(str(k).encode()) for k in keys)])
+
+    def _base_price(self, symbol: str) -> float:
+        if symbol in BASE_PRICES:
+            return BASE_PRICES[symbol]
+        return 20.0 + zlib.crc32(symbol.encode()) % 480
+
+    def _simulate_returns(self, rng: np.random.Generator, steps: int, dt: float) -> np.ndarray:
+        """Log returns of GBM with compound Poisson jumps."""
+        diffusion = (self.drift - 0.5 * self.volatility ** 2) * dt + self.volatility * np.sqrt(dt) * rng.standard_normal(steps)
+        jumps = rng.poisson(self.jump_intensity * dt, steps) * rng.normal(0.0, self.jump_std, steps)
+        return diffusion + jumps
+
+    def _ohlc_from_closes(self, rng: np.random.Generator, closes: np.ndarray, step_vol: float) -> Dict[str, np.ndarray]:
+        opens = np.concatenate(([closes[0]], closes[:-1])) * np.exp(rng.normal(0, 0.2 * step_vol, len(closes)))
+        spread = np.abs(rng.normal(0, step_vol, len(closes)))
+        return {
+            "open": opens,
+            "high": np.maximum(opens, closes) * (1 + spread),
+            "low": np.minimum(opens, closes) * (1 - spread),
+            "close": closes,
+        }
+
+    def _daily_history(self, symbol: str) -> pd.DataFrame:
+        history = self._history.get(symbol)
+        if history is not None:
+            return history
+
+        rng = self._rng(symbol, "daily")
+        dt = 1 / TRADING_DAYS
+        closes = self._base_price(symbol) * np.exp(np.cumsum(self._simulate_returns(rng, self.history_days, dt)))
+        bars = self._ohlc_from_closes(rng, closes, self.volatility * np.sqrt(dt))
+        bars["volume"] = rng.integers(1_000_000, 5_000_000, self.history_days)
+        end = pd.Timestamp(datetime.utcnow().date())
+        index = pd.bdate_range(end=end, periods=self.history_days)
+        history = self._history[symbol] = pd.DataFrame(bars, index=index)
+        return history
+
+    def _advance(self, symbol: str) -> Tuple[float, int]:
+        """Move the live price forward by the ticks elapsed since the last call."""
+        tick = int((time.monotonic() - self._clock_start) * self.tick_rate)
+        state = self._live.get(symbol)
+        if state is None:
+            rng = self._rng(symbol, "live")
+            state = (tick, float(self._daily_history(symbol)["close"].iloc[-1]), 0, rng)
+        last_tick, price, volume, rng = state
+
+        elapsed = tick - last_tick
+        if elapsed > 0:
+            # A sum of k i.i.d. tick returns collapses to one draw scaled by sqrt(k)
+            dt = elapsed / (self.tick_rate * SECONDS_PER_YEAR)
+            price *= float(np.exp(self._simulate_returns(rng, 1, dt)[0]))
+            volume += int(rng.integers(1, 500) * elapsed)
+        self._live[symbol] = (tick, price, volume, rng)
+        return price, volume
+
+    async def get_market_data(self, symbol: str) -> MarketData:
+        price, volume = self._advance(symbol)
+        history = self._daily_history(symbol)
+        tr = (history["high"] - history["low"]).iloc[-14:]
+        vix_price, _ = self._advance("^VIX") if symbol != "^VIX" else (price, volume)
+        return MarketData(
+            symbol=symbol,
+            price=price,
+            volume=volume,
+            timestamp=datetime.utcnow(),
+            atr=float(tr.mean()),
+            vix=float(vix_price),
+        )
+
+    async def stream_quotes(self, symbol: str) -> AsyncIterator[MarketData]:
+        """Yield a fresh quote every tick, forever."""
+        interval = 1.0 / self.tick_rate
+        while True:
+            yield await self.get_market_data(symbol)
+            await asyncio.sleep(interval)
+
+    async def get_historical_data(self, symbol: str, period: str) -> pd.DataFrame:
+        days = min(period_to_days(period), self.history_days)
+        return self._daily_history(symbol).iloc[-days:]
+
+    def get_intraday_bars(self, symbol: str, interval_seconds: int = 60, count: int = 390) -> pd.DataFrame:
+        """Deterministic intraday OHLCV bars ending at the current minute."""
+        rng = self._rng(symbol, "intraday", interval_seconds)
+        dt = interval_seconds / SECONDS_PER_YEAR
+        start_price = float(self._daily_history(symbol)["close"].iloc[-1])
+        closes = start_price * np.exp(np.cumsum(self._simulate_returns(rng, count, dt)))
+        bars = self._ohlc_from_closes(rng, closes, self.volatility * np.sqrt(dt))
+        bars["volume"] = rng.integers(1_000, 50_000, count)
+        end = pd.Timestamp(datetime.utcnow()).floor(f"{interval_seconds}s")
+        index = pd.date_range(end=end, periods=count, freq=f"{interval_seconds}s")
+        return pd.DataFrame(bars, index=index)
+
+    async def get_expirations(self, symbol: str) -> List[datetime]:
+        today = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+        first_friday = today + timedelta(days=(4 - today.weekday()) % 7 or 7)
+        return [first_friday + timedelta(weeks=i) for i in range(self.expiration_count)]
+
+    def smile(self, moneyness: np.ndarray, t: float) -> np.ndarray:
+        """Skewed volatility smile; puts carry more premium than calls."""
+        log_m = np.log(moneyness)
+        term = 1.0 / np.sqrt(max(t, 1 / 365) * 12)
+        iv = self.volatility * (1 - 0.8 * log_m * min(term, 3.0) + 2.0 * log_m ** 2)
+        return np.clip(iv, 0.05, 3.0)
+
+    async def get_option_chain(self, symbol: str, expiration: datetime) -> OptionChain:
+        spot, _ = self._advance(symbol)
+        t = max((expiration - datetime.utcnow()).total_seconds(), 3600.0) / (365 * 24 * 3600)
+        strikes = np.round(np.linspace(0.5 * spot, 1.5 * spot, self.strike_count), 2)
+        iv = self.smile(strikes / spot, t)
+        rng = self._rng(symbol, "chain", expiration.date().isoformat())
+        exp_code = expiration.strftime("%y%m%d")
+
+        sides = {}
+        for right, is_call in (("C", True), ("P", False)):
+            mid = bs_price(spot, strikes, t, iv, self.rate, is_call)
+            greeks = bs_greeks(spot, strikes, t, iv, self.rate, is_call)
+            half_spread = np.maximum(0.025, 0.01 * mid)
+            sides[right] = pd.DataFrame({
+                "contractSymbol": [f"{symbol}{exp_code}{right}{int(k * 1000):08d}" for k in strikes],
+                "strike": strikes,
+                "lastPrice": np.round(mid, 2),
+                "bid": np.round(np.maximum(mid - half_spread, 0.0), 2),
+                "ask": np.round(mid + half_spread, 2),
+                "volume": rng.integers(0, 5_000, len(strikes)),
+                "openInterest": rng.integers(0, 50_000, len(strikes)),
+                "impliedVolatility": iv,
+                "delta": greeks["delta"],
+                "gamma": greeks["gamma"],
+                "theta": greeks["theta"],
+                "vega": greeks["vega"],
+            })
+
+        await asyncio.sleep(0)
+        return OptionChain(
+            symbol=symbol,
+            underlying_price=spot,
+            timestamp=datetime.utcnow(),
+            calls=sides["C"],
+            puts=sides["P"],
+        )
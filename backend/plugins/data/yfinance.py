@@ -1,11 +1,16 @@
 from datetime import datetime
+from typing import List
 from .base import DataPlugin as BaseDataPlugin, OptionChain, MarketData
 import pandas as pd
 import yfinance as yf
 import asyncio
 
 class DataPlugin(BaseDataPlugin):
-    """Yahoo Finance data plugin"""
+    """Yahoo Finance data plugin
+
+    yfinance makes blocking HTTP requests, so every call runs in a worker
+    thread; concurrent fetches then overlap instead of stalling the event loop.
+    """
 
     async def _setup(self) -> None:
         await asyncio.sleep(0)
@@ -14,6 +19,9 @@ class DataPlugin(BaseDataPlugin):
         pass
 
     async def get_option_chain(self, symbol: str, expiration: datetime) -> OptionChain:
+        return await asyncio.to_thread(self._option_chain, symbol, expiration)
+
+    def _option_chain(self, symbol: str, expiration: datetime) -> OptionChain:
         try:
             ticker = yf.Ticker(symbol)
             chain = ticker.option_chain(expiration.strftime("%Y-%m-%d"))
@@ -34,6 +42,9 @@ class DataPlugin(BaseDataPlugin):
         )
 
     async def get_market_data(self, symbol: str) -> MarketData:
+        return await asyncio.to_thread(self._market_data, symbol)
+
+    def _market_data(self, symbol: str) -> MarketData:
         try:
             ticker = yf.Ticker(symbol)
             info = ticker.info
@@ -55,7 +66,19 @@ class DataPlugin(BaseDataPlugin):
             vix=float(vix),
         )
 
+    async def get_expirations(self, symbol: str) -> List[datetime]:
+        return await asyncio.to_thread(self._expirations, symbol)
+
+    def _expirations(self, symbol: str) -> List[datetime]:
+        try:
+            return [datetime.fromisoformat(exp) for exp in yf.Ticker(symbol).options]
+        except Exception:
+            return []
+
     async def get_historical_data(self, symbol: str, period: str) -> pd.DataFrame:
+        return await asyncio.to_thread(self._historical_data, symbol, period)
+
+    def _historical_data(self, symbol: str, period: str) -> pd.DataFrame:
         try:
             data = yf.download(symbol, period=period, progress=False)
         except Exception:
@@ -0,0 +1,45 @@
+from plugins.base import PluginInterface
+from abc import abstractmethod
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List, Optional
+
+# Broker-side order states reported in ``OrderUpdate.status``
+SUBMITTED = "SUBMITTED"
+PARTIALLY_FILLED = "PARTIALLY_FILLED"
+FILLED = "FILLED"
+CANCELLED = "CANCELLED"
+REJECTED = "REJECTED"
+
+@dataclass
+class OrderUpdate:
+    order_id: str  # broker order id
+    status: str
+    filled_quantity: int = 0
+    avg_fill_price: Optional[float] = None
+    commission: float = 0.0
+    message: Optional[str] = None
+
+class BrokerRateLimitError(Exception):
+    """Raised when the broker rejects a request for exceeding its rate limit"""
+
+class ExecutorPlugin(PluginInterface):
+    """Base class for broker execution plugins"""
+
+    @abstractmethod
+    async def submit_order(self, order: Dict[str, Any]) -> OrderUpdate:
+        """Send a spread order to the broker"""
+        pass
+
+    @abstractmethod
+    async def get_order_statuses(self, order_ids: List[str]) -> Dict[str, OrderUpdate]:
+        """Fetch the status of many orders in a single broker call"""
+        pass
+
+    @abstractmethod
+    async def cancel_order(self, order_id: str) -> OrderUpdate:
+        """Request cancellation of a working order"""
+        pass
+
+    async def execute(self, order: Dict[str, Any]) -> Dict[str, Any]:
+        """Submit a single order and return its first update as a dict"""
+        return asdict(await self.submit_order(order))
@@ -0,0 +1,117 @@
+import asyncio
+import random
+import time
+from collections import Counter, deque
+from typing import Any, Deque, Dict, List
+
+from .base import (
+    ExecutorPlugin as BaseExecutorPlugin,
+    BrokerRateLimitError,
+    OrderUpdate,
+    CANCELLED,
+    FILLED,
+    PARTIALLY_FILLED,
+    REJECTED,
+    SUBMITTED,
+)
+
+# Contracts per spread (short and long leg) for commission purposes
+LEGS = 2
+
+
+class ExecutorPlugin(BaseExecutorPlugin):
+    """Local simulated broker with request latency, partial fills and rejections.
+
+    Orders rest until status is polled; each poll gives every working order a
+    ``sim_fill_probability`` chance to trade, and a trade fills either the
+    remainder or a partial clip.  Like a real broker it enforces a request rate
+    limit (``sim_max_requests_per_second``) and raises
+    ``BrokerRateLimitError`` when exceeded.  ``calls`` counts requests per method.
+    """
+
+    def __init__(self, config):
+        super().__init__(config)
+        self.rng = random.Random(int(self.config.get("sim_seed", 7)))
+        self.latency = float(self.config.get("sim_latency_ms", 50)) / 1000
+        self.fill_probability = float(self.config.get("sim_fill_probability", 0.6))
+        self.partial_fill_probability = float(self.config.get("sim_partial_fill_probability", 0.5))
+        self.reject_probability = float(self.config.get("sim_reject_probability", 0.0))
+        self.slippage = float(self.config.get("sim_slippage", 0.05))
+        self.max_requests_per_second = float(self.config.get("sim_max_requests_per_second", 20))
+        self.commission_per_contract = float(self.config.get("commission_per_contract", 0.65))
+        self.orders: Dict[str, Dict[str, Any]] = {}
+        self.calls: Counter = Counter()
+        self._requests: Deque[float] = deque()
+        self._next_id = 0
+
+    async def _setup(self) -> None:
+        await asyncio.sleep(self.latency)
+
+    async def _request(self, method: str) -> None:
+        now = time.monotonic()
+        while self._requests and now - self._requests[0] >= 1.0:
+            self._requests.popleft()
+        if len(self._requests) >= self.max_requests_per_second:
+            raise BrokerRateLimitError(f"{method}: more than {self.max_requests_per_second:g} requests/s")
+        self._requests.append(now)
+        self.calls[method] += 1
+        await asyncio.sleep(self.latency * self.rng.uniform(0.5, 1.5))
+
+    def _update(self, order_id: str) -> OrderUpdate:
+        order = self.orders[order_id]
+        return OrderUpdate(
+            order_id=order_id,
+            status=order["status"],
+            filled_quantity=order["filled"],
+            avg_fill_price=order["avg_price"],
+            commission=round(order["filled"] * LEGS * self.commission_per_contract, 2),
+            message=order.get("message"),
+        )
+
+    async def submit_order(self, order: Dict[str, Any]) -> OrderUpdate:
+        await self._request("submit_order")
+        self._next_id += 1
+        order_id = f"SIM-{self._next_id:06d}"
+        rejected = self.rng.random() < self.reject_probability
+        self.orders[order_id] = {
+            "quantity": int(order.get("quantity", 1)),
+            "limit": float(order.get("limit_credit") or 1.0),
+            "status": REJECTED if rejected else SUBMITTED,
+            "filled": 0,
+            "avg_price": None,
+            "message": "Rejected by simulated broker" if rejected else None,
+        }
+        return self._update(order_id)
+
+    def _maybe_fill(self, order: Dict[str, Any]) -> None:
+        if order["status"] not in (SUBMITTED, PARTIALLY_FILLED) or self.rng.random() >= self.fill_probability:
+            return
+        remaining = order["quantity"] - order["filled"]
+        clip = remaining
+        if remaining > 1 and self.rng.random() < self.partial_fill_probability:
+            clip = self.rng.randint(1, remaining - 1)
+        # Credit spreads fill at or slightly below the limit credit
+        price = round(order["limit"] - self.rng.uniform(0, self.slippage), 2)
+        filled = order["filled"] + clip
+        order["avg_price"] = round(((order["avg_price"] or 0.0) * order["filled"] + price * clip) / filled, 4)
+        order["filled"] = filled
+        order["status"] = FILLED if filled == order["quantity"] else PARTIALLY_FILLED
+
+    async def get_order_statuses(self, order_ids: List[str]) -> Dict[str, OrderUpdate]:
+        await self._request("get_order_statuses")
+        updates = {}
+        for order_id in order_ids:
+            if order_id not in self.orders:
+                continue
+            self._maybe_fill(self.orders[order_id])
+            updates[order_id] = self._update(order_id)
+        return updates
+
+    async def cancel_order(self, order_id: str) -> OrderUpdate:
+        await self._request("cancel_order")
+        order = self.orders.get(order_id)
+        if order is None:
+            return OrderUpdate(order_id=order_id, status=REJECTED, message="Unknown order")
+        if order["status"] in (SUBMITTED, PARTIALLY_FILLED):
+            order["status"] = CANCELLED
+        return self._update(order_id)
@@ -1,17 +1,33 @@
 import asyncio
 from datetime import datetime
-from plugins.base import PluginInterface
+from typing import Dict, List
+from .base import ExecutorPlugin as BaseExecutorPlugin, OrderUpdate, CANCELLED, FILLED
 
-class ExecutorPlugin(PluginInterface):
+class ExecutorPlugin(BaseExecutorPlugin):
     """Mock executor plugin simulating order placement."""
 
+    def __init__(self, config):
+        super().__init__(config)
+        self.orders: Dict[str, OrderUpdate] = {}
+
     async def _setup(self) -> None:
         await asyncio.sleep(0)
 
-    async def execute(self, order: dict) -> dict:
+    async def submit_order(self, order: dict) -> OrderUpdate:
+        await asyncio.sleep(0)
+        update = OrderUpdate(
+            order_id=f"SIM-{int(datetime.utcnow().timestamp() * 1000)}-{len(self.orders)}",
+            status=FILLED,
+            filled_quantity=order.get("quantity", 1),
+            avg_fill_price=order.get("limit_credit") or 2.35,
+        )
+        self.orders[update.order_id] = update
+        return update
+
+    async def get_order_statuses(self, order_ids: List[str]) -> Dict[str, OrderUpdate]:
+        await asyncio.sleep(0)
+        return {order_id: self.orders[order_id] for order_id in order_ids if order_id in self.orders}
+
+    async def cancel_order(self, order_id: str) -> OrderUpdate:
         await asyncio.sleep(0)
-        return {
-            "order_id": f"SIM-{int(datetime.utcnow().timestamp())}",
-            "status": "FILLED",
-            "filled_price": order.get("limit_credit", 2.35),
-        }
+        return self.orders.get(order_id) or OrderUpdate(order_id=order_id, status=CANCELLED)
@@ -1,15 +1,51 @@
 import asyncio
+from typing import Dict, Optional
+
+from core.correlation import RollingCorrelation, get_correlation_engine
 from plugins.base import PluginInterface
 
+# Shares per option contract
+MULTIPLIER = 100
+
 class RiskPlugin(PluginInterface):
-    """Basic risk manager evaluating trade sizing."""
+    """Basic risk manager evaluating trade sizing and benchmark exposure."""
+
+    def __init__(self, config):
+        super().__init__(config)
+        # None follows the live engine, which startup rebuilds from settings
+        self.engine: Optional[RollingCorrelation] = None
+        self.max_beta_weighted_delta = self.config.get("max_beta_weighted_delta")
 
     async def _setup(self) -> None:
         await asyncio.sleep(0)
 
+    def correlation(self) -> RollingCorrelation:
+        return self.engine or get_correlation_engine()
+
+    @staticmethod
+    def trade_delta(trade: dict) -> float:
+        """Approximate share delta of a credit spread from its short-leg delta."""
+        # Short puts are long the underlying, short calls are short it
+        sign = 1.0 if str(trade.get("type", trade.get("spread_type", "PUT"))).upper() == "PUT" else -1.0
+        return sign * abs(trade.get("delta") or 0.0) * MULTIPLIER * (trade.get("quantity") or 1)
+
+    def portfolio_exposure(self, deltas: Dict[str, float]) -> dict:
+        """Beta-weighted delta of per-underlying share deltas, in benchmark shares."""
+        return self.correlation().beta_weighted_delta(deltas)
+
     async def execute(self, trade: dict | None = None) -> dict:
         await asyncio.sleep(0)
-        return {
+        result = {
             "approved": True,
             "reason": "within limits",
         }
+        if not trade or not trade.get("symbol"):
+            return result
+        exposure = self.portfolio_exposure({trade["symbol"]: self.trade_delta(trade)})
+        result["beta"] = self.correlation().beta(trade["symbol"])
+        result["beta_weighted_delta"] = exposure["beta_weighted_delta"]
+        limit = self.max_beta_weighted_delta
+        if limit is not None and abs(exposure["beta_weighted_delta"]) > limit:
+            result["approved"] = False
+            result["reason"] = f"beta-weighted delta {exposure['beta_weighted_delta']:.1f} exceeds {limit:g}"
+        return result
@@ -1,20 +1,162 @@
 import asyncio
-from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+import numpy as np
+
 from plugins.base import PluginInterface
 
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Assumed annualised volatility when a chain carries neither delta nor IV
+DEFAULT_VOLATILITY = 0.20
+
+
+def _short_leg_delta(
+    options: "pd.DataFrame",
+    underlying_price: float,
+    spread_type: str,
+    dte: int,
+) -> np.ndarray:
+    """Absolute delta of each row, estimated from IV and moneyness when missing."""
+    if "delta" in options.columns:
+        return options["delta"].abs().to_numpy(dtype=float)
+
+    from scipy.special import ndtr
+
+    strikes = options["strike"].to_numpy(dtype=float)
+    if "impliedVolatility" in options.columns:
+        vol = options["impliedVolatility"].to_numpy(dtype=float)
+        vol = np.where(vol > 0, vol, DEFAULT_VOLATILITY)
+    else:
+        vol = np.full(len(strikes), DEFAULT_VOLATILITY)
+    t = max(dte, 1) / 365.0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        d1 = (np.log(underlying_price / strikes) + 0.5 * vol ** 2 * t) / (vol * np.sqrt(t))
+    call_delta = ndtr(d1)
+    return np.abs(call_delta - 1.0) if spread_type == "PUT" else call_delta
+
+
+def find_credit_spreads(
+    options: "pd.DataFrame",
+    underlying_price: float,
+    spread_type: str = "PUT",
+    max_width: float = 50,
+    credit_threshold: float = 0.50,
+    dte: int = 30,
+    max_delta: float = 0.30,
+) -> List[Dict[str, Any]]:
+    """Enumerate vertical credit spreads on one side of a chain and score them.
+
+    Every OTM short strike is paired with each cheaper long strike no more than
+    ``max_width`` away.  Strikes are sorted, so the valid long legs of a short
+    leg form a contiguous band found with ``searchsorted``; only those pairs
+    are materialised instead of the full strikes x strikes grid.
+    """
+    required = {"strike", "bid", "ask"}
+    if options is None or options.empty or not required.issubset(options.columns) or underlying_price <= 0:
+        return []
+
+    options = options.sort_values("strike")
+    strikes = options["strike"].to_numpy(dtype=float)
+    bids = options["bid"].to_numpy(dtype=float)
+    asks = options["ask"].to_numpy(dtype=float)
+    deltas = _short_leg_delta(options, underlying_price, spread_type, dte)
+
+    otm = strikes < underlying_price if spread_type == "PUT" else strikes > underlying_price
+    shorts = np.nonzero(otm & (deltas <= max_delta))[0]
+    if spread_type == "PUT":
+        band_start = np.searchsorted(strikes, strikes[shorts] - max_width, side="left")
+        band_end = shorts
+    else:
+        band_start = shorts + 1
+        band_end = np.searchsorted(strikes, strikes[shorts] + max_width, side="right")
+    counts = np.maximum(band_end - band_start, 0)
+    total = int(counts.sum())
+    if total == 0:
+        return []
+
+    # Expand each (short, band) into explicit pair indices without a Python loop
+    short_idx = np.repeat(shorts, counts)
+    offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+    long_idx = np.repeat(band_start, counts) + offsets
+
+    width = np.abs(strikes[short_idx] - strikes[long_idx])
+    credit = bids[short_idx] - asks[long_idx]
+    keep = (width > 0) & (credit >= credit_threshold) & (credit < width)
+    short_idx, long_idx = short_idx[keep], long_idx[keep]
+    if len(short_idx) == 0:
+        return []
+
+    width = width[keep]
+    credit = credit[keep]
+    pop = 1.0 - deltas[short_idx]
+    max_loss = width - credit
+    expected_value = 100 * (pop * credit - (1.0 - pop) * max_loss)
+    score = expected_value / (100 * max_loss)
+
+    return [
+        {
+            "type": spread_type,
+            "short_strike": float(strikes[s]),
+            "long_strike": float(strikes[l]),
+            "width": float(w),
+            "credit": round(float(c), 2),
+            "probability_profit": round(float(p), 4),
+            "expected_value": round(float(ev), 2),
+            "max_loss": round(float(100 * ml), 2),
+            "delta": round(float(deltas[s]), 4),
+            "score": round(float(sc), 4),
+        }
+        for s, l, w, c, p, ev, ml, sc in zip(
+            short_idx, long_idx, width, credit, pop, expected_value, max_loss, score
+        )
+    ]
+
+
+def select_spreads(
+    puts: "pd.DataFrame",
+    calls: "pd.DataFrame",
+    underlying_price: float,
+    bias: Optional[str],
+    config: Dict[str, Any],
+) -> List[Dict[str, Any]]:
+    """Score the chain sides that match the market bias."""
+    sides = {"BULLISH": ["PUT"], "BEARISH": ["CALL"]}.get(bias or "", ["PUT", "CALL"])
+    dte = (config.get("dte_min", 30) + config.get("dte_max", 45)) // 2
+    candidates: List[Dict[str, Any]] = []
+    for side in sides:
+        candidates.extend(find_credit_spreads(
+            puts if side == "PUT" else calls,
+            underlying_price,
+            spread_type=side,
+            max_width=config.get("max_spread_width", 50),
+            credit_threshold=config.get("credit_threshold", 0.50),
+            dte=dte,
+            max_delta=2 * config.get("delta_target", 0.10),
+        ))
+    return candidates
+
+
 class SelectorPlugin(PluginInterface):
-    """Selects a basic credit spread based on input option chain."""
+    """Selects the best-scoring credit spread from an option chain."""
 
     async def _setup(self) -> None:
         await asyncio.sleep(0)
 
-    async def execute(self, option_chain: dict | None = None) -> dict:
-        await asyncio.sleep(0)
-        expiration = datetime.utcnow() + timedelta(days=30)
-        return {
-            "spread_type": "PUT",
-            "short_strike": 4200,
-            "long_strike": 4150,
-            "expiration": expiration.isoformat(),
-            "credit": 2.35,
-        }
+    async def execute(self, option_chain: dict | None = None) -> dict | None:
+        if not option_chain:
+            return None
+        candidates = select_spreads(
+            option_chain.get("puts"),
+            option_chain.get("calls"),
+            option_chain.get("underlying_price", 0.0),
+            option_chain.get("bias"),
+            self.config,
+        )
+        if not candidates:
+            return None
+        best = max(candidates, key=lambda c: c["score"])
+        if option_chain.get("expiration"):
+            best["expiration"] = option_chain["expiration"]
+        return best
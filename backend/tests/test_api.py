@@ -1,5 +1,5 @@
 import os
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 
 import pytest
 from sqlalchemy import create_engine
@@ -72,3 +72,196 @@ def test_get_quote():
     assert response.status_code == 200
     data = response.json()
     assert "price" in data
+
+
+@pytest.fixture
+def signal_snapshots():
+    from core.signals import signal_snapshots
+
+    signal_snapshots.clear()
+    yield signal_snapshots
+    signal_snapshots.clear()
+
+
+def test_signals_snapshot_etag(signal_snapshots):
+    snapshot = signal_snapshots.publish("SPX", {"symbol": "SPX", "market_bias": "BULLISH"})
+    response = client.get("/api/dashboard/signals?symbol=SPX")
+    assert response.status_code == 200
+    assert response.headers["etag"] == snapshot.etag
+    assert response.json()["market_bias"] == "BULLISH"
+
+    cached = client.get("/api/dashboard/signals?symbol=SPX", headers={"If-None-Match": snapshot.etag})
+    assert cached.status_code == 304
+
+
+def test_signals_reject_untracked_symbols(signal_snapshots):
+    response = client.get("/api/dashboard/signals?symbol=NOPE")
+    assert response.status_code == 404
+    assert signal_snapshots.get("NOPE", record=False) is None
+
+
+def test_metrics_endpoint_reports_route_latency():
+    client.get("/health")
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert 'http_request_duration_seconds_count{method="GET",route="/health",status="200"}' in response.text
+
+
+def test_admin_profiling_requires_token(monkeypatch):
+    from core.config import settings
+
+    monkeypatch.setattr(settings, "admin_token", "secret")
+    assert client.post("/api/admin/profile/cpu?seconds=0.05").status_code == 403
+
+    response = client.post("/api/admin/profile/cpu?seconds=0.05", headers={"X-Admin-Token": "secret"})
+    assert response.status_code == 200
+    assert int(response.headers["x-profile-samples"]) > 0
+
+
+def test_admin_jobs_lists_schedule_and_last_runs(monkeypatch):
+    from core.config import settings
+    from core.scheduler import init_scheduler, scheduler
+
+    monkeypatch.setattr(settings, "admin_token", "secret")
+    scheduler.remove_all_jobs()
+    init_scheduler()
+    assert client.get("/api/admin/jobs").status_code == 403
+
+    body = client.get("/api/admin/jobs", headers={"X-Admin-Token": "secret"}).json()
+    jobs = {job["id"]: job for job in body["jobs"]}
+    assert body["role"] == "single"
+    assert jobs["pre_open_warmup"]["max_instances"] == 1
+    assert jobs["market_open"]["skipped"] == {"late": 0, "overlap": 0}
+
+
+def test_x_profile_header_profiles_single_request(monkeypatch):
+    from core.config import settings
+
+    monkeypatch.setattr(settings, "admin_token", "secret")
+    headers = {"X-Profile": "1", "X-Admin-Token": "secret"}
+    response = client.get("/api/positions/", headers=headers)
+    assert response.status_code == 200
+    profile_id = response.headers["x-profile-id"]
+
+    profile = client.get(f"/api/admin/profiles/{profile_id}", headers={"X-Admin-Token": "secret"})
+    assert profile.status_code == 200
+    assert profile.headers["x-profile-route"] == "/api/positions/"
+
+    # Without a valid token the header is ignored
+    assert "x-profile-id" not in client.get("/api/positions/", headers={"X-Profile": "1"}).headers
+
+
+def test_ready_reports_plugin_status_separately_from_health():
+    import asyncio
+    from core.orchestrator import orchestrator
+
+    assert client.get("/health").status_code == 200
+    asyncio.run(orchestrator.initialize_all())
+    response = client.get("/ready")
+    assert response.status_code == 200
+    body = response.json()
+    assert body["ready"] is True
+    assert body["plugins"]["data"]["status"] == "ready"
+    assert body["plugins"]["executor"]["optional"] is True
+
+
+def test_ready_includes_startup_phase_timings():
+    from core.startup import startup_timer
+
+    startup_timer.record("plugins", 0.1)
+    body = client.get("/ready").json()
+    assert body["startup"]["phases"]["plugins"] == 0.1
+    assert "import" in body["startup"]["phases"]
+
+
+def test_quote_served_from_shared_cache(monkeypatch):
+    import uuid
+    from api.routes import market_data
+    from core.shared_cache import SharedMarketCache
+    from plugins.data.base import MarketData
+
+    cache = SharedMarketCache.open(f"opc_api_{uuid.uuid4().hex[:8]}", quote_slots=4, chain_slots=1, chain_rows=8)
+    try:
+        cache.publish_quote(MarketData(symbol="SHRD", price=123.5, volume=42, timestamp=datetime.utcnow(), atr=1.0, vix=20.0))
+        monkeypatch.setattr(market_data, "get_shared_cache", lambda: cache)
+        body = client.get("/api/market/quote/SHRD").json()
+        assert body["price"] == 123.5
+        assert body["volume"] == 42
+    finally:
+        cache.close(unlink=True)
+
+
+def test_execute_queues_order_for_submission():
+    response = client.post("/api/trading/execute", json={
+        "symbol": "SPX",
+        "spread_type": "PUT",
+        "short_strike": 4200,
+        "long_strike": 4150,
+        "quantity": 1,
+        "expiration": "2030-01-18T00:00:00",
+        "limit_credit": 1.25,
+    })
+    assert response.status_code == 200
+    order = response.json()
+    assert order["status"] == "QUEUED"
+
+    fetched = client.get(f"/api/trading/orders/{order['order_id']}").json()
+    assert fetched["limit_credit"] == 1.25
+    assert client.post(f"/api/trading/orders/{order['order_id']}/cancel").json()["status"] == "CANCELLED"
+    assert client.get("/api/trading/orders/unknown").status_code == 404
+
+
+def test_snapshot_history_routes_by_range():
+    db = database.SessionLocal()
+    start = datetime.utcnow().replace(minute=0, second=0, microsecond=0) - timedelta(hours=3)
+    db.add_all([database.MarketSnapshot(timestamp=start + i * timedelta(minutes=1), symbol="SPY", price=500.0 + i) for i in range(120)])
+    db.commit()
+    db.close()
+    from core.retention import SnapshotRollup
+    SnapshotRollup().run()
+
+    params = {"start": f"{start.isoformat()}Z", "end": (start + timedelta(hours=1)).isoformat()}
+    response = client.get("/api/market/snapshots/SPY", params={**params, "resolution": "1h"})
+    assert response.status_code == 200
+    body = response.json()
+    assert body["resolution"] == "1h"
+    assert [p["open"] for p in body["points"]] == [500.0, 560.0]
+    # An hour of one-minute snapshots is served raw until it exceeds max_points
+    assert client.get("/api/market/snapshots/SPY", params={**params, "max_points": 100}).json()["resolution"] == "raw"
+    assert client.get("/api/market/snapshots/SPY", params={**params, "max_points": 30}).json()["resolution"] == "1h"
+    assert client.get("/api/market/snapshots/SPY", params={**params, "resolution": "5m"}).status_code == 400
+
+
+def test_performance_history_is_bounded(monkeypatch):
+    from core.config import settings
+    monkeypatch.setattr(settings, "equity_max_points_limit", 10)
+    response = client.get("/api/dashboard/performance", params={"days": 3650, "max_points": 100000})
+    assert response.status_code == 200
+    body = response.json()
+    assert len(body["data"]) <= 10
+    assert all({"date", "pnl", "cumulative_pnl"} <= set(point) for point in body["data"])
+    assert client.get("/api/dashboard/performance", params={"method": "mean"}).status_code == 400
+
+
+def test_risk_metrics_include_correlation_engine_output():
+    risk = client.get("/api/analytics/risk-metrics").json()
+    assert {"beta", "beta_weighted_delta", "benchmark", "correlation_benchmark"} <= set(risk)
+    correlation = client.get("/api/analytics/correlation").json()
+    size = len(correlation["symbols"])
+    assert correlation["symbols"][0] == correlation["benchmark"]
+    assert len(correlation["correlation"]) == size and set(correlation["beta"]) == set(correlation["symbols"])
+
+
+def test_opportunities_reject_non_positive_top_k():
+    assert client.get("/api/trading/opportunities", params={"top_k": -1}).status_code == 422
+
+
+def test_websocket_replies_and_pushed_updates_share_the_socket():
+    from core.broadcast import broadcaster
+
+    with client.websocket_connect("/ws") as ws:
+        broadcaster.publish({"type": "order_update", "data": {"order_id": "ORD-1"}})
+        ws.send_text("ping")
+        received = [ws.receive_json()["type"], ws.receive_json()["type"]]
+    assert sorted(received) == ["market_update", "order_update"]
@@ -0,0 +1,57 @@
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from core.bars import BarAggregator, BarRingBuffer
+
+
+def test_ring_buffer_window_is_contiguous_view_after_wrap():
+    buf = BarRingBuffer(capacity=4)
+    for i in range(10):
+        buf.append(i, i, i + 1, i - 1, i + 0.5, 100)
+
+    window = buf.window(3)
+    assert len(buf) == 4
+    assert list(window[0]) == [7.0, 8.0, 9.0]
+    closes = buf.field("close")
+    assert closes.flags["C_CONTIGUOUS"]
+    assert np.shares_memory(closes, buf._data)
+    assert list(closes) == [6.5, 7.5, 8.5, 9.5]
+
+
+def test_ring_buffer_memory_is_constant():
+    buf = BarRingBuffer(capacity=16)
+    size = buf.nbytes
+    for i in range(1000):
+        buf.append(i, 1, 1, 1, 1, 1)
+    assert buf.nbytes == size
+
+
+def test_aggregator_builds_ohlcv_bars():
+    agg = BarAggregator(intervals=("1m",), capacity=10)
+    start = datetime(2025, 1, 6, 14, 30)
+    quotes = [(0, 100.0, 1000), (10, 102.0, 1100), (20, 99.0, 1250), (50, 101.0, 1300), (61, 103.0, 1400)]
+    for offset, price, volume in quotes:
+        agg.on_quote("SPX", price, volume, start + timedelta(seconds=offset))
+
+    frame = agg.as_frame("SPX", "1m")
+    assert len(frame) == 1
+    bar = frame.iloc[0]
+    assert (bar["open"], bar["high"], bar["low"], bar["close"]) == (100.0, 102.0, 99.0, 101.0)
+    assert bar["volume"] == 300
+
+
+def test_aggregator_unknown_symbol_is_empty():
+    agg = BarAggregator(intervals=("1s",), capacity=10)
+    assert agg.as_frame("QQQ", "1s").empty
+    assert agg.window("QQQ", "1s").shape == (6, 0)
+    assert agg.symbols() == []
+
+
+def test_aggregator_ignores_symbols_beyond_max_symbols():
+    agg = BarAggregator(intervals=("1s",), capacity=10, max_symbols=2)
+    start = datetime(2025, 1, 6, 14, 30)
+    for second in range(3):
+        for symbol in ("SPX", "SPY", "XYZ"):
+            agg.on_quote(symbol, 100.0 + second, 0, start + timedelta(seconds=second))
+    assert agg.symbols() == ["SPX", "SPY"]
@@ -0,0 +1,31 @@
+from benchmarks.suite import Benchmark, compare, run_benchmarks, time_callable
+import benchmarks.suite as suite
+
+
+def report(**medians):
+    return {"results": {k: {"median_s": v} for k, v in medians.items()}}
+
+
+def test_compare_flags_regressions_beyond_tolerance():
+    baseline = report(rsi=1.0, atr=1.0, ema=1.0)
+    current = report(rsi=1.2, atr=1.5, ema=0.5)
+    regressions = compare(current, baseline, tolerance=0.25)
+    assert [r["benchmark"] for r in regressions] == ["atr"]
+    assert regressions[0]["ratio"] == 1.5
+
+
+def test_compare_ignores_benchmarks_missing_from_current_run():
+    assert compare(report(), report(rsi=1.0)) == []
+
+
+def test_time_callable_reports_per_call_time():
+    result = time_callable(lambda: sum(range(100)), repeat=3, min_time=0.001)
+    assert result["median_s"] > 0
+    assert result["loops"] >= 1
+
+
+def test_run_benchmarks_on_small_inputs(monkeypatch):
+    monkeypatch.setattr(suite, "BENCHMARKS", [Benchmark("noop", lambda size: (lambda: size), (10, 10_000))])
+    result = run_benchmarks(max_size=100, repeat=2, log=lambda line: None)
+    assert list(result["results"]) == ["noop[10]"]
+    assert "numpy" in result["meta"]
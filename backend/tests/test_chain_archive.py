@@ -0,0 +1,94 @@
+import asyncio
+import dataclasses
+from datetime import date, datetime, timedelta
+
+import pyarrow.parquet as pq
+import pytest
+from fastapi.testclient import TestClient
+
+from api.main import app
+from core import scheduler
+from core.chain_archive import ChainArchive
+from core.config import settings
+from core.orchestrator import orchestrator
+from plugins.data.synthetic import DataPlugin
+
+START = datetime(2024, 1, 2, 21)
+
+
+def synthetic(**config):
+    return DataPlugin({"synthetic_seed": 5, "synthetic_strikes": 1000, "synthetic_expirations": 2, **config})
+
+
+@pytest.fixture
+def archive(tmp_path):
+    archive = ChainArchive(str(tmp_path))
+    chain = asyncio.run(synthetic().get_option_chain("SPX", START + timedelta(days=30)))
+    for day in range(5):
+        ts = START + timedelta(days=day)
+        for expiration in (date(2024, 2, 16), date(2024, 3, 15)):
+            archive.write(dataclasses.replace(chain, timestamp=ts), expiration)
+    return archive
+
+
+def test_files_are_partitioned_and_pruned_by_directory(archive):
+    files = archive.files("SPX", "2024-01-03", "2024-01-04", expirations=["2024-02-16"])
+    assert len(files) == 2
+    assert all("/symbol=SPX/date=2024-01-0" in f and "/expiration=2024-02-16/" in f for f in files)
+    assert archive.files("QQQ") == []
+    assert archive.symbols() == ["SPX"]
+
+
+def test_files_use_dictionary_strikes_and_small_row_groups(archive):
+    metadata = pq.ParquetFile(archive.files("SPX")[0]).metadata
+    assert metadata.num_rows == 2000
+    assert metadata.num_row_groups == 4
+    column = metadata.schema.names.index("strike")
+    first, second = metadata.row_group(0).column(column), metadata.row_group(1).column(column)
+    assert first.compression == "ZSTD"
+    assert first.has_dictionary_page
+    # Sorted by strike, so each row group covers a narrow, non-overlapping band
+    assert first.statistics.max <= second.statistics.min
+
+
+def test_query_filters_dates_strikes_and_columns(archive):
+    df = archive.query("SPX", "2024-01-03", "2024-01-05", strike_range=0.05, columns=["date", "expiration", "strike", "bid"])
+
+    assert list(df.columns) == ["date", "expiration", "strike", "bid"]
+    assert sorted(set(df["date"])) == [date(2024, 1, 3), date(2024, 1, 4), date(2024, 1, 5)]
+    assert set(df["expiration"]) == {date(2024, 2, 16), date(2024, 3, 15)}
+    spot = archive.query("SPX", "2024-01-03", "2024-01-03", columns=["underlying_price"])["underlying_price"].iloc[0]
+    assert df["strike"].between(0.95 * spot, 1.05 * spot).all()
+    assert len(df) == 3 * 2 * len(df[(df["date"] == date(2024, 1, 3)) & (df["expiration"] == date(2024, 2, 16))])
+
+
+def test_query_by_side_and_expiration(archive):
+    puts = archive.query("SPX", expirations=[date(2024, 3, 15)], right="put", columns=["right", "strike"])
+    assert set(puts["right"]) == {"P"}
+    assert len(puts) == 5 * 1000
+
+
+def test_query_rejects_unknown_columns_and_handles_empty_ranges(archive):
+    with pytest.raises(ValueError):
+        archive.query("SPX", columns=["strike", "nope"])
+    empty = archive.query("SPX", "2023-01-01", "2023-12-31", columns=["date", "strike"])
+    assert empty.empty and list(empty.columns) == ["date", "strike"]
+
+
+def test_archive_job_writes_every_expiration(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "chain_archive_path", str(tmp_path))
+    monkeypatch.setattr(settings, "signal_symbols", ["SPY"])
+    monkeypatch.setitem(orchestrator.plugins, "data", synthetic(synthetic_strikes=100))
+
+    asyncio.run(scheduler.archive_chains())
+
+    archive = ChainArchive(str(tmp_path))
+    assert len(archive.files("SPY")) == 2
+    client = TestClient(app)
+    body = client.get("/api/market/chain-history/SPY", params={"strike_range": 0.1, "columns": "strike,delta", "limit": 5}).json()
+    assert body["rows"] == len(body["data"]) == 5 and body["truncated"]
+    assert list(body["data"][0]) == ["strike", "delta"]
+    assert client.get("/api/market/chain-history/SPY", params={"columns": "bogus"}).status_code == 400
+    assert client.get("/api/market/chain-history/SPY", params={"limit": -3}).status_code == 422
+    everything = client.get("/api/market/chain-history/SPY", params={"columns": "strike"}).json()
+    assert not everything["truncated"] and everything["rows"] == len(archive.query("SPY"))
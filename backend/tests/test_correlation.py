@@ -0,0 +1,131 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from core.bars import BarAggregator
+from core.config import settings
+from core.correlation import RollingCorrelation, get_correlation_engine, init_correlation_engine
+from plugins.risk.portfolio_manager import RiskPlugin
+
+SYMBOLS = ["SPY", "QQQ", "IWM", "TLT"]
+
+
+def correlated_closes(bars=1_000, seed=11):
+    rng = np.random.default_rng(seed)
+    market = rng.normal(0, 0.001, bars)
+    loadings = np.array([1.0, 1.0, 1.2, 0.8, -0.3])
+    returns = market[:, None] * loadings + rng.normal(0, 0.0005, (bars, len(loadings)))
+    prices = np.array([4400.0, 440.0, 380.0, 190.0, 95.0])
+    return prices * np.exp(np.cumsum(returns, axis=0))
+
+
+def test_incremental_statistics_match_full_recompute():
+    closes = correlated_closes()
+    engine = RollingCorrelation(SYMBOLS, window=120, benchmark="SPX")
+    engine.load(closes)
+
+    returns = np.diff(np.log(closes), axis=0)[-120:]
+    assert engine.count == 120
+    np.testing.assert_allclose(engine.covariance(), np.cov(returns, rowvar=False), rtol=1e-9, atol=1e-14)
+    np.testing.assert_allclose(engine.correlation(), np.corrcoef(returns, rowvar=False), atol=1e-9)
+    expected_beta = np.cov(returns, rowvar=False)[:, 0] / returns[:, 0].var(ddof=1)
+    np.testing.assert_allclose(engine.betas(), expected_beta, rtol=1e-9)
+    assert engine.beta("QQQ") > engine.beta("IWM") > 0 > engine.beta("TLT")
+
+
+def test_statistics_need_two_returns_and_ignore_unknown_symbols():
+    engine = RollingCorrelation(["SPY"], window=10)
+    engine.update([4400.0, 440.0])
+    engine.update([4401.0, 440.1])
+    assert np.isnan(engine.covariance()).all()
+    assert engine.beta("SPY") is None and engine.beta("NOPE") is None
+    assert engine.snapshot()["correlation"] == [[None, None], [None, None]]
+
+
+def test_beta_weighted_delta_scales_by_beta_and_price():
+    engine = RollingCorrelation(["SPY"], window=50, benchmark="SPX")
+    bench = 4000.0 * np.exp(np.cumsum(np.random.default_rng(2).normal(0, 0.001, 60)))
+    # SPY moves exactly twice the benchmark's log return
+    spy = 400.0 * (bench / bench[0]) ** 2
+    engine.load(np.column_stack([bench, spy]))
+
+    assert engine.beta("SPY") == pytest.approx(2.0)
+    exposure = engine.beta_weighted_delta({"SPY": 100.0, "XYZ": 5.0})
+    assert exposure["beta_weighted_delta"] == pytest.approx(100.0 * 2.0 * spy[-1] / bench[-1], rel=1e-4)
+    assert exposure["untracked"] == ["XYZ"]
+
+
+def test_bars_from_the_aggregator_update_once_the_universe_has_closed():
+    aggregator = BarAggregator(["1m"], capacity=16)
+    engine = RollingCorrelation(["SPY"], window=10, benchmark="SPX")
+    aggregator.add_listener(engine.on_bar)
+    start = datetime(2024, 1, 2, 15, 0)
+
+    for minute in range(5):
+        ts = start + timedelta(minutes=minute)
+        aggregator.on_quote("SPX", 4400.0 + minute, 0, ts)
+        aggregator.on_quote("SPY", 440.0 + minute * 0.2, 0, ts)
+    # Four completed minutes: the first sets the base closes, three give returns
+    assert engine.count == 3
+
+    # SPY stops quoting: SPX bars still flow once two newer bars are waiting
+    for minute in range(5, 10):
+        aggregator.on_quote("SPX", 4400.0 + minute, 0, start + timedelta(minutes=minute))
+    assert engine.count == 6
+
+
+def test_risk_plugin_reports_and_limits_beta_weighted_delta():
+    engine = RollingCorrelation(["SPY"], window=50, benchmark="SPX")
+    engine.load(correlated_closes(60)[:, :2])
+    plugin = RiskPlugin({"max_beta_weighted_delta": 5.0})
+    plugin.engine = engine
+
+    small = asyncio.run(plugin.execute({"symbol": "SPY", "type": "PUT", "delta": 0.01, "quantity": 1}))
+    large = asyncio.run(plugin.execute({"symbol": "SPY", "type": "CALL", "delta": 0.3, "quantity": 10}))
+
+    assert small["approved"] and small["beta"] == engine.beta("SPY")
+    assert small["beta_weighted_delta"] > 0 > large["beta_weighted_delta"]
+    assert not large["approved"] and "beta-weighted delta" in large["reason"]
+    assert asyncio.run(plugin.execute(None))["approved"]
+
+
+def test_engine_is_rebuilt_from_settings_and_replaces_its_bar_listener(monkeypatch):
+    from core.bars import get_bar_aggregator
+
+    listeners = get_bar_aggregator()._listeners
+    monkeypatch.setattr(settings, "correlation_symbols", ["QQQ", "IWM"])
+    previous = get_correlation_engine()
+    engine = init_correlation_engine()
+    try:
+        assert get_correlation_engine() is engine
+        assert engine.symbols == [settings.correlation_benchmark, "QQQ", "IWM"]
+        assert engine.on_bar in listeners
+        assert previous.on_bar not in listeners
+        assert RiskPlugin({}).correlation() is engine
+    finally:
+        monkeypatch.undo()
+        init_correlation_engine()
+
+
+def test_symbols_that_never_quoted_do_not_stall_the_rest(caplog):
+    closes = correlated_closes(41)[:, :3]
+    engine = RollingCorrelation(["SPY", "QQQ"], window=10, benchmark="SPX")
+    missing = closes[:30].copy()
+    missing[:, 0] = np.nan
+
+    engine.load(missing)
+    assert "No quotes yet for SPX" in caplog.text
+    assert engine.count == 10
+    corr = engine.correlation()
+    assert np.isnan(corr[0]).all() and np.isnan(corr[:, 0]).all()
+    returns = np.diff(np.log(closes[:30, 1:]), axis=0)[-10:]
+    assert corr[1, 2] == pytest.approx(np.corrcoef(returns, rowvar=False)[0, 1])
+    assert engine.beta("SPY") is None
+
+    # The benchmark's statistics appear once the window holds only its real returns
+    engine.load(closes[30:40])
+    assert engine.beta("SPY") is None
+    engine.load(closes[40:])
+    assert engine.beta("SPY") is not None
@@ -0,0 +1,104 @@
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from core.downsample import downsample, lttb, minmax
+from core.equity import EquityCurve
+from models.database import Base, PerformanceMetric, Trade
+
+NOW = datetime(2024, 6, 3, 20, 0)
+
+
+@pytest.fixture
+def session_factory():
+    engine = create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    return sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+def walk(size, seed=3):
+    y = np.cumsum(np.random.default_rng(seed).normal(size=size))
+    return np.arange(size, dtype=float), y
+
+
+@pytest.mark.parametrize("select", [lttb, minmax])
+def test_downsampling_is_bounded_ordered_and_keeps_spikes(select):
+    x, y = walk(100_000)
+    y[54_321] += 1_000
+    y[12_345] -= 1_000
+
+    indices = select(x, y, 500)
+    assert len(indices) <= 500
+    assert np.all(np.diff(indices) > 0)
+    assert {54_321, 12_345} <= set(indices.tolist())
+
+
+def test_lttb_keeps_endpoints_and_small_inputs_untouched():
+    x, y = walk(1_000)
+    indices = lttb(x, y, 50)
+    assert len(indices) == 50 and indices[0] == 0 and indices[-1] == 999
+    assert lttb(x[:10], y[:10], 50).tolist() == list(range(10))
+    with pytest.raises(ValueError):
+        downsample(x, y, 10, method="average")
+
+
+def seed_history(db, days=400, intraday=50):
+    start = NOW - timedelta(days=days)
+    db.add_all([
+        PerformanceMetric(date=start + timedelta(days=i), total_pnl=10.0 * i, win_rate=0.5, sharpe_ratio=1.0,
+                          max_drawdown=0.1, total_trades=i, winning_trades=i // 2)
+        for i in range(days)
+    ])
+    last = start + timedelta(days=days - 1)
+    db.add_all([
+        Trade(order_id=f"T{i}", symbol="SPX", exit_date=last + timedelta(seconds=10 * (i + 1)), pnl=1.0, status="CLOSED")
+        for i in range(intraday)
+    ])
+    db.commit()
+
+
+def test_series_extends_daily_metrics_with_intraday_trades(session_factory):
+    with session_factory() as db:
+        seed_history(db)
+    curve = EquityCurve(session_factory=session_factory)
+    curve.refresh()
+
+    assert len(curve.values) == 450
+    assert curve.values[399] == 3990.0
+    assert curve.values[-1] == 3990.0 + 50
+
+    body = curve.view(30, max_points=5000, now=NOW)
+    first, last = body["data"][0], body["data"][-1]
+    # The window covers whole days, matching the per-day cache key
+    assert body["start_date"] == first["date"] == datetime(2024, 5, 4).isoformat()
+    assert body["end_date"] == datetime(2024, 6, 4).isoformat()
+    # The window opens at the level of the last metric at or before its start
+    assert first["pnl"] == 0.0 and first["cumulative_pnl"] == 3690.0
+    assert last["cumulative_pnl"] == 4040.0
+    assert body["total_points"] == len(body["data"]) == 1 + 30 + 50
+    assert curve.view(30, max_points=5000, now=NOW + timedelta(hours=3)) is body
+
+
+def test_views_are_bounded_and_cached_until_the_series_changes(session_factory):
+    with session_factory() as db:
+        seed_history(db, intraday=5_000)
+    curve = EquityCurve(ttl=3600, session_factory=session_factory)
+
+    view = curve.view(365, max_points=200, method="minmax", now=NOW)
+    assert view["total_points"] > 5_000 and len(view["data"]) <= 200
+    assert curve.view(365, max_points=200, method="minmax", now=NOW) is view
+    assert curve.view(365, max_points=100, method="minmax", now=NOW) is not view
+
+    with session_factory() as db:
+        db.add(Trade(order_id="late", symbol="SPX", exit_date=NOW, pnl=-25.0, status="CLOSED"))
+        db.commit()
+    # Within the TTL the cached series is still served
+    assert curve.view(365, max_points=200, method="minmax", now=NOW) is view
+    curve.refresh(force=True)
+    fresh = curve.view(365, max_points=200, method="minmax", now=NOW)
+    assert fresh is not view
+    assert fresh["data"][-1]["cumulative_pnl"] == view["data"][-1]["cumulative_pnl"] - 25.0
@@ -0,0 +1,80 @@
+import asyncio
+
+from core.leader import FileLeaderLock, LeaderElector, LocalRedis, RedisLeaderLock, build_leader_lock
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_file_lock_admits_one_holder_until_released(tmp_path):
+    path = str(tmp_path / "leader.lock")
+    first, second = FileLeaderLock(path), FileLeaderLock(path)
+
+    async def run():
+        assert await first.acquire()
+        assert not await second.acquire()
+        await first.release()
+        assert await second.acquire()
+        await second.release()
+
+    asyncio.run(run())
+
+
+def test_redis_lock_lease_expires_without_renewal():
+    clock = FakeClock()
+    client = LocalRedis(clock)
+    first = RedisLeaderLock(client, "leader", ttl=10)
+    second = RedisLeaderLock(client, "leader", ttl=10)
+
+    async def run():
+        assert await first.acquire()
+        assert not await second.acquire()
+        clock.now = 8
+        assert await first.renew()
+        clock.now = 17
+        assert not await second.acquire()
+        clock.now = 30
+        assert await second.acquire()
+        assert not await first.renew()
+        await first.release()  # no-op: the key holds the other token
+        assert await client.get("leader") == second.token
+
+    asyncio.run(run())
+
+
+def test_elector_hands_over_leadership_on_stop():
+    client = LocalRedis()
+    events = []
+
+    def elector(name):
+        async def elected():
+            events.append(("elected", name))
+
+        async def demoted():
+            events.append(("demoted", name))
+
+        return LeaderElector(RedisLeaderLock(client, "leader", ttl=5), elected, demoted, interval=0.01)
+
+    async def run():
+        a, b = elector("a"), elector("b")
+        await a.start()
+        await b.start()
+        assert a.is_leader and not b.is_leader
+        await a.stop()
+        await asyncio.sleep(0.05)
+        assert b.is_leader
+        await b.stop()
+
+    asyncio.run(run())
+    assert events == [("elected", "a"), ("demoted", "a"), ("elected", "b"), ("demoted", "b")]
+
+
+def test_build_leader_lock_modes(tmp_path):
+    assert build_leader_lock({"leader_election": "none"}) is None
+    assert isinstance(build_leader_lock({"leader_election": "file", "leader_lock_path": str(tmp_path / "l")}), FileLeaderLock)
+    assert isinstance(build_leader_lock({"leader_election": "local"}).client, LocalRedis)
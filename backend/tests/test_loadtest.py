@@ -0,0 +1,68 @@
+import asyncio
+from contextlib import contextmanager
+
+import pytest
+
+from core.orchestrator import orchestrator
+from models import database
+from loadtest.harness import LoadTest, RouteStats, parse_mix, prepare_offline_app
+
+
+@contextmanager
+def offline_app_context():
+    # prepare_offline_app swaps the database and the data plugin process-wide
+    saved_db = {name: vars(database)[name] for name in ("engine", "SessionLocal") if name in vars(database)}
+    plugins = dict(orchestrator.plugins)
+    status, errors = dict(orchestrator.status), dict(orchestrator.errors)
+    app = asyncio.run(prepare_offline_app({"synthetic_strikes": 50}))
+    try:
+        yield app
+    finally:
+        for name in ("engine", "SessionLocal"):
+            if name in saved_db:
+                setattr(database, name, saved_db[name])
+            else:
+                vars(database).pop(name, None)
+        orchestrator.plugins = plugins
+        orchestrator.status, orchestrator.errors = status, errors
+
+
+@pytest.fixture
+def offline_app():
+    with offline_app_context() as app:
+        yield app
+
+
+def test_parse_mix():
+    assert parse_mix("quote=3, signals") == {"quote": 3, "signals": 1}
+    with pytest.raises(ValueError):
+        parse_mix("nope=1")
+
+
+def test_route_stats_percentiles():
+    stats = RouteStats(latencies=[i / 1000 for i in range(1, 101)], errors=5)
+    summary = stats.summary(elapsed=2.0)
+    assert summary["requests"] == 100
+    assert summary["throughput_rps"] == 50.0
+    assert summary["error_rate"] == 0.05
+    assert summary["p50_ms"] == pytest.approx(50.5)
+    assert summary["max_ms"] == pytest.approx(100.0)
+
+
+def test_in_process_load_test_covers_rest_and_websocket(offline_app):
+    test = LoadTest(app=offline_app, mix={"quote": 1, "health": 1}, concurrency=2, ws_clients=2,
+                    ws_interval=0.01, duration=0.3)
+    report = asyncio.run(test.run())
+
+    assert report["total_requests"] > 0
+    assert report["error_rate"] == 0.0
+    assert {"quote", "health", "ws"} <= set(report["routes"])
+    assert report["routes"]["quote"]["p99_ms"] >= report["routes"]["quote"]["p50_ms"]
+
+
+def test_offline_app_restores_database_and_plugins():
+    engine, plugins = vars(database).get("engine"), dict(orchestrator.plugins)
+    with offline_app_context():
+        assert vars(database)["engine"] is not engine
+    assert vars(database).get("engine") is engine
+    assert orchestrator.plugins == plugins
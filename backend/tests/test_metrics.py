@@ -0,0 +1,65 @@
+import asyncio
+
+from core.metrics import MetricsRegistry, PLUGIN_ERRORS, PLUGIN_LATENCY
+from plugins.data.base import DataPlugin
+from plugins.data.synthetic import DataPlugin as SyntheticDataPlugin
+
+
+def test_histogram_renders_cumulative_buckets():
+    registry = MetricsRegistry()
+    hist = registry.histogram("latency_seconds", "Latency", ("route",), buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 0.5, 2.0):
+        hist.observe(value, "/x")
+
+    text = registry.render()
+    assert "# TYPE latency_seconds histogram" in text
+    assert 'latency_seconds_bucket{route="/x",le="0.1"} 1' in text
+    assert 'latency_seconds_bucket{route="/x",le="1.0"} 3' in text
+    assert 'latency_seconds_bucket{route="/x",le="+Inf"} 4' in text
+    assert 'latency_seconds_count{route="/x"} 4' in text
+
+
+def test_counter_and_gauge_callback():
+    registry = MetricsRegistry()
+    counter = registry.counter("hits_total", "Hits", ("cache",))
+    counter.inc("quotes")
+    counter.inc("quotes", amount=2)
+    gauge = registry.gauge("ratio", "Ratio", ("cache",))
+    gauge.set_function(lambda: [(("quotes",), 0.5)])
+
+    text = registry.render()
+    assert 'hits_total{cache="quotes"} 3.0' in text
+    assert 'ratio{cache="quotes"} 0.5' in text
+
+
+def test_registry_returns_existing_metric_for_same_name():
+    registry = MetricsRegistry()
+    assert registry.counter("a_total", "A") is registry.counter("a_total", "A")
+
+
+def test_plugin_methods_are_timed_automatically():
+    plugin = SyntheticDataPlugin({"synthetic_strikes": 10})
+    before = PLUGIN_LATENCY.count("data.synthetic", "get_market_data")
+    asyncio.run(plugin.get_market_data("SPX"))
+    asyncio.run(plugin.initialize())
+
+    assert PLUGIN_LATENCY.count("data.synthetic", "get_market_data") == before + 1
+    assert PLUGIN_LATENCY.count("data.synthetic", "initialize") >= 1
+
+
+def test_plugin_errors_are_counted():
+    class FailingPlugin(SyntheticDataPlugin):
+        async def get_market_data(self, symbol):
+            raise RuntimeError("down")
+
+    plugin = FailingPlugin({})
+    label = FailingPlugin._plugin_label
+    try:
+        asyncio.run(plugin.get_market_data("SPX"))
+    except RuntimeError:
+        pass
+    assert PLUGIN_ERRORS.get(label, "get_market_data") == 1
+
+
+def test_abstract_data_plugin_stays_abstract():
+    assert "get_market_data" in DataPlugin.__abstractmethods__
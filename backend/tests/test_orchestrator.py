@@ -0,0 +1,150 @@
+import asyncio
+import time
+
+import pytest
+
+from core.orchestrator import PluginOrchestrator
+from plugins.base import PluginInterface
+
+
+class StubPlugin(PluginInterface):
+    def __init__(self, name, events, delay=0.0, fail=False, requires=(), optional=False, init_timeout=None):
+        super().__init__({})
+        self.name = name
+        self.events = events
+        self.delay = delay
+        self.fail = fail
+        self.requires = requires
+        self.optional = optional
+        self.init_timeout = init_timeout
+
+    async def _setup(self) -> None:
+        self.events.append(("start", self.name))
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise ConnectionError(f"{self.name} login refused")
+        self.events.append(("ready", self.name))
+
+    async def execute(self, *args, **kwargs):
+        return None
+
+    async def shutdown(self) -> None:
+        self.events.append(("stop", self.name))
+
+
+def make_orchestrator(**specs):
+    events = []
+    orchestrator = PluginOrchestrator()
+    orchestrator.plugins = {name: StubPlugin(name, events, **spec) for name, spec in specs.items()}
+    return orchestrator, events
+
+
+def test_independent_plugins_initialize_concurrently():
+    orchestrator, events = make_orchestrator(
+        data={"delay": 0.1}, technical={"delay": 0.1}, signals={"delay": 0.1},
+    )
+    start = time.perf_counter()
+    status = asyncio.run(orchestrator.initialize_all())
+
+    assert time.perf_counter() - start < 0.25
+    assert set(status.values()) == {"ready"}
+    assert orchestrator.readiness()["ready"]
+
+
+def test_dependencies_initialize_first_and_shut_down_last():
+    orchestrator, events = make_orchestrator(
+        executor={"requires": ("risk",)}, risk={"requires": ("data",), "delay": 0.01}, data={"delay": 0.02},
+    )
+
+    async def lifecycle():
+        await orchestrator.initialize_all()
+        await orchestrator.shutdown_all()
+
+    asyncio.run(lifecycle())
+
+    assert orchestrator.dependency_levels() == [["data"], ["risk"], ["executor"]]
+    starts = [name for kind, name in events if kind == "start"]
+    stops = [name for kind, name in events if kind == "stop"]
+    assert starts == ["data", "risk", "executor"]
+    assert stops == ["executor", "risk", "data"]
+    assert set(orchestrator.status.values()) == {"stopped"}
+    assert not orchestrator.readiness()["ready"]
+
+
+def test_optional_plugin_failure_degrades_without_blocking_readiness():
+    orchestrator, events = make_orchestrator(
+        data={}, executor={"fail": True, "optional": True}, selector={"optional": True, "delay": 5.0},
+    )
+
+    async def start():
+        begin = time.perf_counter()
+        await orchestrator.initialize_all()
+        elapsed = time.perf_counter() - begin
+        await asyncio.sleep(0)
+        report = orchestrator.readiness()
+        await orchestrator.shutdown_all()
+        return elapsed, report
+
+    elapsed, report = asyncio.run(start())
+
+    assert elapsed < 1.0
+    assert report["ready"] and report["degraded"]
+    assert report["plugins"]["executor"]["status"] == "failed"
+    assert "login refused" in report["plugins"]["executor"]["error"]
+    assert report["plugins"]["selector"]["status"] == "pending"
+
+
+def test_required_plugin_timeout_reports_not_ready_and_blocks_dependents():
+    orchestrator, events = make_orchestrator(
+        data={"delay": 5.0, "init_timeout": 0.05}, risk={"requires": ("data",)}, technical={},
+    )
+
+    status = asyncio.run(orchestrator.initialize_all())
+
+    assert status == {"data": "timeout", "risk": "blocked", "technical": "ready"}
+    report = orchestrator.readiness()
+    assert not report["ready"]
+    assert "initialization exceeded" in report["plugins"]["data"]["error"]
+
+
+def test_shutdown_covers_plugins_whose_setup_did_not_finish():
+    orchestrator, events = make_orchestrator(
+        data={"fail": True}, risk={"requires": ("data",)}, slow={"delay": 5.0, "init_timeout": 0.05}, technical={},
+    )
+
+    async def lifecycle():
+        await orchestrator.initialize_all()
+        await orchestrator.shutdown_all()
+
+    asyncio.run(lifecycle())
+
+    stopped = {name for kind, name in events if kind == "stop"}
+    # risk never started its setup, so there is nothing to release
+    assert stopped == {"data", "slow", "technical"}
+
+
+def test_risk_and_executor_do_not_wait_on_the_data_plugin():
+    from plugins.execution.simulated import ExecutorPlugin
+    from plugins.risk.portfolio_manager import RiskPlugin
+
+    events = []
+    orchestrator = PluginOrchestrator()
+    orchestrator.plugins = {
+        "data": StubPlugin("data", events, fail=True),
+        "risk": RiskPlugin({}),
+        "executor": ExecutorPlugin({}),
+    }
+
+    async def start():
+        await orchestrator.initialize_all()
+        # The executor is optional and finishes in the background
+        await asyncio.sleep(0.05)
+        return dict(orchestrator.status)
+
+    assert asyncio.run(start()) == {"data": "failed", "risk": "ready", "executor": "ready"}
+
+
+def test_dependency_cycle_is_rejected():
+    orchestrator, _ = make_orchestrator(risk={"requires": ("executor",)}, executor={"requires": ("risk",)})
+    with pytest.raises(ValueError, match="cycle"):
+        orchestrator.dependency_levels()
@@ -0,0 +1,186 @@
+import asyncio
+import time
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from core.config import settings
+from core.orders import OrderManager
+from core.rate_limit import TokenBucket
+from models.database import Base, Trade
+from plugins.execution.simulated import ExecutorPlugin
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def session_factory():
+    engine = create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    return sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+def make_manager(session_factory, limiter=None, **sim):
+    broker = ExecutorPlugin({"sim_latency_ms": 1, "sim_seed": 3, **sim})
+    messages = []
+    manager = OrderManager(
+        lambda: broker,
+        limiter=limiter or TokenBucket(rate=1000, capacity=100),
+        publish=messages.append,
+        session_factory=session_factory,
+    )
+    return manager, broker, messages
+
+
+def spread(quantity=5, limit=1.50):
+    return {
+        "symbol": "SPX",
+        "spread_type": "PUT",
+        "short_strike": 4200.0,
+        "long_strike": 4150.0,
+        "quantity": quantity,
+        "expiration": datetime.utcnow() + timedelta(days=30),
+        "limit_credit": limit,
+    }
+
+
+def test_token_bucket_allows_burst_then_refills():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2, capacity=3, clock=clock)
+    assert [bucket.try_acquire() for _ in range(4)] == [True, True, True, False]
+    clock.now = 0.5
+    assert bucket.try_acquire()
+    assert not bucket.try_acquire()
+    clock.now = 100
+    assert bucket.tokens == 3
+
+
+def test_token_bucket_acquire_waits_for_tokens():
+    bucket = TokenBucket(rate=50, capacity=1)
+
+    async def take(n):
+        for _ in range(n):
+            await bucket.acquire()
+
+    start = time.perf_counter()
+    asyncio.run(take(6))
+    assert time.perf_counter() - start >= 0.09
+
+
+def test_partial_fills_are_polled_in_batches_and_recorded_as_trades(session_factory):
+    manager, broker, messages = make_manager(
+        session_factory, sim_fill_probability=1.0, sim_partial_fill_probability=1.0,
+    )
+    ids = [asyncio.run(manager.place(spread()))["order_id"] for _ in range(3)]
+
+    async def work():
+        cycles = 0
+        while any(manager.get(i)["status"] != "FILLED" for i in ids) and cycles < 20:
+            await manager.process_once()
+            cycles += 1
+        return cycles
+
+    cycles = asyncio.run(work())
+
+    assert broker.calls["submit_order"] == 3
+    # One status request per cycle for all working orders, not one per order
+    assert broker.calls["get_order_statuses"] == cycles
+    statuses = [m["data"]["status"] for m in messages]
+    assert statuses.count("QUEUED") == 3
+    assert "PARTIALLY_FILLED" in statuses
+    with session_factory() as db:
+        trades = db.query(Trade).order_by(Trade.id).all()
+    assert [t.order_id for t in trades] == ids
+    assert all(t.quantity == 5 and 1.45 <= t.entry_credit <= 1.50 for t in trades)
+    assert trades[0].commission == pytest.approx(5 * 2 * 0.65)
+
+
+def test_submissions_respect_token_bucket(session_factory):
+    manager, broker, _ = make_manager(
+        session_factory, limiter=TokenBucket(rate=20, capacity=1), sim_fill_probability=0.0,
+    )
+    for _ in range(5):
+        asyncio.run(manager.place(spread()))
+    start = time.perf_counter()
+    asyncio.run(manager.process_once())
+
+    # 5 submits + 1 status poll with a single token of burst at 20/s
+    assert time.perf_counter() - start >= 0.2
+    assert len(manager.list("SUBMITTED")) == 5
+
+
+def test_broker_rate_limit_leaves_orders_queued(session_factory):
+    manager, broker, _ = make_manager(session_factory, sim_max_requests_per_second=2, sim_fill_probability=0.0)
+    for _ in range(4):
+        asyncio.run(manager.place(spread()))
+    asyncio.run(manager.process_once())
+
+    queued = manager.list("QUEUED")
+    assert len(queued) == 2
+    assert all("requests/s" in order["message"] for order in queued)
+
+
+def test_cancel_queued_and_working_orders(session_factory):
+    manager, broker, _ = make_manager(session_factory, sim_fill_probability=0.0)
+    first = asyncio.run(manager.place(spread()))["order_id"]
+    assert asyncio.run(manager.cancel(first))["status"] == "CANCELLED"
+
+    second = asyncio.run(manager.place(spread()))["order_id"]
+    asyncio.run(manager.process_once())
+    assert asyncio.run(manager.cancel(second))["status"] == "CANCEL_REQUESTED"
+    asyncio.run(manager.process_once())
+
+    assert manager.get(second)["status"] == "CANCELLED"
+    assert broker.calls["submit_order"] == 1
+    assert broker.calls["cancel_order"] == 1
+
+
+def test_rejected_orders_do_not_create_trades(session_factory):
+    manager, _, _ = make_manager(session_factory, sim_reject_probability=1.0)
+    order_id = asyncio.run(manager.place(spread()))["order_id"]
+    asyncio.run(manager.process_once())
+
+    assert manager.get(order_id)["status"] == "REJECTED"
+    with session_factory() as db:
+        assert db.query(Trade).count() == 0
+
+
+def test_unset_limits_are_read_from_settings_when_the_manager_runs(session_factory, monkeypatch):
+    monkeypatch.setattr(settings, "order_batch_size", 7)
+    monkeypatch.setattr(settings, "order_rate_limit", 2.5)
+    manager = OrderManager(lambda: None, session_factory=session_factory)
+    assert manager.limiter is None and manager.batch_size is None
+
+    asyncio.run(manager.process_once())
+    assert manager.batch_size == 7 and manager.limiter.rate == 2.5
+
+
+def test_database_work_runs_off_the_event_loop(session_factory):
+    import threading
+
+    from sqlalchemy import event
+
+    manager, broker, _ = make_manager(session_factory, sim_fill_probability=1.0)
+    threads = set()
+    engine = session_factory.kw["bind"]
+    event.listen(engine, "before_cursor_execute", lambda *args: threads.add(threading.get_ident()))
+
+    async def work():
+        order_id = (await manager.place(spread()))["order_id"]
+        for _ in range(3):
+            await manager.process_once()
+        return await manager.cancel(order_id)
+
+    asyncio.run(work())
+    assert threads and threading.get_ident() not in threads
+    with session_factory() as db:
+        assert db.query(Trade).count() == 1
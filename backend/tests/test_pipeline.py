@@ -0,0 +1,63 @@
+import asyncio
+
+from core.orchestrator import orchestrator
+from core.pipeline import PipelineStage, PluginPipeline
+
+
+def test_pipeline_runs_all_symbols_through_stages():
+    async def double(item):
+        await asyncio.sleep(0)
+        item["value"] = len(item["symbol"]) * 2
+        return item
+
+    async def keep_even(item):
+        return item if item["value"] % 4 == 0 else None
+
+    pipeline = PluginPipeline([
+        PipelineStage("double", double, concurrency=3, queue_size=2),
+        PipelineStage("filter", keep_even, concurrency=2, queue_size=2),
+    ])
+    results = asyncio.run(pipeline.run(["SPY", "QQQQ", "IWMM", "DIA"]))
+
+    assert sorted(r["symbol"] for r in results) == ["IWMM", "QQQQ"]
+    stats = {s["stage"]: s for s in pipeline.stats()}
+    assert stats["double"]["processed"] == 4
+    assert stats["filter"]["dropped"] == 2
+    assert stats["filter"]["queue_depth"] == 0
+
+
+def test_pipeline_stages_overlap():
+    order = []
+
+    async def slow(item):
+        await asyncio.sleep(0.01)
+        order.append(("a", item["symbol"]))
+        return item
+
+    async def fast(item):
+        order.append(("b", item["symbol"]))
+        return item
+
+    pipeline = PluginPipeline([PipelineStage("a", slow), PipelineStage("b", fast)])
+    asyncio.run(pipeline.run(["X", "Y"]))
+
+    # The second stage sees X before the first stage has finished with Y
+    assert order.index(("b", "X")) < order.index(("a", "Y"))
+
+
+def test_pipeline_records_stage_errors():
+    async def boom(item):
+        raise RuntimeError("upstream down")
+
+    pipeline = PluginPipeline([PipelineStage("data", boom)])
+    results = asyncio.run(pipeline.run(["SPX"]))
+
+    assert results == []
+    assert pipeline.errors[0]["stage"] == "data"
+    assert pipeline.stats()[0]["errors"] == 1
+
+
+def test_orchestrator_builds_trade_pipeline():
+    pipeline = orchestrator.build_pipeline(concurrency={"data": 2})
+    assert [s.name for s in pipeline.stages] == ["data", "technical", "signals", "selector", "risk", "executor"]
+    assert pipeline.stages[0].concurrency == 2
@@ -0,0 +1,59 @@
+import asyncio
+import threading
+import time
+
+from core.profiling import ProfileStore, SamplingProfiler, trace_allocations
+
+
+def busy_loop(stop: threading.Event):
+    while not stop.is_set():
+        sum(i * i for i in range(1000))
+
+
+def test_sampling_profiler_collects_collapsed_stacks():
+    stop = threading.Event()
+    worker = threading.Thread(target=busy_loop, args=(stop,), name="busy")
+    worker.start()
+    profiler = SamplingProfiler(interval=0.001, thread_ids=[worker.ident]).start()
+    time.sleep(0.1)
+    profiler.stop()
+    stop.set()
+    worker.join()
+
+    assert profiler.samples > 0
+    lines = profiler.collapsed().strip().splitlines()
+    stack, count = lines[0].rsplit(" ", 1)
+    assert stack.startswith("busy;")
+    assert "busy_loop" in stack
+    assert int(count) > 0
+
+
+def test_sample_filter_skips_samples():
+    profiler = SamplingProfiler(interval=0.001, sample_filter=lambda: False).start()
+    time.sleep(0.02)
+    profiler.stop()
+    assert profiler.samples == 0
+    assert profiler.collapsed() == "\n"
+
+
+def test_trace_allocations_reports_growth():
+    holder = []
+
+    async def allocate():
+        task = asyncio.ensure_future(trace_allocations(0.05, top=5))
+        await asyncio.sleep(0.01)
+        holder.append([bytearray(1024) for _ in range(100)])
+        return await task
+
+    report = asyncio.run(allocate())
+    assert len(report["top_growth"]) <= 5
+    assert report["top_growth"][0]["size_diff_bytes"] > 0
+    assert {"file", "line", "size_bytes", "count"} <= set(report["top_allocations"][0])
+
+
+def test_profile_store_is_bounded():
+    store = ProfileStore(limit=2)
+    for name in ("a", "b", "c"):
+        store.put(name, {"collapsed": name})
+    assert store.get("a") is None
+    assert store.get("c") == {"collapsed": "c"}
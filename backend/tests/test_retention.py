@@ -0,0 +1,142 @@
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from core.retention import SnapshotRollup, choose_resolution, query_snapshots
+from models.database import Base, MarketSnapshot, MarketSnapshot1d, MarketSnapshot1h, MarketSnapshot1m, RollupWatermark
+
+NOW = datetime(2024, 6, 3, 16, 0)
+
+
+@pytest.fixture
+def session_factory():
+    engine = create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    return sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+def snapshots(db, start, count, step=timedelta(seconds=15), symbol="SPX", price=4400.0):
+    rows = [
+        MarketSnapshot(
+            timestamp=start + i * step,
+            symbol=symbol,
+            price=price + i,
+            iv_rank=50.0 + (i % 2),
+            vix=15.0,
+            market_bias="BULLISH" if i % 2 else "NEUTRAL",
+            signal_confidence=0.5,
+        )
+        for i in range(count)
+    ]
+    db.add_all(rows)
+    db.commit()
+    return rows
+
+
+def test_rollup_aggregates_each_resolution(session_factory):
+    rollup = SnapshotRollup(session_factory=session_factory)
+    with session_factory() as db:
+        snapshots(db, datetime(2024, 6, 3, 14, 0), 8)  # two minutes of 15s snapshots
+        rollup.rollup_batch(db)
+
+        minutes = db.query(MarketSnapshot1m).order_by(MarketSnapshot1m.bucket).all()
+        assert [m.bucket for m in minutes] == [datetime(2024, 6, 3, 14, 0), datetime(2024, 6, 3, 14, 1)]
+        first = minutes[0]
+        assert (first.open, first.high, first.low, first.close) == (4400.0, 4403.0, 4400.0, 4403.0)
+        assert first.samples == 4 and first.iv_rank == pytest.approx(50.5)
+        assert first.market_bias == "BULLISH"
+        hour = db.query(MarketSnapshot1h).one()
+        assert (hour.open, hour.close, hour.samples) == (4400.0, 4407.0, 8)
+        assert db.query(MarketSnapshot1d).one().bucket == datetime(2024, 6, 3)
+
+
+def test_rollup_is_incremental_and_merges_into_existing_buckets(session_factory):
+    rollup = SnapshotRollup(batch_size=3, session_factory=session_factory)
+    with session_factory() as db:
+        snapshots(db, datetime(2024, 6, 3, 14, 0), 4)
+        assert rollup.rollup_batch(db) == 3
+        assert db.get(RollupWatermark, "market_snapshots").last_id == 3
+        assert rollup.rollup_batch(db) == 1
+        assert rollup.rollup_batch(db) == 0
+
+        # A later batch landing in the same minute extends the existing bucket
+        snapshots(db, datetime(2024, 6, 3, 14, 0, 1), 1, price=4500.0)
+        rollup.rollup_batch(db)
+        minute = db.query(MarketSnapshot1m).one()
+        assert minute.samples == 5
+        assert (minute.open, minute.high, minute.close) == (4400.0, 4500.0, 4403.0)
+
+
+def test_merged_means_weight_only_rows_that_set_the_field(session_factory):
+    rollup = SnapshotRollup(session_factory=session_factory)
+    with session_factory() as db:
+        start = datetime(2024, 6, 3, 14, 0)
+        db.add_all([
+            MarketSnapshot(timestamp=start, symbol="SPX", price=4400.0, vix=10.0),
+            MarketSnapshot(timestamp=start + timedelta(seconds=15), symbol="SPX", price=4401.0),
+        ])
+        db.commit()
+        rollup.rollup_batch(db)
+        db.add(MarketSnapshot(timestamp=start + timedelta(seconds=30), symbol="SPX", price=4402.0, vix=20.0))
+        db.commit()
+        rollup.rollup_batch(db)
+
+        minute = db.query(MarketSnapshot1m).one()
+        assert minute.samples == 3
+        assert minute.vix == pytest.approx(15.0) and minute.vix_samples == 2
+
+
+def test_rollup_leaves_rows_inside_the_lag_for_a_later_run(session_factory):
+    rollup = SnapshotRollup(lag=60, session_factory=session_factory)
+    with session_factory() as db:
+        snapshots(db, NOW - timedelta(minutes=5), 2)
+        snapshots(db, NOW - timedelta(seconds=10), 1)
+        # Committed after the fresh row but stamped earlier, like a slow transaction
+        snapshots(db, NOW - timedelta(minutes=4), 1)
+
+        assert rollup.rollup_batch(db, now=NOW) == 2
+        assert db.get(RollupWatermark, "market_snapshots").last_id == 2
+        assert rollup.rollup_batch(db, now=NOW + timedelta(minutes=1)) == 2
+        assert db.query(MarketSnapshot1m).count() == 3
+
+
+def test_retention_keeps_unrolled_raw_rows(session_factory, monkeypatch):
+    from core.config import settings
+    monkeypatch.setattr(settings, "snapshot_retention_days", {"raw": 1, "1m": 7, "1h": None, "1d": None})
+    rollup = SnapshotRollup(session_factory=session_factory)
+    with session_factory() as db:
+        snapshots(db, NOW - timedelta(days=10), 2)
+        rollup.rollup_batch(db)
+        snapshots(db, NOW - timedelta(days=3), 2)  # old but not yet rolled up
+        snapshots(db, NOW - timedelta(hours=1), 2)
+
+        deleted = rollup.apply_retention(db, now=NOW)
+        assert deleted == {"raw": 2, "1m": 1}
+        assert db.query(MarketSnapshot).count() == 4
+        assert db.query(MarketSnapshot1h).count() == 1
+
+        rollup.rollup_batch(db)
+        assert rollup.apply_retention(db, now=NOW)["raw"] == 2
+
+
+def test_queries_route_to_coarser_tables_for_longer_ranges(session_factory, monkeypatch):
+    from core.config import settings
+    monkeypatch.setattr(settings, "snapshot_retention_days", {"raw": 2, "1m": 30, "1h": 730, "1d": None})
+    with session_factory() as db:
+        snapshots(db, NOW - timedelta(hours=2), 480)
+        SnapshotRollup(session_factory=session_factory).rollup_batch(db)
+
+        assert choose_resolution(db, "SPX", NOW - timedelta(hours=1), NOW, 1000, now=NOW) == "raw"
+        assert choose_resolution(db, "SPX", NOW - timedelta(hours=2), NOW, 200, now=NOW) == "1m"
+        assert choose_resolution(db, "SPX", NOW - timedelta(days=20), NOW, 1000, now=NOW) == "1h"
+        # Older than the 1m and 1h retention windows
+        assert choose_resolution(db, "SPX", NOW - timedelta(days=900), NOW, 100_000, now=NOW) == "1d"
+
+        resolution, points = query_snapshots(db, "SPX", NOW - timedelta(hours=3), NOW, resolution="1h")
+        assert resolution == "1h" and len(points) == 2
+        assert points[0]["samples"] + points[1]["samples"] == 480
+        with pytest.raises(ValueError):
+            query_snapshots(db, "SPX", NOW, NOW, resolution="5m")
@@ -0,0 +1,137 @@
+import asyncio
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from core.scanner import OpportunityScanner, TopK, target_expiration
+from plugins.data.base import MarketData, OptionChain
+from plugins.trading.spread_selector import find_credit_spreads
+
+
+def make_puts(price: float) -> pd.DataFrame:
+    strikes = np.arange(price * 0.8, price, 5.0)
+    distance = (price - strikes) / price
+    mid = 40 * np.exp(-12 * distance)
+    return pd.DataFrame({
+        "strike": strikes,
+        "bid": mid - 0.05,
+        "ask": mid + 0.05,
+        "delta": -0.5 * np.exp(-10 * distance),
+    })
+
+
+class FakeData:
+    async def get_market_data(self, symbol):
+        return MarketData(symbol, 100.0 * len(symbol), 1000, datetime.utcnow(), 1.0, 15.0)
+
+    async def get_historical_data(self, symbol, period):
+        return pd.DataFrame()
+
+    async def get_option_chain(self, symbol, expiration):
+        if symbol == "BAD":
+            raise RuntimeError("no chain")
+        price = 100.0 * len(symbol)
+        return OptionChain(symbol, price, datetime.utcnow(), pd.DataFrame(), make_puts(price))
+
+
+class FakeSignals:
+    async def execute(self, market_data=None):
+        return {"bias": "BULLISH", "confidence": 0.7}
+
+
+def test_find_credit_spreads_respects_width_and_credit():
+    spreads = find_credit_spreads(make_puts(400.0), 400.0, "PUT", max_width=10, credit_threshold=0.5)
+    assert spreads
+    for s in spreads:
+        assert s["short_strike"] > s["long_strike"]
+        assert s["width"] <= 10
+        assert s["credit"] >= 0.5
+        assert s["short_strike"] < 400.0
+
+
+def test_top_k_keeps_best_scores():
+    ranking = TopK(3)
+    for score in [0.1, 0.5, 0.3, 0.9, 0.2]:
+        ranking.push({"score": score})
+    assert [c["score"] for c in ranking.items()] == [0.9, 0.5, 0.3]
+
+
+def test_target_expiration_is_friday():
+    exp = target_expiration({"dte_min": 30, "dte_max": 45}, datetime(2025, 1, 6))
+    assert exp.weekday() == 4
+    assert 34 <= (exp - datetime(2025, 1, 6)).days <= 41
+
+
+def test_scanner_streams_progress_and_ranks_globally():
+    config = {"scan_top_k": 5, "scan_fetch_concurrency": 2, "max_spread_width": 20, "credit_threshold": 0.5}
+    scanner = OpportunityScanner({"data": FakeData(), "signals": FakeSignals()}, config)
+
+    async def collect():
+        return [event async for event in scanner.scan(["SPX", "QQQQ", "BAD"])]
+
+    events = asyncio.run(collect())
+    progress = [e for e in events if e["type"] == "progress"]
+    final = events[-1]
+
+    assert len(progress) == 3
+    assert final["type"] == "complete"
+    assert final["errors"] == [{"symbol": "BAD", "error": "no chain"}]
+    scores = [o["score"] for o in final["opportunities"]]
+    assert len(scores) == 5
+    assert scores == sorted(scores, reverse=True)
+    assert {o["symbol"] for o in final["opportunities"]} <= {"SPX", "QQQQ"}
+
+
+def test_top_k_rejects_non_positive_k():
+    with pytest.raises(ValueError):
+        TopK(0)
+
+
+def test_closing_a_scan_early_waits_for_its_tasks():
+    scanner = OpportunityScanner({"data": FakeData(), "signals": FakeSignals()}, {"scan_fetch_concurrency": 1})
+
+    async def first_event():
+        events = scanner.scan(["SPX", "QQQQ", "IWM", "DIA"])
+        event = await events.__anext__()
+        await events.aclose()
+        pending = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+        return event, pending
+
+    event, pending = asyncio.run(first_event())
+    assert event["type"] == "progress" and pending == []
+
+
+def test_yfinance_fetches_overlap_instead_of_blocking_the_loop(monkeypatch):
+    import time
+
+    from plugins.data import yfinance as yf_plugin
+
+    def slow_download(symbol, period, progress):
+        time.sleep(0.1)
+        return pd.DataFrame({"Close": [1.0]})
+
+    monkeypatch.setattr(yf_plugin.yf, "download", slow_download)
+    plugin = yf_plugin.DataPlugin({})
+
+    async def scenario():
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        beat = asyncio.create_task(ticker())
+        start = time.perf_counter()
+        await asyncio.gather(*(plugin.get_historical_data(s, "1mo") for s in ("SPY", "QQQ", "IWM", "DIA")))
+        elapsed = time.perf_counter() - start
+        beat.cancel()
+        return elapsed, ticks
+
+    elapsed, ticks = asyncio.run(scenario())
+    assert elapsed < 0.3
+    # The loop kept serving other work while the downloads ran
+    assert ticks >= 3
@@ -1,4 +1,11 @@
+import asyncio
+import uuid
+
 import pytest
+from apscheduler.events import EVENT_JOB_MAX_INSTANCES, JobSubmissionEvent
+
+from core.config import settings
+from core.metrics import JOB_SKIPPED, job_runs, timed_job
 from core.scheduler import scheduler, init_scheduler
 
 
@@ -7,3 +14,91 @@ def test_init_scheduler_adds_job():
     init_scheduler()
     jobs = scheduler.get_jobs()
     assert any(job.id == "market_open" for job in jobs)
+
+
+def test_jobs_never_overlap_and_skip_late_runs():
+    scheduler.remove_all_jobs()
+    init_scheduler()
+    jobs = {job.id: job for job in scheduler.get_jobs()}
+    assert {"pre_open_warmup", "warm_chains", "warm_history", "poll_quotes"} <= set(jobs)
+    for job in jobs.values():
+        assert job.max_instances == 1 and job.coalesce and job.misfire_grace_time
+    assert jobs["warm_chains"].trigger.jitter == settings.job_jitter_seconds
+
+
+def test_intraday_jobs_run_only_during_the_session(monkeypatch):
+    from datetime import datetime, timedelta
+
+    import pytz
+
+    from core.scheduler import _intraday
+
+    monkeypatch.setattr(settings, "job_jitter_seconds", 0)
+    eastern = pytz.timezone("US/Eastern")
+
+    def fires(minutes):
+        trigger, fire, times = _intraday(minutes), None, []
+        now = eastern.localize(datetime(2024, 1, 2))  # a Tuesday
+        while True:
+            fire = trigger.get_next_fire_time(fire, now)
+            if fire.date() != now.date():
+                return times
+            times.append(fire.strftime("%H:%M"))
+            now = fire + timedelta(seconds=1)
+
+    assert fires(45) == ["09:30", "10:15", "11:00", "11:45", "12:30", "13:15", "14:00", "14:45", "15:30"]
+    session = fires(15)
+    assert session[0] == "09:30" and session[-1] == "16:00" and len(session) == 27
+
+
+def test_job_runs_and_skips_are_recorded():
+    async def failing():
+        raise RuntimeError("boom")
+
+    asyncio.run(timed_job("noop_job", asyncio.sleep)(0))
+    with pytest.raises(RuntimeError):
+        asyncio.run(timed_job("noop_job", failing)())
+    run = job_runs["noop_job"]
+    assert run["runs"] == 2 and run["errors"] == 1 and "boom" in run["last_error"]
+    assert run["last_duration"] >= 0
+
+    before = JOB_SKIPPED.get("noop_job", "overlap")
+    scheduler._dispatch_event(JobSubmissionEvent(EVENT_JOB_MAX_INSTANCES, "noop_job", None, []))
+    assert JOB_SKIPPED.get("noop_job", "overlap") == before + 1
+
+
+def test_followers_build_bars_from_the_leaders_shared_quotes(monkeypatch):
+    from datetime import datetime, timedelta
+
+    from core import shared_cache
+    from core.bars import get_bar_aggregator
+    from core.shared_cache import SharedMarketCache, segment_name
+    from core.signals import follow_quotes
+    from plugins.data.base import MarketData
+
+    name = f"opc_follow_{uuid.uuid4().hex[:8]}"
+    leader_cache = SharedMarketCache.open(segment_name(name, 4, 1, 8), quote_slots=4, chain_slots=1, chain_rows=8)
+    monkeypatch.setattr(settings, "shared_cache_name", name)
+    for field, value in (("shared_quote_slots", 4), ("shared_chain_slots", 1), ("shared_chain_rows", 8)):
+        monkeypatch.setattr(settings, field, value)
+    monkeypatch.setattr(settings, "signal_symbols", ["FOLLOW"])
+    monkeypatch.setattr(shared_cache, "_shared_cache", None)
+    try:
+        start = datetime(2024, 1, 2, 15, 30)
+        for minute in range(3):
+            leader_cache.publish_quote(MarketData("FOLLOW", 100.0 + minute, 1000 * minute, start + timedelta(minutes=minute), 1.0, 15.0))
+            asyncio.run(follow_quotes())
+        bars = get_bar_aggregator().as_frame("FOLLOW", "1m")
+        assert bars["close"].tolist() == [100.0, 101.0]
+    finally:
+        shared_cache.close_shared_cache()
+        leader_cache.close(unlink=True)
+
+
+def test_follower_jobs_are_kept_apart_from_the_leader_jobs():
+    from core.scheduler import follower_scheduler, init_follower_jobs
+
+    follower_scheduler.remove_all_jobs()
+    init_follower_jobs()
+    assert {job.id for job in follower_scheduler.get_jobs()} == {"follow_quotes", "follow_signals"}
+    assert all(job.max_instances == 1 for job in follower_scheduler.get_jobs())
@@ -0,0 +1,111 @@
+import asyncio
+import subprocess
+import sys
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+
+from core.shared_cache import SharedMarketCache
+from core.startup import BACKEND_DIR
+from plugins.data.base import MarketData
+from plugins.data.synthetic import DataPlugin
+
+
+@pytest.fixture
+def cache_name():
+    name = f"opc_test_{uuid.uuid4().hex[:8]}"
+    yield name
+    cache = SharedMarketCache.open(name, quote_slots=4, chain_slots=2, chain_rows=64)
+    cache.close(unlink=True)
+
+
+def quote(symbol, price):
+    return MarketData(symbol=symbol, price=price, volume=1000, timestamp=datetime(2024, 1, 2, 15, 30), atr=40.0, vix=15.0)
+
+
+def test_quotes_are_visible_to_other_processes(cache_name):
+    writer = SharedMarketCache.open(cache_name, quote_slots=4, chain_slots=2, chain_rows=64)
+    writer.publish_quote(quote("SPX", 4800.5))
+    writer.publish_quote(quote("SPX", 4801.25))
+
+    code = (
+        "from core.shared_cache import SharedMarketCache\n"
+        f"cache = SharedMarketCache.open({cache_name!r}, quote_slots=4, chain_slots=2, chain_rows=64)\n"
+        "print(cache.quote('SPX')['price'], cache.quote('QQQ'))\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], cwd=BACKEND_DIR, capture_output=True, text=True, check=True)
+    assert result.stdout.split() == ["4801.25", "None"]
+
+    reader = SharedMarketCache.open(cache_name, quote_slots=4, chain_slots=2, chain_rows=64)
+    got = reader.quote("SPX")
+    assert got["volume"] == 1000
+    assert got["timestamp"] == datetime(2024, 1, 2, 15, 30, tzinfo=timezone.utc).timestamp()
+    assert got["price"] == 4801.25
+    writer.close()
+    reader.close()
+
+
+def test_full_quote_directory_skips_new_symbols(cache_name):
+    cache = SharedMarketCache.open(cache_name, quote_slots=4, chain_slots=2, chain_rows=64)
+    for i, symbol in enumerate(["A", "B", "C", "D", "E"]):
+        cache.publish_quote(quote(symbol, 10.0 + i))
+    assert cache.quote("D")["price"] == 13.0
+    assert cache.quote("E") is None
+    cache.close()
+
+
+def test_chain_views_are_double_buffered(cache_name):
+    plugin = DataPlugin({"synthetic_strikes": 200})
+    expiration = datetime.utcnow() + timedelta(days=30)
+    chain = asyncio.run(plugin.get_option_chain("SPX", expiration))
+    writer = SharedMarketCache.open(cache_name, quote_slots=4, chain_slots=2, chain_rows=64)
+    reader = SharedMarketCache.open(cache_name, quote_slots=4, chain_slots=2, chain_rows=64)
+
+    writer.publish_chain(chain, expiration)
+    shared = reader.chain("SPX")
+    assert shared.generation == 1
+    assert shared.puts.shape == (11, 64)
+    assert np.shares_memory(shared.puts, reader._chains)
+    strikes = shared.puts[0]
+    assert np.all(np.diff(strikes) > 0)
+    # Truncated to the strikes nearest the money
+    assert strikes.min() <= chain.underlying_price <= strikes.max()
+    assert shared.records("calls")[0].keys() >= {"strike", "bid", "ask", "delta"}
+
+    writer.publish_chain(chain, expiration)
+    assert shared.is_current()
+    writer.publish_chain(chain, expiration)
+    assert not shared.is_current()
+    assert reader.chain("SPX").generation == 3
+    writer.close()
+    reader.close()
+
+
+def test_layout_mismatch_is_rejected(cache_name):
+    SharedMarketCache.open(cache_name, quote_slots=4, chain_slots=2, chain_rows=64).close()
+    with pytest.raises(ValueError):
+        SharedMarketCache.open(cache_name, quote_slots=4, chain_slots=2, chain_rows=32)
+
+
+def test_a_new_layout_opens_its_own_segment(monkeypatch):
+    from core import shared_cache
+    from core.config import settings
+
+    name = f"opc_layout_{uuid.uuid4().hex[:8]}"
+    monkeypatch.setattr(settings, "shared_cache_name", name)
+    monkeypatch.setattr(shared_cache, "_shared_cache", None)
+    opened = []
+    for rows in (64, 32):
+        for field, value in (("shared_quote_slots", 4), ("shared_chain_slots", 2), ("shared_chain_rows", rows)):
+            monkeypatch.setattr(settings, field, value)
+        # The previous deploy's segment is still there; its layout no longer matters
+        cache = shared_cache.get_shared_cache()
+        opened.append(cache.shm.name)
+        assert cache.chain_rows == rows
+        shared_cache.close_shared_cache()
+    assert shared_cache._shared_cache is None
+    assert len(set(opened)) == 2
+    for rows in (64, 32):
+        SharedMarketCache.open(shared_cache.segment_name(name, 4, 2, rows), 4, 2, rows).close(unlink=True)
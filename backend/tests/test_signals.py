@@ -0,0 +1,44 @@
+import numpy as np
+import pandas as pd
+
+from core.snapshots import SnapshotStore
+from plugins.analysis.composite_signals import compute_composite_signal, compute_iv_percentile
+
+CONFIG = {"rsi_period": 14, "ema_fast": 9, "ema_slow": 21, "high_vol_threshold": 0.75}
+
+
+def trending(step: float) -> pd.DataFrame:
+    rng = np.random.default_rng(7)
+    close = 100 + np.cumsum(step + rng.normal(0, 0.2, 120))
+    return pd.DataFrame({"close": close})
+
+
+def test_composite_signal_follows_trend():
+    up = compute_composite_signal(trending(0.5), CONFIG)
+    down = compute_composite_signal(trending(-0.5), CONFIG)
+    assert up["bias"] == "BULLISH"
+    assert up["recommendation"]["action"] == "PUT_CREDIT_SPREAD"
+    assert down["bias"] == "BEARISH"
+    assert set(up["details"]) == {"rsi", "ema_cross", "macd", "iv_percentile"}
+
+
+def test_composite_signal_needs_history():
+    result = compute_composite_signal(pd.DataFrame({"close": [1.0, 2.0]}), CONFIG)
+    assert result["bias"] == "NEUTRAL"
+    assert result["confidence"] == 0.0
+
+
+def test_iv_percentile_uses_iv_column():
+    df = pd.DataFrame({"close": range(10), "iv": [0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 0.5]})
+    assert compute_iv_percentile(df) == 60.0
+
+
+def test_snapshot_store_versions_only_on_change():
+    store = SnapshotStore()
+    first = store.publish("SPX", {"bias": "BULLISH"})
+    same = store.publish("SPX", {"bias": "BULLISH"})
+    changed = store.publish("SPX", {"bias": "BEARISH"})
+    assert same is first
+    assert changed.version == 2
+    assert changed.etag != first.etag
+    assert store.get("SPX") is changed
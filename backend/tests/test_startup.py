@@ -0,0 +1,50 @@
+import subprocess
+import sys
+
+from core.metrics import STARTUP_PHASE
+from core.startup import BACKEND_DIR, StartupTimer, parse_importtime
+
+SAMPLE = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |     _json
+import time:       900 |       1020 |   json
+import time:      4000 |      25000 | api.main
+"""
+
+
+def test_parse_importtime_orders_modules_by_cumulative_time():
+    modules = parse_importtime(SAMPLE)
+    assert [m["module"] for m in modules] == ["api.main", "json", "_json"]
+    assert modules[0] == {"module": "api.main", "self_ms": 4.0, "cumulative_ms": 25.0, "depth": 0}
+    assert modules[2]["depth"] == 2
+
+
+def test_startup_timer_records_phases_and_gauge():
+    timer = StartupTimer()
+    with timer.phase("plugins_test"):
+        pass
+    timer.record("init_db_test", 0.25)
+
+    report = timer.report()
+    assert list(report["phases"]) == ["plugins_test", "init_db_test"]
+    assert report["total_seconds"] >= 0.25
+    assert STARTUP_PHASE.get("init_db_test") == 0.25
+    assert "init_db_test 250ms" in timer.summary()
+
+
+def test_importing_app_defers_plugins_and_database_driver():
+    code = (
+        "import sys, api.main\n"
+        "from models import database\n"
+        "heavy = ['pandas', 'yfinance', 'scipy', 'psycopg2', 'plugins.data.yfinance']\n"
+        "print(','.join(m for m in heavy if m in sys.modules))\n"
+        "print('engine' in vars(database))\n"
+        "from core.config import get_settings\n"
+        "print(get_settings.cache_info().currsize)\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], cwd=BACKEND_DIR, capture_output=True, text=True, check=True)
+    loaded, engine_built, settings_loaded = result.stdout.splitlines()
+    assert loaded == ""
+    assert engine_built == "False"
+    # Nothing reads config.yaml at import; lifespan startup is the first to
+    assert settings_loaded == "0"
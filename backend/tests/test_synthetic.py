@@ -0,0 +1,56 @@
+import asyncio
+import importlib
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from plugins.analysis.greeks import bs_price, implied_volatility
+from plugins.data.synthetic import DataPlugin, period_to_days
+
+
+def test_history_is_deterministic_per_seed():
+    a = asyncio.run(DataPlugin({"synthetic_seed": 1}).get_historical_data("SPX", "1y"))
+    b = asyncio.run(DataPlugin({"synthetic_seed": 1}).get_historical_data("SPX", "1y"))
+    c = asyncio.run(DataPlugin({"synthetic_seed": 2}).get_historical_data("SPX", "1y"))
+    assert len(a) == 252
+    assert np.array_equal(a["close"].to_numpy(), b["close"].to_numpy())
+    assert not np.array_equal(a["close"].to_numpy(), c["close"].to_numpy())
+    assert (a["high"] >= a[["open", "close"]].max(axis=1)).all()
+
+
+def test_option_chain_has_smile_and_greeks():
+    plugin = DataPlugin({"synthetic_strikes": 500})
+    expiration = datetime.utcnow() + timedelta(days=30)
+    chain = asyncio.run(plugin.get_option_chain("SPX", expiration))
+
+    assert len(chain.puts) == len(chain.calls) == 500
+    assert (chain.puts["ask"] >= chain.puts["bid"]).all()
+    assert {"impliedVolatility", "delta", "gamma", "theta", "vega"} <= set(chain.puts.columns)
+    # Downside skew: low strikes trade at a higher IV than at-the-money
+    assert chain.puts["impliedVolatility"].iloc[0] > chain.puts["impliedVolatility"].iloc[250]
+
+
+def test_multi_expiration_chains():
+    plugin = DataPlugin({"synthetic_strikes": 50, "synthetic_expirations": 4})
+    chains = asyncio.run(plugin.get_option_chains("QQQ"))
+    assert len(chains) == 4
+    assert all(exp.weekday() == 4 for exp in chains)
+
+
+def test_implied_volatility_round_trip():
+    strikes = np.linspace(80, 120, 41)
+    vols = 0.15 + 0.002 * np.abs(strikes - 100)
+    prices = bs_price(100.0, strikes, 0.25, vols, 0.03, strikes >= 100)
+    recovered = implied_volatility(prices, 100.0, strikes, 0.25, 0.03, strikes >= 100)
+    assert np.allclose(recovered, vols, atol=1e-4)
+
+
+def test_period_parsing():
+    assert period_to_days("5d") == 5
+    assert period_to_days("3mo") == 63
+    assert period_to_days("max", default=10) == 10
+
+
+def test_plugin_is_loadable_by_name():
+    module = importlib.import_module("plugins.data.synthetic")
+    assert getattr(module, "DataPlugin") is DataPlugin
@@ -0,0 +1,154 @@
+import asyncio
+from collections import Counter
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+
+from api.main import app
+from core.config import settings
+from core.market_cache import MarketCache, get_market_cache
+from core.orchestrator import orchestrator
+from core.signals import signal_snapshots
+from core.warmup import pre_open_warmup, window_expirations
+from plugins.analysis.composite_signals import SignalsPlugin
+from plugins.data.synthetic import DataPlugin
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_entries_expire_after_their_kind_ttl():
+    clock = FakeClock()
+    cache = MarketCache(quote_ttl=5, chain_ttl=60, clock=clock)
+    cache.put(("quote", "SPX"), 1)
+    cache.put(("chain", "SPX", None), 2)
+    clock.now = 10
+    assert cache.get(("quote", "SPX")) is None
+    assert cache.get(("chain", "SPX", None)) == 2
+
+
+def test_concurrent_misses_share_one_upstream_call():
+    cache = MarketCache()
+    calls = Counter()
+
+    async def fetch():
+        calls["fetch"] += 1
+        await asyncio.sleep(0.01)
+        return calls["fetch"]
+
+    async def scenario():
+        first = await asyncio.gather(*(cache.get_or_fetch(("quote", "SPX"), fetch) for _ in range(20)))
+        forced = await cache.get_or_fetch(("quote", "SPX"), fetch, force=True)
+        return first, forced
+
+    first, forced = asyncio.run(scenario())
+    assert first == [1] * 20 and forced == 2
+    assert cache.get(("quote", "SPX")) == 2
+
+
+def test_failed_fetches_propagate_and_are_not_cached():
+    cache = MarketCache()
+
+    async def fail():
+        await asyncio.sleep(0)
+        raise RuntimeError("upstream down")
+
+    async def scenario():
+        return await asyncio.gather(*(cache.get_or_fetch(("quote", "SPX"), fail) for _ in range(3)), return_exceptions=True)
+
+    assert all(isinstance(r, RuntimeError) for r in asyncio.run(scenario()))
+    assert len(cache) == 0
+
+
+def test_cancelling_the_fetching_task_hands_the_fetch_to_a_waiter():
+    cache = MarketCache()
+    calls = Counter()
+
+    async def fetch():
+        calls["fetch"] += 1
+        await asyncio.sleep(0.01)
+        return calls["fetch"]
+
+    async def scenario():
+        owner = asyncio.create_task(cache.get_or_fetch(("quote", "SPX"), fetch))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(cache.get_or_fetch(("quote", "SPX"), fetch))
+        await asyncio.sleep(0)
+        owner.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await owner
+        return await waiter
+
+    assert asyncio.run(scenario()) == 2
+    assert cache.get(("quote", "SPX")) == 2
+
+
+def test_cancelling_a_waiter_leaves_the_fetch_running():
+    cache = MarketCache()
+
+    async def fetch():
+        await asyncio.sleep(0.01)
+        return "quote"
+
+    async def scenario():
+        owner = asyncio.create_task(cache.get_or_fetch(("quote", "SPX"), fetch))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(cache.get_or_fetch(("quote", "SPX"), fetch))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        return await owner
+
+    assert asyncio.run(scenario()) == "quote"
+
+
+def test_window_expirations_follow_the_dte_settings(monkeypatch):
+    monkeypatch.setattr(settings, "dte_min", 30)
+    monkeypatch.setattr(settings, "dte_max", 45)
+    today = datetime(2024, 1, 2)
+    fridays = [datetime(2024, 1, 5) + timedelta(weeks=i) for i in range(8)]
+    assert window_expirations(fridays, today) == [datetime(2024, 2, 2), datetime(2024, 2, 9), datetime(2024, 2, 16)]
+
+
+@pytest.fixture
+def warm_plugins(monkeypatch):
+    data = DataPlugin({"synthetic_seed": 3, "synthetic_strikes": 50, "synthetic_expirations": 8})
+    calls = Counter()
+    for name in ("get_market_data", "get_option_chain", "get_historical_data"):
+        method = getattr(data, name)
+
+        async def counted(*args, _method=method, _name=name):
+            calls[_name] += 1
+            return await _method(*args)
+
+        monkeypatch.setattr(data, name, counted)
+    monkeypatch.setitem(orchestrator.plugins, "data", data)
+    monkeypatch.setitem(orchestrator.plugins, "signals", SignalsPlugin({"rsi_period": 14, "ema_fast": 9, "ema_slow": 21}))
+    monkeypatch.setattr(settings, "signal_symbols", ["QQQ"])
+    get_market_cache().clear()
+    yield calls
+    get_market_cache().clear()
+
+
+def test_pre_open_warmup_leaves_first_requests_hitting_the_cache(warm_plugins):
+    expirations = window_expirations(asyncio.run(orchestrator.plugins["data"].get_expirations("QQQ")))
+    asyncio.run(pre_open_warmup())
+
+    assert expirations and warm_plugins["get_option_chain"] == len(expirations)
+    assert warm_plugins["get_historical_data"] == 1
+    assert signal_snapshots.get("QQQ", record=False) is not None
+    warmed = dict(warm_plugins)
+
+    client = TestClient(app)
+    expiration = expirations[0]
+    assert client.get("/api/market/quote/QQQ").status_code == 200
+    chain = client.get("/api/market/option-chain/QQQ", params={"expiration": expiration.date().isoformat()})
+    assert chain.status_code == 200 and chain.json()["puts"]
+    assert dict(warm_plugins) == warmed